@@ -0,0 +1,261 @@
+"""
+DanZ Client Tool - Asset Pack
+Per-patch archive of small game images (champion squares, profile icons),
+read through mmap so the pickers can paint without per-icon downloads.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from snapshot import CACHE_DIR, _safe_version
+
+PACK_PREFIX = "assets-"
+PACK_SUFFIX = ".pack"
+
+# File layout: header | JSON index | image blobs
+#   header = magic, format version, index length in bytes
+#   index  = {"base_url": str, "entries": {path: [offset, length]}}
+# Offsets are relative to the first byte after the index.
+PACK_MAGIC = b"DZPK"
+PACK_FORMAT = 1
+_HEADER = struct.Struct("<4sII")
+
+# Profile icons packed by default (lowest ids first, as the picker lists them)
+PROFILE_ICON_LIMIT = 1000
+
+# Parallel downloads while building a pack
+BUILD_WORKERS = 8
+
+# Share of assets allowed to fail before a build is abandoned. A pack with
+# more gaps than this is not written, so the next build tries again.
+MAX_MISSING_FRACTION = 0.1
+
+
+def pack_path(patch: str, directory: Optional[Path] = None) -> Path:
+    """Location of the asset pack for a patch."""
+    directory = directory or CACHE_DIR
+    return directory / f"{PACK_PREFIX}{_safe_version(patch)}{PACK_SUFFIX}"
+
+
+def icon_pack_paths(champion_ids: Iterable[int], icon_ids: Iterable[int],
+                    icon_limit: Optional[int] = PROFILE_ICON_LIMIT) -> List[str]:
+    """Asset paths (relative to the CDN base) for every champion square and
+    the first icon_limit profile icons (all of them if icon_limit is None)."""
+    paths = [f"champion-icons/{champ_id}.png" for champ_id in champion_ids if champ_id != -1]
+    icons = sorted(icon_ids)
+    if icon_limit is not None:
+        icons = icons[:icon_limit]
+    paths.extend(f"profile-icons/{icon_id}.jpg" for icon_id in icons)
+    return paths
+
+
+class AssetPack:
+    """Read-only view of an asset pack file.
+    
+    The file is memory-mapped; only the index is parsed up front and image
+    bytes are paged in as they are read.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_length = _HEADER.unpack_from(self._map, 0)
+            if magic != PACK_MAGIC or version != PACK_FORMAT:
+                raise ValueError(f"not a version {PACK_FORMAT} asset pack")
+            index = json.loads(self._map[_HEADER.size:_HEADER.size + index_length])
+        except Exception:
+            self._file.close()
+            raise
+        self.base_url: str = index["base_url"]
+        self.entries: Dict[str, Tuple[int, int]] = {
+            path: (offset, length) for path, (offset, length) in index["entries"].items()
+        }
+        self._data_start = _HEADER.size + index_length
+    
+    @classmethod
+    def open(cls, path: Path) -> Optional["AssetPack"]:
+        """Open a pack, or None if it is missing or unreadable."""
+        if not path.exists():
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            print(f"[AssetPack] Ignoring unreadable {path.name}: {e}")
+            return None
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def __contains__(self, path: str) -> bool:
+        return path in self.entries
+    
+    def get(self, path: str) -> Optional[bytes]:
+        """Encoded image bytes for an asset path."""
+        entry = self.entries.get(path)
+        if entry is None:
+            return None
+        offset, length = entry
+        start = self._data_start + offset
+        return self._map[start:start + length]
+    
+    def lookup(self, url: str) -> Optional[bytes]:
+        """Encoded image bytes for a full asset URL under the pack's base URL."""
+        prefix = self.base_url + "/"
+        if not url.startswith(prefix):
+            return None
+        return self.get(url[len(prefix):])
+    
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+def build_asset_pack(path: Path, base_url: str, asset_paths: List[str],
+                     workers: int = BUILD_WORKERS, timeout: float = 10) -> int:
+    """Download assets under base_url and write them to a pack at path.
+    
+    Assets that fail to download are left out. If nothing downloads, or
+    more than MAX_MISSING_FRACTION of the assets fail, no pack is written
+    and 0 is returned. The pack is written to a temporary file and moved
+    into place, so readers never see a partial file. Returns the number of
+    assets packed.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    def fetch(asset_path: str) -> Optional[bytes]:
+        try:
+            response = session.get(f"{base_url}/{asset_path}", timeout=timeout)
+            response.raise_for_status()
+            return response.content
+        except requests.RequestException:
+            return None
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        blobs = list(pool.map(fetch, asset_paths))
+    session.close()
+    
+    entries: Dict[str, List[int]] = {}
+    offset = 0
+    for asset_path, blob in zip(asset_paths, blobs):
+        if blob:
+            entries[asset_path] = [offset, len(blob)]
+            offset += len(blob)
+    
+    missing = len(asset_paths) - len(entries)
+    if not entries or missing > len(asset_paths) * MAX_MISSING_FRACTION:
+        print(f"[AssetPack] Not writing {path.name}: {missing} of {len(asset_paths)} assets unavailable")
+        return 0
+    
+    index = json.dumps({"base_url": base_url, "entries": entries}, separators=(",", ":")).encode("utf-8")
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(path.name + ".tmp")
+    with open(temp, "wb") as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_FORMAT, len(index)))
+        f.write(index)
+        for blob in blobs:
+            if blob:
+                f.write(blob)
+    os.replace(temp, path)
+    
+    print(f"[AssetPack] Packed {len(entries)} assets into {path.name}"
+          + (f" ({missing} unavailable)" if missing else ""))
+    return len(entries)
+
+
+class AssetPackManager:
+    """Holds the asset pack for the current patch and builds it when missing.
+    
+    Lookups are served from whichever pack is open; building runs on a
+    background thread and swaps the new pack in when it is complete.
+    """
+    
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = directory
+        self._pack: Optional[AssetPack] = None
+        self._patch: Optional[str] = None
+        self._lock = threading.Lock()
+        self._building: Optional[str] = None
+    
+    @property
+    def pack(self) -> Optional[AssetPack]:
+        return self._pack
+    
+    def lookup(self, url: str) -> Optional[bytes]:
+        """Packed bytes for an image URL, or None to fetch it from the network."""
+        pack = self._pack
+        return pack.lookup(url) if pack is not None else None
+    
+    def ensure(self, patch: str, base_url: str, asset_paths: Callable[[], List[str]],
+               on_built: Optional[Callable[[AssetPack], None]] = None):
+        """Open the pack for patch, building it in the background if needed.
+        
+        asset_paths is only called when a build is required. Packs for other
+        patches are deleted. If the build fails nothing is installed, and
+        the next call for the patch builds again.
+        """
+        with self._lock:
+            if patch == self._patch or patch == self._building:
+                return
+            path = pack_path(patch, self.directory)
+            pack = AssetPack.open(path)
+            if pack is not None and pack.base_url == base_url:
+                self._install(patch, pack)
+                return
+            if pack is not None:
+                pack.close()
+            # Stop serving another patch's images while the new pack builds
+            self._pack = None
+            self._patch = None
+            self._building = patch
+        
+        def build():
+            try:
+                packed = build_asset_pack(path, base_url, asset_paths())
+                pack = AssetPack.open(path) if packed else None
+            except Exception as e:
+                print(f"[AssetPack] Build failed for {patch}: {e}")
+                pack = None
+            with self._lock:
+                if self._building == patch:
+                    self._building = None
+                if pack is not None:
+                    self._install(patch, pack)
+            if pack is not None and on_built:
+                on_built(pack)
+        
+        print(f"[AssetPack] Building asset pack for {patch}...")
+        threading.Thread(target=build, daemon=True).start()
+    
+    def _install(self, patch: str, pack: AssetPack):
+        # Callers hold self._lock. The previous pack's map is left to the
+        # garbage collector, since a decode may still be reading from it.
+        self._pack = pack
+        self._patch = patch
+        self._purge_others(pack.path)
+    
+    def _purge_others(self, keep: Path):
+        for path in keep.parent.glob(f"{PACK_PREFIX}*{PACK_SUFFIX}"):
+            if path != keep:
+                try:
+                    path.unlink()
+                    print(f"[AssetPack] Removed stale {path.name}")
+                except OSError as e:
+                    print(f"[AssetPack] Could not remove {path.name}: {e}")
+
+
+# Global instance
+asset_packs = AssetPackManager()
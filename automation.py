@@ -0,0 +1,823 @@
+"""
+DanZ Client Tool - Automation
+Gameflow-phase driven scheduling for the game automation features.
+"""
+
+import heapq
+import itertools
+import json
+import math
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from lcu import lcu
+from champ_select import (
+    ActionCompleted, ActionStarted, BanAdded, IntentChanged, SessionEvent, SessionTracker,
+)
+
+GAMEFLOW_PHASE = "/lol-gameflow/v1/gameflow-phase"
+
+# Seconds between scheduler steps in each gameflow phase. Phases with
+# nothing to automate only watch for the next phase; ready check and
+# champion select are polled quickly by their handlers.
+PHASE_INTERVALS: Dict[str, float] = {
+    "None": 3.0,
+    "Lobby": 2.0,
+    "Matchmaking": 0.5,
+    "CheckedIntoTournament": 2.0,
+    "ReadyCheck": 0.25,
+    "ChampSelect": 0.5,
+    "GameStart": 5.0,
+    "InProgress": 15.0,
+    "Reconnect": 10.0,
+    "WaitingForStats": 5.0,
+    "PreEndOfGame": 5.0,
+    "EndOfGame": 3.0,
+}
+DEFAULT_INTERVAL = 2.0
+DISCONNECTED_INTERVAL = 2.0
+
+# While a phase handler polls its own endpoint, the phase itself is only
+# re-read this often (or as soon as the handler reports the phase is over)
+PHASE_RECHECK = 5.0
+
+READY_CHECK = "/lol-matchmaking/v1/ready-check"
+
+# Time-to-accept samples kept for the latency distribution (one per match)
+ACCEPT_LATENCY_SAMPLES = 200
+
+CHAT_CONVERSATIONS = "/lol-chat/v1/conversations"
+# Champion select rooms are "<id>@champ-select.<region>.pvp.net"
+CHAT_ROOM_DOMAIN = "@champ-select."
+
+# Waits between attempts to post the champion select message while the
+# chat room is still being joined
+CHAT_RETRY_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6, 3.2)
+
+# Threads for requests sent alongside the automation: one mute per
+# teammate and the chat message, all in flight together
+REQUEST_WORKERS = 5
+
+# Automation settings saved per queue
+PRESETS_FILE = Path(__file__).parent / "automation_presets.json"
+
+# Pick priority list used for every role without its own list
+ANY_ROLE = "any"
+
+
+@dataclass(frozen=True)
+class AutomationConfig:
+    """Snapshot of the automation settings.
+    
+    Built on the GUI thread whenever a control changes and swapped into the
+    engine as a whole, so the automation thread reads a consistent set of
+    settings without locks or touching widgets.
+    """
+    auto_accept: bool = False
+    
+    instalock: bool = False
+    instalock_champion: int = 0  # 0 picks a random owned champion
+    backup_champion: int = 0
+    # Champion ids to try, best first, by assigned position ("top", "jungle",
+    # "middle", "bottom", "utility" or ANY_ROLE); tried before the instalock
+    # and backup champions. Given as a mapping, stored as sorted
+    # (role, champion ids) pairs so the config stays immutable.
+    pick_priorities: Tuple[Tuple[str, Tuple[int, ...]], ...] = ()
+    pick_delay_ms: int = 0
+    lock_margin_ms: int = 1000
+    dodge_if_unavailable: bool = False
+    
+    auto_ban: bool = False
+    ban_champion: int = 0
+    ban_delay_ms: int = 0
+    
+    instant_mute: bool = False
+    reveal_side: bool = False
+    instant_message: bool = False
+    message: str = ""
+    
+    def __post_init__(self):
+        priorities = self.pick_priorities
+        if isinstance(priorities, dict):
+            priorities = priorities.items()
+        object.__setattr__(self, "pick_priorities", tuple(sorted(
+            (role, tuple(champion_ids)) for role, champion_ids in priorities if champion_ids
+        )))
+    
+    def priorities_for(self, role: str) -> Tuple[int, ...]:
+        """Pick priority list of a role (empty if it has none)."""
+        for name, champion_ids in self.pick_priorities:
+            if name == role:
+                return champion_ids
+        return ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["pick_priorities"] = {role: list(champion_ids) for role, champion_ids in self.pick_priorities}
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AutomationConfig":
+        """Build from saved settings, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+def load_presets(path: Path = PRESETS_FILE) -> Dict[str, AutomationConfig]:
+    """Saved automation presets by queue name."""
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {name: AutomationConfig.from_dict(preset) for name, preset in data.items()}
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        print(f"[Automation] Ignoring unreadable presets: {e}")
+        return {}
+
+
+def save_presets(presets: Dict[str, AutomationConfig], path: Path = PRESETS_FILE):
+    """Write automation presets by queue name."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({name: preset.to_dict() for name, preset in presets.items()}, f, indent=2)
+
+
+@dataclass
+class PhaseHandler:
+    """Callbacks for one gameflow phase.
+    
+    tick runs every step while the phase lasts and returns False once the
+    phase looks over (e.g. its endpoint stopped answering), so the phase is
+    read again straight away.
+    """
+    tick: Optional[Callable[[], bool]] = None
+    enter: Optional[Callable[[], None]] = None
+    leave: Optional[Callable[[], None]] = None
+
+
+class PhaseScheduler:
+    """
+    Runs automation handlers according to the client's gameflow phase.
+    
+    Each step costs one request at most in quiet phases (reading the phase)
+    and only the handler's own request while a handler is active, at the
+    phase's interval from PHASE_INTERVALS. Steps run on a daemon thread;
+    step() can also be driven directly with a simulated clock.
+    """
+    
+    def __init__(self, client=lcu, intervals: Optional[Dict[str, float]] = None):
+        self.client = client
+        self.intervals = dict(PHASE_INTERVALS, **(intervals or {}))
+        self.phase: Optional[str] = None
+        self._handlers: Dict[str, PhaseHandler] = {}
+        self._phase_read = float("-inf")
+        self._stop: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def on_phase(self, phase: str, tick: Optional[Callable[[], bool]] = None,
+                 enter: Optional[Callable[[], None]] = None,
+                 leave: Optional[Callable[[], None]] = None):
+        """Register the handler for a phase."""
+        self._handlers[phase] = PhaseHandler(tick, enter, leave)
+    
+    @property
+    def running(self) -> bool:
+        return self._stop is not None and not self._stop.is_set()
+    
+    def start(self):
+        """Start stepping on a background thread."""
+        if self.running:
+            return
+        # Each run gets its own event, so a stopped thread still finishing
+        # its last step never resumes
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop,), daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop stepping; the current phase is left when the thread exits."""
+        if self._stop is not None:
+            self._stop.set()
+    
+    def _run(self, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                delay = self.step()
+            except Exception as e:
+                print(f"[Automation] Step failed: {e}")
+                delay = DEFAULT_INTERVAL
+            stop.wait(delay)
+        if self._stop is stop:
+            self._set_phase(None)
+    
+    def step(self, now: Optional[float] = None) -> float:
+        """Run one step and return the seconds until the next."""
+        now = time.monotonic() if now is None else now
+        if not self.client.is_connected:
+            self._set_phase(None)
+            return DISCONNECTED_INTERVAL
+        
+        handler = self._handlers.get(self.phase)
+        if handler is None or handler.tick is None or now - self._phase_read >= PHASE_RECHECK:
+            self._read_phase(now)
+            handler = self._handlers.get(self.phase)
+        
+        if handler is not None and handler.tick is not None and not handler.tick():
+            phase = self.phase
+            self._read_phase(now)
+            handler = self._handlers.get(self.phase)
+            if self.phase != phase and handler is not None and handler.tick is not None:
+                # Start on the new phase's work straight away
+                return 0.0
+        return self.intervals.get(self.phase, DEFAULT_INTERVAL)
+    
+    def _read_phase(self, now: float):
+        response = self.client.lcu_get(GAMEFLOW_PHASE)
+        self._phase_read = now
+        if response.success and isinstance(response.data, str):
+            self._set_phase(response.data)
+        else:
+            self._set_phase(None)
+    
+    def _set_phase(self, phase: Optional[str]):
+        if phase == self.phase:
+            return
+        previous = self._handlers.get(self.phase)
+        self.phase = phase
+        if previous is not None and previous.leave is not None:
+            previous.leave()
+        if phase is not None:
+            print(f"[Automation] Gameflow phase: {phase}")
+        handler = self._handlers.get(phase)
+        if handler is not None and handler.enter is not None:
+            handler.enter()
+
+
+class ScheduledTask:
+    """Handle for a callback waiting in a DeadlineScheduler."""
+    
+    PENDING = 0
+    RUNNING = 1
+    DONE = 2
+    CANCELLED = 3
+    
+    __slots__ = ("deadline", "fn", "result", "_state", "_lock")
+    
+    def __init__(self, deadline: float, fn: Callable[[], Any], lock: threading.Lock):
+        self.deadline = deadline
+        self.fn = fn
+        self.result: Any = None
+        self._state = self.PENDING
+        self._lock = lock
+    
+    @property
+    def pending(self) -> bool:
+        return self._state == self.PENDING
+    
+    @property
+    def done(self) -> bool:
+        return self._state == self.DONE
+    
+    def cancel(self) -> bool:
+        """Stop the callback from running; False if it already started."""
+        with self._lock:
+            if self._state != self.PENDING:
+                return False
+            self._state = self.CANCELLED
+            return True
+
+
+class DeadlineScheduler:
+    """
+    Runs callbacks at monotonic-clock deadlines on one background thread.
+    
+    Used for delayed automation actions, so waiting for a deadline never
+    blocks the phase scheduler. Tasks are kept in a heap ordered by
+    deadline; cancelled tasks are dropped when they reach the front.
+    """
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._heap: List[Tuple[float, int, ScheduledTask]] = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: Optional[threading.Thread] = None
+    
+    def call_at(self, deadline: float, fn: Callable[[], Any]) -> ScheduledTask:
+        """Run fn once the clock reaches deadline; its return value is kept in task.result."""
+        task = ScheduledTask(deadline, fn, self._lock)
+        with self._lock:
+            heapq.heappush(self._heap, (deadline, next(self._order), task))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+        return task
+    
+    def call_later(self, delay: float, fn: Callable[[], Any]) -> ScheduledTask:
+        """Run fn after delay seconds."""
+        return self.call_at(self.clock() + delay, fn)
+    
+    def _next_due(self) -> ScheduledTask:
+        with self._lock:
+            while True:
+                if not self._heap:
+                    self._wakeup.wait()
+                    continue
+                deadline, _, task = self._heap[0]
+                if task._state == ScheduledTask.CANCELLED:
+                    heapq.heappop(self._heap)
+                    continue
+                remaining = deadline - self.clock()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+                task._state = ScheduledTask.RUNNING
+                return task
+    
+    def _run(self):
+        while True:
+            task = self._next_due()
+            try:
+                task.result = task.fn()
+            except Exception as e:
+                print(f"[Automation] Scheduled task failed: {e}")
+            task._state = ScheduledTask.DONE
+
+
+class PickPlan:
+    """
+    Ordered pick candidates for one champion select.
+    
+    Built once on entering champion select; afterwards only champions that
+    became (un)available are passed in. Choosing walks a cursor over the
+    candidates that only moves back when a champion before it is released,
+    so a choice costs amortized constant time however long the list is.
+    """
+    
+    def __init__(self, candidates: Iterable[int], owned: FrozenSet[int] = frozenset()):
+        # Keep the first occurrence of each champion; unowned ones can't be
+        # picked (ownership unknown while the inventory is still loading)
+        unique = [champ_id for champ_id in dict.fromkeys(candidates) if champ_id]
+        self.candidates: Tuple[int, ...] = tuple(c for c in unique if not owned or c in owned)
+        self._index = {champ_id: i for i, champ_id in enumerate(self.candidates)}
+        self._cursor = 0
+        self.unavailable: Set[int] = set()
+        # Champions teammates are hovering: avoided while another choice is free
+        self.intents: FrozenSet[int] = frozenset()
+    
+    def __len__(self) -> int:
+        return len(self.candidates)
+    
+    def rank(self, champ_id: Optional[int]) -> int:
+        """Position of a champion in the plan; after every candidate if it is not one."""
+        return self._index.get(champ_id, len(self.candidates))
+    
+    def mark_unavailable(self, champion_ids: Iterable[int]):
+        """Champions that were banned or picked."""
+        self.unavailable.update(champion_ids)
+    
+    def release(self, champion_ids: Iterable[int]):
+        """Champions that can be picked again (e.g. after a trade)."""
+        for champ_id in champion_ids:
+            self.unavailable.discard(champ_id)
+            index = self._index.get(champ_id)
+            if index is not None and index < self._cursor:
+                self._cursor = index
+    
+    def update(self, unavailable: Set[int], intents: Iterable[int] = ()):
+        """Apply the difference to a new set of unavailable champions."""
+        self.release(self.unavailable - unavailable)
+        self.mark_unavailable(unavailable - self.unavailable)
+        self.intents = frozenset(intents)
+    
+    def choose(self) -> Optional[int]:
+        """Best available candidate, or None once every one is gone."""
+        candidates = self.candidates
+        while self._cursor < len(candidates) and candidates[self._cursor] in self.unavailable:
+            self._cursor += 1
+        if self._cursor == len(candidates):
+            return None
+        # Step over teammates' hovers; at most a few entries (one per
+        # teammate plus bans and picks) lie between here and a free choice
+        for i in range(self._cursor, len(candidates)):
+            champ_id = candidates[i]
+            if champ_id not in self.unavailable and champ_id not in self.intents:
+                return champ_id
+        return candidates[self._cursor]
+
+
+class AutomationEngine:
+    """
+    Ready check and champion select automation, without any UI.
+    
+    Runs on a PhaseScheduler thread and acts on the current config, which
+    the GUI replaces as a whole (see AutomationConfig). Delayed picks and
+    bans are DeadlineScheduler tasks.
+    """
+    
+    def __init__(self, client=lcu):
+        self.client = client
+        self.config = AutomationConfig()
+        # Champions the player can pick (owned or free to play)
+        self.owned_champion_ids: FrozenSet[int] = frozenset()
+        # Called with "Blue Side" or "Red Side" on entering champion select
+        self.on_side_detected: Optional[Callable[[str], None]] = None
+        # Called with every champion select change event
+        self.on_session_event: Optional[Callable[[SessionEvent], None]] = None
+        
+        self.in_champ_select = False
+        self.tracker = SessionTracker()
+        # Delayed picks and bans, by action id: (champion id, task)
+        self.timers = DeadlineScheduler()
+        self.pending_actions: Dict[int, Tuple[int, ScheduledTask]] = {}
+        # Champion hovered for each of our pick actions, and the config it
+        # was chosen under (a settings change chooses again)
+        self.hovered_picks: Dict[int, int] = {}
+        self._pick_configs: Dict[int, AutomationConfig] = {}
+        # Pick candidates for this champion select, and the config it was built from
+        self.pick_plan: Optional[PickPlan] = None
+        self._plan_config: Optional[AutomationConfig] = None
+        
+        # Seconds from each ready check appearing to our accept going through
+        self.accept_latencies: Deque[float] = deque(maxlen=ACCEPT_LATENCY_SAMPLES)
+        # Called with the latency of every accepted ready check
+        self.on_ready_check_accepted: Optional[Callable[[float], None]] = None
+        self._accepted_ready_check = False
+        
+        # Mutes and chat go out here, never holding up picks and bans
+        self.requests_pool = ThreadPoolExecutor(max_workers=REQUEST_WORKERS, thread_name_prefix="Automation")
+        self._chat_task: Optional[ScheduledTask] = None
+        # Conversation id of this champion select's room, once found
+        self._chat_id: Optional[str] = None
+        
+        # Automation work follows the gameflow phase. The ready check is
+        # already watched while matchmaking, so it is accepted on the first
+        # poll that sees it rather than after a phase change is noticed.
+        self.scheduler = PhaseScheduler(client)
+        self.scheduler.on_phase("Matchmaking", tick=self.ready_check_tick, leave=self.on_leave_ready_check)
+        self.scheduler.on_phase("ReadyCheck", tick=self.ready_check_tick, leave=self.on_leave_ready_check)
+        self.scheduler.on_phase("ChampSelect", tick=self.champ_select_tick, leave=self.on_leave_champ_select)
+    
+    @property
+    def running(self) -> bool:
+        return self.scheduler.running
+    
+    def start(self):
+        self.scheduler.start()
+    
+    def stop(self):
+        self.scheduler.stop()
+    
+    def dodge(self):
+        """Dodge the current champion select."""
+        self.client.lcds_invoke("teambuilder-draft", "quitV2", [])
+    
+    def ready_check_tick(self) -> bool:
+        """Accept the ready check as soon as it shows up; False once it is gone."""
+        if not self.config.auto_accept:
+            # Nothing to do here, let the scheduler follow the phase
+            return False
+        
+        polled = time.monotonic()
+        response = self.client.lcu_get(READY_CHECK)
+        if not response.success or not isinstance(response.data, dict):
+            return False
+        
+        ready_check = response.data
+        if ready_check.get("state") != "InProgress":
+            self._accepted_ready_check = False
+            return True
+        if ready_check.get("playerResponse") != "None" or self._accepted_ready_check:
+            return True
+        
+        # The accept is the only request between seeing the ready check
+        # and answering it
+        accept = self.client.lcu_post(f"{READY_CHECK}/accept")
+        if accept.success:
+            self._accepted_ready_check = True
+            # The ready check's timer counts the seconds since it appeared
+            latency = time.monotonic() - polled + float(ready_check.get("timer") or 0)
+            self.accept_latencies.append(latency)
+            print(f"[Automation] Ready check accepted in {latency * 1000:.0f} ms")
+            if self.on_ready_check_accepted:
+                self.on_ready_check_accepted(latency)
+        return True
+    
+    def on_leave_ready_check(self):
+        """Forget the accepted ready check once its phase is over.
+        
+        The next game's ready check can already be up when it is first
+        polled, so its state alone does not tell it apart from ours.
+        """
+        self._accepted_ready_check = False
+    
+    def accept_latency_percentiles(self, percentiles: Iterable[int] = (50, 90, 99)) -> Dict[int, float]:
+        """Time-to-accept percentiles in seconds over the recorded matches."""
+        samples = sorted(self.accept_latencies)
+        if not samples:
+            return {}
+        return {
+            p: samples[min(len(samples), max(1, math.ceil(p / 100 * len(samples)))) - 1]
+            for p in percentiles
+        }
+    
+    def champ_select_tick(self) -> bool:
+        """Poll the champion select session; False once it is gone."""
+        config = self.config
+        requested = time.monotonic()
+        cs_response = self.client.lcu_get("/lol-champ-select/v1/session")
+        if not cs_response.success or not cs_response.data:
+            return False
+        
+        session = cs_response.data
+        
+        # When the current turn ends, on our clock (measured from the request
+        # so any transfer delay makes it early rather than late)
+        phase_deadline = None
+        time_left = session.get("timer", {}).get("adjustedTimeLeftInPhase", 0)
+        if time_left > 0:
+            phase_deadline = requested + time_left / 1000
+        
+        events = self.tracker.update(session)
+        
+        # First time entering champ select
+        if not self.in_champ_select:
+            self.in_champ_select = True
+            self.on_enter_champ_select(session, config)
+        
+        # React to what changed
+        self.process_champ_select(events, config, phase_deadline)
+        return True
+    
+    def on_leave_champ_select(self):
+        """Called when the gameflow leaves champion select."""
+        self.in_champ_select = False
+        for _, task in self.pending_actions.values():
+            task.cancel()
+        self.pending_actions.clear()
+        if self._chat_task is not None:
+            self._chat_task.cancel()
+            self._chat_task = None
+        self._chat_id = None
+        self.hovered_picks.clear()
+        self._pick_configs.clear()
+        self.pick_plan = None
+        self._plan_config = None
+        self.tracker.reset()
+    
+    def on_enter_champ_select(self, session: Dict, config: AutomationConfig):
+        """Called when first entering champion select."""
+        # Side notification
+        if config.reveal_side and self.on_side_detected:
+            my_team = session.get("myTeam", [])
+            if my_team:
+                team = my_team[0].get("team", 1)
+                side = "Blue Side" if team == 1 else "Red Side"
+                self.on_side_detected(side)
+        
+        # Instant mute
+        if config.instant_mute:
+            self.mute_team(session)
+        
+        # Instant message
+        if config.instant_message and config.message:
+            self.requests_pool.submit(self.send_chat_message, config.message, 0)
+    
+    def mute_team(self, session: Dict):
+        """Mute every teammate, all requests at once."""
+        local_cell = session.get("localPlayerCellId")
+        for member in session.get("myTeam", []):
+            if member.get("cellId") != local_cell:
+                body = {"puuid": member.get("puuid", "")}
+                self.requests_pool.submit(self.client.lcu_post, "/lol-champ-select/v1/toggle-player-muted", body)
+    
+    def send_chat_message(self, message: str, attempt: int):
+        """Post to the champion select chat, retrying with backoff until the room is joined."""
+        self._chat_task = None
+        if not self.in_champ_select:
+            return
+        
+        if self._chat_id is None:
+            self._chat_id = self.find_champ_select_conversation()
+        if self._chat_id is not None:
+            response = self.client.lcu_post(f"{CHAT_CONVERSATIONS}/{self._chat_id}/messages", {"body": message})
+            if response.success:
+                return
+        
+        if attempt < len(CHAT_RETRY_DELAYS):
+            self._chat_task = self.timers.call_later(
+                CHAT_RETRY_DELAYS[attempt],
+                lambda: self.requests_pool.submit(self.send_chat_message, message, attempt + 1)
+            )
+        else:
+            print("[Automation] Champion select chat not available, message not sent")
+    
+    def find_champ_select_conversation(self) -> Optional[str]:
+        """Look the champion select room up in the conversation list."""
+        response = self.client.lcu_get(CHAT_CONVERSATIONS)
+        if response.success and response.data:
+            for convo in response.data:
+                convo_id = convo.get("id") or ""
+                if convo.get("type") == "championSelect" or CHAT_ROOM_DOMAIN in convo_id:
+                    return convo_id
+        return None
+    
+    def process_champ_select(self, events: List[SessionEvent], config: AutomationConfig,
+                             phase_deadline: Optional[float] = None):
+        """React to champion select changes.
+        
+        Our actions are only looked at again when something could change
+        what to do with them: a turn starting, the champions available
+        changing, a settings change or a lock that failed.
+        """
+        tracker = self.tracker
+        revisit = set()
+        availability_changed = False
+        
+        if config is not self._plan_config:
+            self._plan_config = config
+            self.pick_plan = self.build_pick_plan(config) if config.instalock else None
+            revisit.update(tracker.local_actions)
+        
+        for event in events:
+            if self.on_session_event:
+                self.on_session_event(event)
+            if isinstance(event, ActionStarted):
+                if event.local:
+                    revisit.add(event.action_id)
+            elif isinstance(event, ActionCompleted):
+                if event.local:
+                    planned = self.pending_actions.pop(event.action_id, None)
+                    if planned is not None:
+                        planned[1].cancel()
+                else:
+                    availability_changed = True
+            elif isinstance(event, (BanAdded, IntentChanged)):
+                availability_changed = True
+        
+        if self.pick_plan is not None and availability_changed:
+            self.pick_plan.update(tracker.unavailable, tracker.teammate_intents())
+            revisit.update(tracker.local_actions)
+        
+        # Retry locks that did not go through
+        revisit.update(
+            action_id for action_id, (_, task) in self.pending_actions.items()
+            if task.done and not task.result
+        )
+        
+        for action_id in revisit:
+            local_action = tracker.local_actions.get(action_id)
+            if local_action is None:
+                continue
+            action_type, in_progress = local_action
+            
+            # Picks are hovered as soon as they exist, then locked on our turn
+            if action_type == "pick" and config.instalock:
+                self.handle_pick_action(action_id, tracker.unavailable, config, in_progress, phase_deadline)
+            
+            elif action_type == "ban" and in_progress and config.auto_ban:
+                self.handle_ban_action(action_id, config)
+        
+        # Drop delayed actions that are no longer ours to take
+        for action_id in list(self.pending_actions):
+            local_action = tracker.local_actions.get(action_id)
+            if local_action is None or not local_action[1]:
+                self.pending_actions.pop(action_id)[1].cancel()
+    
+    def build_pick_plan(self, config: AutomationConfig) -> PickPlan:
+        """Pick candidates for our assigned position, best first."""
+        position = self.tracker.position
+        candidates = list(config.priorities_for(position)) if position else []
+        candidates.extend(config.priorities_for(ANY_ROLE))
+        # A random instalock always finds a champion, so it has no backup
+        if config.instalock_champion:
+            candidates.extend((config.instalock_champion, config.backup_champion))
+        plan = PickPlan(candidates, self.owned_champion_ids)
+        plan.update(self.tracker.unavailable, self.tracker.teammate_intents())
+        return plan
+    
+    def _planned_deadline(self, action_id: int, unavailable: set, replan: bool = False) -> Optional[float]:
+        """Deadline to (re)schedule an action at, or None if it is already handled.
+        
+        A pending action stays scheduled while its champion is available and
+        replan is not asked for; a replacement keeps the original deadline. A
+        lock that went through is left alone until the session shows it; a
+        failed one is retried now.
+        """
+        planned = self.pending_actions.get(action_id)
+        if planned is None:
+            return time.monotonic()
+        champ_id, task = planned
+        if task.pending:
+            if champ_id not in unavailable and not replan:
+                return None
+            task.cancel()
+            return task.deadline
+        if task.done and task.result:
+            return None
+        return time.monotonic()
+    
+    def _schedule_action(self, action_id: int, champ_id: int, deadline: float):
+        task = self.timers.call_at(deadline, lambda: self.complete_action(action_id, champ_id))
+        self.pending_actions[action_id] = (champ_id, task)
+    
+    def complete_action(self, action_id: int, champ_id: int) -> bool:
+        """Lock in a pick or ban."""
+        if self.hovered_picks.get(action_id) == champ_id:
+            # Already hovered: only confirm it
+            return self.client.lcu_post(f"/lol-champ-select/v1/session/actions/{action_id}/complete").success
+        body = {"championId": champ_id, "completed": True}
+        return self.client.lcu_patch(f"/lol-champ-select/v1/session/actions/{action_id}", body).success
+    
+    def hover_champion(self, action_id: int, champ_id: int):
+        """Declare a pick without locking it."""
+        response = self.client.lcu_patch(f"/lol-champ-select/v1/session/actions/{action_id}", {"championId": champ_id})
+        if response.success:
+            self.hovered_picks[action_id] = champ_id
+    
+    def handle_pick_action(self, action_id: int, unavailable: Set[int], config: AutomationConfig,
+                           in_progress: bool = True, phase_deadline: Optional[float] = None):
+        """Handle pick action: hover the pick early, lock it on our turn.
+        
+        The pick is the best available champion of the pick plan. The lock
+        fires after the configured delay, but no later than the lock margin
+        before the turn's timer runs out.
+        """
+        hovered = self.hovered_picks.get(action_id)
+        if hovered in unavailable:
+            hovered = None
+        # A hover chosen under older settings is chosen again
+        settled = self._pick_configs.get(action_id) is config
+        if in_progress:
+            deadline = self._planned_deadline(action_id, unavailable, replan=not settled)
+            if deadline is None:
+                return
+        elif settled and hovered is not None:
+            return
+        is_new = action_id not in self.pending_actions
+        
+        if settled and hovered is not None:
+            champ_id = hovered
+        else:
+            plan = self.pick_plan
+            champ_id = plan.choose()
+            # Dodge when the instalock champion is gone and the plan has
+            # nothing better to fall back on (role picks rank before it)
+            instalock = config.instalock_champion
+            if (config.dodge_if_unavailable and instalock and instalock in unavailable
+                    and plan.rank(champ_id) > plan.rank(instalock)):
+                self.pending_actions.pop(action_id, None)
+                self.dodge()
+                return
+            
+            if champ_id is None and config.instalock_champion == 0: # Random
+                # Rolled once per pick: a champion already hovered stays
+                champ_id = hovered or self.get_random_champion(unavailable)
+        
+        if not champ_id or champ_id in unavailable:
+            self.pending_actions.pop(action_id, None)
+            return
+        self._pick_configs[action_id] = config
+        
+        if champ_id != hovered:
+            self.hover_champion(action_id, champ_id)
+        
+        if in_progress:
+            # Apply delay
+            if is_new:
+                deadline += config.pick_delay_ms / 1000
+            if phase_deadline is not None:
+                deadline = min(deadline, phase_deadline - config.lock_margin_ms / 1000)
+            self._schedule_action(action_id, champ_id, deadline)
+    
+    def handle_ban_action(self, action_id: int, config: AutomationConfig):
+        """Handle ban action."""
+        champ_id = config.ban_champion
+        if not champ_id:
+            return
+        
+        deadline = self._planned_deadline(action_id, set())
+        if deadline is None:
+            return
+        
+        # Apply delay
+        if action_id not in self.pending_actions:
+            deadline += config.ban_delay_ms / 1000
+        self._schedule_action(action_id, champ_id, deadline)
+    
+    def get_random_champion(self, unavailable: Set[int]) -> Optional[int]:
+        """Get a random available champion."""
+        available = list(self.owned_champion_ids - unavailable)
+        
+        if available:
+            return random.choice(available)
+        return None
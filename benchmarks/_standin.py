@@ -0,0 +1,163 @@
+"""
+DanZ Client Tool - Benchmark Helpers
+Local HTTP stand-in server and synthetic game data catalogues.
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+
+# Make the application modules importable when run as `python benchmarks/x.py`
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class StandInServer:
+    """Threaded loopback HTTP server serving fixed responses by path."""
+    
+    def __init__(self, routes: Dict[str, bytes], latency: float = 0.0):
+        self.routes = routes
+        self.latency = latency
+        self.request_count = 0
+        
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.request_count += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                body = server.routes.get(self.path.split("?")[0])
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+    
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+_WORDS = [
+    "Star", "Guardian", "Project", "Spirit", "Blossom", "Arcade", "Battle", "Academy",
+    "Pool", "Party", "Blood", "Moon", "High", "Noon", "Dark", "Cosmic", "Odyssey",
+    "Coven", "Pulsefire", "Elderwood", "Winterblessed", "Lunar", "Beast", "Empyrean",
+    "Porcelain", "Mecha", "Kingdoms", "Infernal", "Soul", "Fighter", "Victorious",
+]
+
+
+def synthetic_champions(count: int = 170) -> list:
+    """Champion summary entries shaped like champion-summary.json."""
+    rng = random.Random(1)
+    champs = [{"id": -1, "name": "None", "alias": "None", "squarePortraitPath": "", "roles": []}]
+    for cid in range(1, count + 1):
+        name = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))).title()
+        champs.append({
+            "id": cid,
+            "name": name,
+            "alias": name,
+            "squarePortraitPath": f"/lol-game-data/assets/v1/champion-icons/{cid}.png",
+            "roles": ["fighter", "tank"],
+        })
+    return champs
+
+
+def synthetic_skins(champions: list, per_champion: int = 45) -> dict:
+    """Skin entries shaped like skins.json, including the heavy fields the UI ignores."""
+    rng = random.Random(2)
+    rarities = ["kNoRarity", "kEpic", "kLegendary", "kMythic", "kUltimate"]
+    skins = {}
+    for champ in champions:
+        cid = champ["id"]
+        if cid <= 0:
+            continue
+        for num in range(per_champion):
+            sid = cid * 1000 + num
+            name = champ["name"] if num == 0 else f"{' '.join(rng.sample(_WORDS, 2))} {champ['name']}"
+            skins[str(sid)] = {
+                "id": sid,
+                "isBase": num == 0,
+                "name": name,
+                "splashPath": f"/lol-game-data/assets/ASSETS/Characters/{champ['alias']}/Skins/Skin{num:02d}/Images/splash.jpg",
+                "uncenteredSplashPath": f"/lol-game-data/assets/ASSETS/Characters/{champ['alias']}/Skins/Skin{num:02d}/Images/uncentered.jpg",
+                "tilePath": f"/lol-game-data/assets/ASSETS/Characters/{champ['alias']}/Skins/Skin{num:02d}/Images/tile.jpg",
+                "loadScreenPath": f"/lol-game-data/assets/ASSETS/Characters/{champ['alias']}/Skins/Skin{num:02d}/Images/loadscreen.jpg",
+                "skinType": "",
+                "rarity": rng.choice(rarities),
+                "isLegacy": rng.random() < 0.2,
+                "splashVideoPath": None,
+                "collectionSplashVideoPath": None,
+                "featuresText": None,
+                "chromaPath": f"/lol-game-data/assets/v1/champion-chroma-images/{cid}/{sid}.png",
+                "emblems": None,
+                "regionRarityId": 0,
+                "rarityGemPath": None,
+                "skinLines": [{"id": rng.randint(1, 200)}],
+                "description": " ".join(rng.choice(_WORDS).lower() for _ in range(40)),
+                "chromas": [
+                    {
+                        "id": sid * 1000 + c,
+                        "name": f"{name} ({rng.choice(_WORDS)})",
+                        "chromaPath": f"/lol-game-data/assets/v1/champion-chroma-images/{cid}/{sid * 1000 + c}.png",
+                        "colors": ["#2756CE", "#2756CE"],
+                        "descriptions": [{"region": "riot", "description": "Available in a bundle."}],
+                        "rarities": [{"region": "riot", "rarity": 0}],
+                    }
+                    for c in range(rng.randint(0, 6))
+                ],
+            }
+    return skins
+
+
+def synthetic_icons(count: int = 6000) -> list:
+    """Profile icon entries shaped like summoner-icons.json."""
+    rng = random.Random(3)
+    return [
+        {
+            "id": iid,
+            "title": f"{' '.join(rng.sample(_WORDS, rng.randint(1, 3)))} Icon",
+            "yearReleased": rng.randint(2009, 2025),
+            "isLegacy": rng.random() < 0.3,
+            "imagePath": f"/lol-game-data/assets/v1/profile-icons/{iid}.jpg",
+            "descriptions": [{"region": "", "description": "Awarded for something."}],
+            "rarities": [{"region": "", "rarity": 0}],
+            "disabledRegions": [],
+            "esportsTeam": None,
+            "esportsRegion": None,
+            "esportsEvent": None,
+        }
+        for iid in range(count)
+    ]
+
+
+def synthetic_catalogue() -> Dict[str, bytes]:
+    """Encoded skins/icons/champions datasets keyed by CDN file name."""
+    champions = synthetic_champions()
+    return {
+        "skins.json": json.dumps(synthetic_skins(champions)).encode(),
+        "summoner-icons.json": json.dumps(synthetic_icons()).encode(),
+        "champion-summary.json": json.dumps(champions).encode(),
+    }
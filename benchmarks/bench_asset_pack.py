@@ -0,0 +1,112 @@
+"""
+Asset pack benchmark: building a pack from the CDN and reading it back.
+
+Serves synthetic champion squares and profile icons from a loopback
+stand-in, builds a pack, checks that every packed image round-trips
+through lookup, and times lookups against fetching each image again.
+Also checks that a build with too many failed downloads writes nothing
+and that the manager retries it.
+
+Usage: python benchmarks/bench_asset_pack.py [latency_seconds]
+"""
+
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+from _standin import StandInServer
+
+from asset_pack import MAX_MISSING_FRACTION, AssetPack, AssetPackManager, build_asset_pack, icon_pack_paths, pack_path
+
+CHAMPIONS = 170
+ICONS = 1000
+
+
+def synthetic_images(paths) -> dict:
+    """Distinct pseudo-image bytes per asset path, a few KiB each."""
+    rng = random.Random(4)
+    return {path: rng.randbytes(rng.randint(2048, 6144)) for path in paths}
+
+
+def check_round_trip(pack: AssetPack, base_url: str, images: dict):
+    for path, blob in images.items():
+        assert pack.lookup(f"{base_url}/{path}") == blob, f"{path} did not round-trip"
+
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.005
+    paths = icon_pack_paths(range(-1, CHAMPIONS + 1), range(ICONS))
+    images = synthetic_images(paths)
+    routes = {f"/{path}": blob for path, blob in images.items()}
+    
+    with tempfile.TemporaryDirectory() as cache_dir, StandInServer(dict(routes), latency) as server:
+        directory = Path(cache_dir)
+        base_url = server.base_url
+        
+        # Full build
+        path = pack_path("bench", directory)
+        start = time.perf_counter()
+        packed = build_asset_pack(path, base_url, paths)
+        build_time = time.perf_counter() - start
+        assert packed == len(paths), f"packed {packed} of {len(paths)}"
+        pack = AssetPack.open(path)
+        assert pack is not None and len(pack) == len(paths)
+        check_round_trip(pack, base_url, images)
+        
+        start = time.perf_counter()
+        for asset in paths:
+            pack.lookup(f"{base_url}/{asset}")
+        lookup_time = time.perf_counter() - start
+        
+        sample = paths[:100]
+        with requests.Session() as session:
+            start = time.perf_counter()
+            for asset in sample:
+                session.get(f"{base_url}/{asset}").content
+            fetch_time = (time.perf_counter() - start) / len(sample) * len(paths)
+        pack.close()
+        
+        # A few gaps are tolerated and left out of the pack
+        allowed = int(len(paths) * MAX_MISSING_FRACTION)
+        dropped = paths[1::len(paths) // allowed + 1]
+        for asset in dropped:
+            del server.routes[f"/{asset}"]
+        path = pack_path("gaps", directory)
+        packed = build_asset_pack(path, base_url, paths)
+        assert packed == len(paths) - len(dropped), f"packed {packed}"
+        pack = AssetPack.open(path)
+        check_round_trip(pack, base_url, {p: b for p, b in images.items() if p not in dropped})
+        assert all(pack.lookup(f"{base_url}/{asset}") is None for asset in dropped)
+        pack.close()
+        
+        # Too many failures: nothing written, and the manager builds again
+        server.routes.clear()
+        manager = AssetPackManager(directory)
+        built = threading.Event()
+        path = pack_path("offline", directory)
+        manager.ensure("offline", base_url, lambda: paths, lambda pack: built.set())
+        while manager._building:
+            time.sleep(0.01)
+        assert not path.exists() and manager.pack is None, "failed build was installed"
+        
+        server.routes.update(routes)
+        manager.ensure("offline", base_url, lambda: paths, lambda pack: built.set())
+        assert built.wait(30), "retry did not build the pack"
+        assert len(manager.pack) == len(paths)
+        check_round_trip(manager.pack, base_url, images)
+    
+    print(f"latency per request: {latency * 1000:.1f} ms")
+    print(f"assets: {len(paths)} ({len(dropped)} dropped in the gaps run)")
+    print(f"build:              {build_time * 1000:9.1f} ms")
+    print(f"lookup all (pack):  {lookup_time * 1000:9.1f} ms")
+    print(f"fetch all (est.):   {fetch_time * 1000:9.1f} ms")
+    print("round trip, partial build and retry checks passed")
+
+
+if __name__ == "__main__":
+    main()
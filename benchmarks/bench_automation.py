@@ -0,0 +1,395 @@
+"""
+Champion select automation latency benchmark.
+
+Runs the AutomationEngine the Game tab uses, headless, against a scripted
+LCU stand-in on loopback HTTP (reached through a real LCUConnection with
+stand-in ClientCredentials) for a series of simulated games: matchmaking,
+a ready check, then a draft with concurrent bans and alternating pick
+turns where other players ban and take champions from our pick list.
+
+Reports, over all games:
+  ready check -> accept    from the ready check appearing to the accept
+  pick/ban    -> lock      from our turn starting to the lock request
+  CPU per game             engine process CPU time (the stand-in runs in
+                           its own process and is not counted)
+
+The script and its choices are seeded, so runs on different commits play
+the same games and their numbers can be compared directly.
+
+Usage: python benchmarks/bench_automation.py [--games N] [--seed S]
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import random
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import _standin  # noqa: F401  (puts the application modules on the import path)
+
+import requests
+
+from auth import ClientCredentials
+from automation import ANY_ROLE, AutomationConfig, AutomationEngine
+from lcu import ConnectionStatus, LCUConnection
+
+CHAMPIONS = range(1, 171)
+
+# Our settings: instalock with a backup and a priority list, auto ban
+CONFIG = AutomationConfig(
+    auto_accept=True,
+    instalock=True,
+    instalock_champion=1,
+    backup_champion=2,
+    pick_priorities={ANY_ROLE: (3, 4, 5)},
+    auto_ban=True,
+    ban_champion=10,
+)
+# Champions other players sometimes go for first, so ours get banned or taken
+CONTESTED = [1, 2, 3, 4, 5, 10]
+CONTEST_RATE = 0.25
+
+# Simulated timings, in seconds
+MATCHMAKING = (0.3, 0.8)
+READY_CHECK_TIMEOUT = 10.0
+LOADING = 0.2
+BAN_TIME = 3.0
+PICK_TIME = 3.0
+OTHERS_ACT = (0.1, 0.6)
+FINALIZATION = 0.3
+
+# Pick turns, as counts of cells acting together (blue and red alternate)
+PICK_ORDER = [1, 2, 2, 2, 2, 1]
+
+
+class ScriptedGame:
+    """One game from matchmaking to the end of champion select, on the wall clock."""
+    
+    def __init__(self, rng: random.Random, start: float):
+        self.rng = rng
+        self.local_cell = rng.randrange(5)
+        self.ready_at = start + rng.uniform(*MATCHMAKING)
+        self.accepted_at: Optional[float] = None
+        self.select_at: Optional[float] = None
+        self.ended_at: Optional[float] = None
+        
+        # Actions: one ban group with every cell, then the pick turns
+        self._ids = itertools.count(1)
+        self.actions: List[List[Dict]] = [[self._action(cell, "ban") for cell in range(10)]]
+        order = [cell for pair in zip(range(5), range(5, 10)) for cell in pair]
+        for size in PICK_ORDER:
+            self.actions.append([self._action(order.pop(0), "pick") for _ in range(size)])
+        self.actions_by_id = {a["id"]: a for group in self.actions for a in group}
+        self.completed_at: Dict[int, float] = {}
+        self.turn = -1
+        self.turn_started = 0.0
+        # When each other player's action completes in the current turn
+        self.others_due: Dict[int, float] = {}
+        # Other players' preferences, drawn up front so every run plays the same
+        self.preferences = {
+            a["id"]: ([rng.choice(CONTESTED)] if rng.random() < CONTEST_RATE else []) + rng.sample(CHAMPIONS, 8)
+            for a in self.actions_by_id.values() if a["actorCellId"] != self.local_cell
+        }
+        # Teammates show the champion they want from the start
+        self.intents: Dict[int, int] = {
+            a["actorCellId"]: self.preferences[a["id"]][0]
+            for a in self.actions_by_id.values()
+            if a["type"] == "pick" and a["isAllyAction"] and a["actorCellId"] != self.local_cell
+        }
+        
+        self.ready_latency: Optional[float] = None
+        self.lock_latencies: Dict[str, List[float]] = {"pick": [], "ban": []}
+        self.missed_turns = 0
+    
+    def _action(self, cell: int, action_type: str) -> Dict:
+        return {
+            "id": next(self._ids),
+            "actorCellId": cell, "type": action_type, "championId": 0,
+            "isInProgress": False, "completed": False, "isAllyAction": cell < 5,
+        }
+    
+    @property
+    def unavailable(self) -> set:
+        return {a["championId"] for a in self.actions_by_id.values() if a["completed"] and a["championId"]}
+    
+    def phase(self, now: float) -> str:
+        self.advance(now)
+        if now < self.ready_at:
+            return "Matchmaking"
+        if self.select_at is None or now < self.select_at:
+            return "ReadyCheck"
+        return "ChampSelect" if self.ended_at is None or now < self.ended_at + FINALIZATION else "EndOfGame"
+    
+    def advance(self, now: float):
+        """Play the other players' actions and the turn timers up to now."""
+        if self.accepted_at is None and now >= self.ready_at + READY_CHECK_TIMEOUT:
+            # Never accepted: count it and move on
+            self.accepted_at = self.ready_at + READY_CHECK_TIMEOUT
+            self.select_at = self.accepted_at
+        if self.select_at is None or now < self.select_at or self.ended_at is not None:
+            return
+        if self.turn < 0:
+            self._start_turn(0, self.select_at)
+        while self.ended_at is None:
+            due = [(t, action_id) for action_id, t in self.others_due.items() if t <= now]
+            for t, action_id in sorted(due):
+                del self.others_due[action_id]
+                self._complete_other(action_id, t)
+            group = self.actions[self.turn]
+            turn_end = self.turn_started + (BAN_TIME if self.turn == 0 else PICK_TIME)
+            if all(a["completed"] for a in group):
+                self._next_turn(max(self.completed_at[a["id"]] for a in group))
+            elif now >= turn_end:
+                # Timer ran out on our turn
+                for action in group:
+                    if not action["completed"]:
+                        self.missed_turns += 1
+                        self._complete(action, turn_end)
+                self._next_turn(turn_end)
+            else:
+                return
+    
+    def _start_turn(self, turn: int, at: float):
+        self.turn = turn
+        self.turn_started = at
+        for action in self.actions[turn]:
+            action["isInProgress"] = True
+            if action["actorCellId"] != self.local_cell:
+                self.others_due[action["id"]] = at + self.rng.uniform(*OTHERS_ACT)
+    
+    def _next_turn(self, at: float):
+        if self.turn + 1 < len(self.actions):
+            self._start_turn(self.turn + 1, at)
+        else:
+            self.ended_at = at
+    
+    def _complete(self, action: Dict, at: float):
+        action.update(isInProgress=False, completed=True)
+        self.completed_at[action["id"]] = at
+    
+    def _complete_other(self, action_id: int, at: float):
+        action = self.actions_by_id[action_id]
+        unavailable = self.unavailable
+        champion = next(c for c in self.preferences[action_id] if c not in unavailable)
+        if action["actorCellId"] in self.intents:
+            self.intents[action["actorCellId"]] = champion
+        action["championId"] = champion
+        self._complete(action, at)
+    
+    def local_request(self, now: float, action_id: int, champion_id: Optional[int], lock: bool) -> bool:
+        """A PATCH or complete on one of our actions; False if the client would refuse it."""
+        self.advance(now)
+        action = self.actions_by_id.get(action_id)
+        if action is None or action["actorCellId"] != self.local_cell or action["completed"]:
+            return False
+        champion_id = champion_id or action["championId"]
+        if champion_id in self.unavailable and action["type"] == "pick":
+            return False
+        action["championId"] = champion_id
+        if lock:
+            if not action["isInProgress"]:
+                return False
+            self.lock_latencies[action["type"]].append(now - self.turn_started)
+            self._complete(action, now)
+            self.advance(now)
+        return True
+    
+    def session(self, now: float) -> Dict:
+        self.advance(now)
+        turn_time = BAN_TIME if self.turn == 0 else PICK_TIME
+        left = max(0.0, self.turn_started + turn_time - now) if self.ended_at is None else FINALIZATION
+        bans = [a["championId"] for a in self.actions[0] if a["completed"] and a["championId"]]
+        return {
+            "localPlayerCellId": self.local_cell,
+            "myTeam": [
+                {"cellId": cell, "team": 1, "assignedPosition": "", "puuid": f"p{cell}",
+                 "championPickIntent": self.intents.get(cell, 0)}
+                for cell in range(5)
+            ],
+            "actions": [[dict(action) for action in group] for group in self.actions],
+            "bans": {"myTeamBans": bans[:5], "theirTeamBans": bans[5:]},
+            "timer": {
+                "phase": "FINALIZATION" if self.ended_at is not None else "BAN_PICK",
+                "adjustedTimeLeftInPhase": int(left * 1000),
+            },
+            "trades": [],
+            "chatDetails": {},
+        }
+
+
+class ScriptedLCU:
+    """The LCU endpoints the automation uses, answering from a ScriptedGame."""
+    
+    def __init__(self, games: int, seed: int):
+        self.games_left = games
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.finished: List[ScriptedGame] = []
+        self.requests = 0
+        self.game = self._next_game(time.monotonic())
+    
+    def _next_game(self, now: float) -> Optional[ScriptedGame]:
+        if self.games_left == 0:
+            return None
+        self.games_left -= 1
+        return ScriptedGame(random.Random(self.seed * 1000 + len(self.finished)), now)
+    
+    def handle(self, method: str, path: str, body) -> tuple:
+        with self.lock:
+            now = time.monotonic()
+            self.requests += 1
+            game = self.game
+            phase = game.phase(now) if game else "None"
+            if phase == "EndOfGame":
+                self.finished.append(game)
+                self.game = game = self._next_game(now)
+                phase = game.phase(now) if game else "None"
+            
+            if path == "/lol-gameflow/v1/gameflow-phase":
+                return 200, phase
+            if path == "/lol-matchmaking/v1/ready-check":
+                if phase == "Matchmaking":
+                    return 200, {"state": "Invalid", "playerResponse": "None"}
+                if phase == "ReadyCheck":
+                    response = "None" if game.accepted_at is None else "Accepted"
+                    return 200, {"state": "InProgress", "playerResponse": response,
+                                 "timer": round(now - game.ready_at, 3)}
+                return 404, None
+            if path == "/lol-matchmaking/v1/ready-check/accept" and phase == "ReadyCheck":
+                if game.accepted_at is None:
+                    game.accepted_at = now
+                    game.ready_latency = now - game.ready_at
+                    game.select_at = now + LOADING
+                return 204, None
+            if path == "/lol-champ-select/v1/session" and phase == "ChampSelect":
+                return 200, game.session(now)
+            if path.startswith("/lol-champ-select/v1/session/actions/") and phase == "ChampSelect":
+                parts = path.split("/")
+                action_id = int(parts[5])
+                if method == "POST" and parts[-1] == "complete":
+                    ok = game.local_request(now, action_id, None, lock=True)
+                else:
+                    body = body or {}
+                    ok = game.local_request(now, action_id, body.get("championId"), bool(body.get("completed")))
+                return (204, None) if ok else (500, {"message": "Invalid action"})
+            return 404, None
+    
+    def results(self) -> Dict:
+        with self.lock:
+            return {
+                "done": self.game is None,
+                "requests": self.requests,
+                "ready": [g.ready_latency for g in self.finished if g.ready_latency is not None],
+                "pick": [t for g in self.finished for t in g.lock_latencies["pick"]],
+                "ban": [t for g in self.finished for t in g.lock_latencies["ban"]],
+                "missed": sum(g.missed_turns for g in self.finished),
+                "games": len(self.finished),
+            }
+
+
+def serve(games: int, seed: int, ports):
+    """Stand-in process: serve the scripted games until killed."""
+    lcu = ScriptedLCU(games, seed)
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def _reply(self, method: str):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+            if self.path == "/bench/results":
+                status, data = 200, lcu.results()
+            else:
+                status, data = lcu.handle(method, self.path, body)
+            payload = json.dumps(data).encode() if data is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        
+        def do_GET(self):
+            self._reply("GET")
+        
+        def do_POST(self):
+            self._reply("POST")
+        
+        def do_PATCH(self):
+            self._reply("PATCH")
+        
+        def log_message(self, *args):
+            pass
+    
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    ports.put(httpd.server_address[1])
+    httpd.serve_forever()
+
+
+def percentile(samples: List[float], p: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+
+def report(label: str, samples: List[float]):
+    if not samples:
+        print(f"  {label:<24} no samples")
+        return
+    p50 = statistics.median(samples) * 1000
+    p99 = percentile(samples, 99) * 1000
+    print(f"  {label:<24} p50 {p50:7.1f} ms   p99 {p99:7.1f} ms   n={len(samples)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(args.games, args.seed, ports), daemon=True)
+    server.start()
+    port = ports.get(timeout=30)
+    
+    client = LCUConnection()
+    client.lcu_credentials = ClientCredentials(port, "benchmark", protocol="http")
+    client.status = ConnectionStatus.CONNECTED
+    results_url = f"http://127.0.0.1:{port}/bench/results"
+    
+    engine = AutomationEngine(client)
+    engine.owned_champion_ids = frozenset(CHAMPIONS)
+    engine.config = CONFIG
+    
+    print(f"{args.games} games, seed {args.seed}\n")
+    with contextlib.redirect_stdout(io.StringIO()):  # automation log
+        cpu = time.process_time()
+        start = time.monotonic()
+        engine.start()
+        while not requests.get(results_url).json()["done"]:
+            time.sleep(0.5)
+        engine.stop()
+        cpu = time.process_time() - cpu
+        elapsed = time.monotonic() - start
+    results = requests.get(results_url).json()
+    server.terminate()
+    
+    games = results["games"]
+    report("ready check -> accept", results["ready"])
+    report("pick turn -> lock", results["pick"])
+    report("ban turn -> lock", results["ban"])
+    print(f"  {'CPU per game':<24} {cpu / games * 1000:7.1f} ms")
+    print(f"  {'requests per game':<24} {results['requests'] / games:7.1f}")
+    print(f"  {'missed ready checks':<24} {games - len(results['ready']):7d}")
+    print(f"  {'missed turns':<24} {results['missed']:7d}")
+    print(f"\n  {elapsed:.1f} s wall clock")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Fuzzy search benchmark over the champion, skin and icon name sets.
+
+Compares the original full-table Levenshtein scan against the bounded
+fuzzy_search and a prebuilt FuzzyIndex, using misspelt names
+drawn from each catalogue as queries.
+
+Usage: python benchmarks/bench_fuzzy.py [--queries N] [--threshold K]
+"""
+
+import argparse
+import random
+import time
+
+from _standin import synthetic_champions, synthetic_skins, synthetic_icons
+
+import utils
+from utils import FuzzyIndex, fuzzy_search
+
+
+def reference_levenshtein(s1: str, s2: str) -> int:
+    """The unbounded implementation fuzzy_search used to call."""
+    if len(s1) < len(s2):
+        return reference_levenshtein(s2, s1)
+    if len(s2) == 0:
+        return len(s1)
+    previous_row = range(len(s2) + 1)
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def reference_search(query, items, key, threshold):
+    query_lower = query.lower()
+    results = []
+    for item in items:
+        value = str(item.get(key, "")).lower()
+        if query_lower in value:
+            results.append((0, item))
+        else:
+            distance = reference_levenshtein(query_lower, value)
+            if distance <= threshold:
+                results.append((distance, item))
+    results.sort(key=lambda x: x[0])
+    return [item for _, item in results]
+
+
+def misspell(rng: random.Random, text: str) -> str:
+    """Apply one random substitution, deletion or transposition."""
+    if len(text) < 3:
+        return text
+    i = rng.randrange(1, len(text) - 1)
+    edit = rng.choice("sdt")
+    if edit == "s":
+        return text[:i] + rng.choice("aeiourst") + text[i + 1:]
+    if edit == "d":
+        return text[:i] + text[i + 1:]
+    return text[:i - 1] + text[i] + text[i - 1] + text[i + 1:]
+
+
+def timed(label: str, fn, queries, baseline=None) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    per_query = (time.perf_counter() - start) / len(queries) * 1000
+    speedup = f"  {baseline / per_query:7.1f}x" if baseline else ""
+    print(f"  {label:<28} {per_query:9.2f} ms/query{speedup}")
+    return per_query
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--threshold", type=int, default=3)
+    args = parser.parse_args()
+    
+    rng = random.Random(7)
+    champions = [c for c in synthetic_champions() if c["id"] != -1]
+    skins = list(synthetic_skins(champions).values())
+    icons = synthetic_icons()
+    datasets = [
+        ("champions", champions, "name"),
+        ("skins", skins, "name"),
+        ("icons", icons, "title"),
+    ]
+    
+    backend = "rapidfuzz" if utils._rapid_levenshtein is not None else "pure Python"
+    print(f"distance backend: {backend}, threshold {args.threshold}")
+    
+    for name, items, key in datasets:
+        queries = [misspell(rng, str(rng.choice(items)[key])) for _ in range(args.queries)]
+        print(f"\n{name}: {len(items)} items")
+        
+        baseline = timed("full Levenshtein scan", lambda q: reference_search(q, items, key, args.threshold), queries)
+        timed("bounded fuzzy_search", lambda q: fuzzy_search(q, items, key, args.threshold), queries, baseline)
+        
+        start = time.perf_counter()
+        index = FuzzyIndex(items, key)
+        print(f"  {'FuzzyIndex build':<28} {(time.perf_counter() - start) * 1000:9.2f} ms")
+        timed("FuzzyIndex.search", lambda q: index.search(q, args.threshold), queries, baseline)
+        
+        for query in queries[:3]:
+            assert index.search(query, args.threshold) == reference_search(query, items, key, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
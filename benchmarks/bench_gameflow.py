@@ -0,0 +1,134 @@
+"""
+LCU request volume of the automation over a simulated day.
+
+Replays a scripted gameflow (lobby, queue, ready check, champion select,
+game, end of game; idle in between) on a simulated clock and counts the
+requests made by the old fixed one-second loop and by PhaseScheduler,
+with auto-accept and champion select automation enabled.
+
+Usage: python benchmarks/bench_gameflow.py [--hours H] [--games N]
+"""
+
+import argparse
+import contextlib
+import io
+from collections import Counter
+
+import _standin  # noqa: F401  (puts the application modules on the import path)
+
+from automation import PhaseScheduler
+from lcu import LCUResponse
+
+# One game, as (phase, seconds)
+GAME = [
+    ("Lobby", 120),
+    ("Matchmaking", 180),
+    ("ReadyCheck", 8),
+    ("ChampSelect", 90),
+    ("GameStart", 30),
+    ("InProgress", 1800),
+    ("WaitingForStats", 20),
+    ("EndOfGame", 120),
+]
+
+
+class ScriptedClient:
+    """LCU client answering from a phase timeline on a simulated clock."""
+    
+    is_connected = True
+    
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.now = 0.0
+        self.requests = Counter()
+    
+    def phase(self) -> str:
+        for start, end, phase in self.timeline:
+            if start <= self.now < end:
+                return phase
+        return "None"
+    
+    def lcu_get(self, endpoint: str) -> LCUResponse:
+        self.requests[self.phase()] += 1
+        phase = self.phase()
+        if endpoint == "/lol-gameflow/v1/gameflow-phase":
+            return LCUResponse(True, 200, phase)
+        if endpoint == "/lol-lobby/v2/lobby/matchmaking/search-state":
+            state = {"Matchmaking": "Searching", "ReadyCheck": "Found"}.get(phase, "Invalid")
+            return LCUResponse(True, 200, {"searchState": state})
+        if endpoint == "/lol-matchmaking/v1/ready-check" and phase == "Matchmaking":
+            return LCUResponse(True, 200, {"state": "Invalid", "playerResponse": "None"})
+        if endpoint == "/lol-matchmaking/v1/ready-check" and phase == "ReadyCheck":
+            return LCUResponse(True, 200, {"state": "InProgress", "playerResponse": "Accepted"})
+        if endpoint == "/lol-champ-select/v1/session" and phase == "ChampSelect":
+            return LCUResponse(True, 200, {"actions": []})
+        return LCUResponse(False, 404, None)
+    
+    def lcu_post(self, endpoint: str, body=None) -> LCUResponse:
+        self.requests[self.phase()] += 1
+        return LCUResponse(True, 204, None)
+
+
+def build_timeline(hours: float, games: int):
+    """Games spread evenly over the day, idle in the home screen between them."""
+    day = hours * 3600
+    game_length = sum(seconds for _, seconds in GAME)
+    gap = max(0.0, (day - games * game_length) / games)
+    timeline = []
+    t = 0.0
+    for _ in range(games):
+        t += gap
+        for phase, seconds in GAME:
+            timeline.append((t, t + seconds, phase))
+            t += seconds
+    return timeline, day
+
+
+def run_legacy(client: ScriptedClient, day: float):
+    """The old automation_loop: search state and session every second."""
+    while client.now < day:
+        state = client.lcu_get("/lol-lobby/v2/lobby/matchmaking/search-state")
+        if state.data.get("searchState") == "Found":
+            client.lcu_post("/lol-matchmaking/v1/ready-check/accept")
+        client.lcu_get("/lol-champ-select/v1/session")
+        client.now += 1.0
+
+
+def run_scheduler(client: ScriptedClient, day: float):
+    def ready_check():
+        return client.lcu_get("/lol-matchmaking/v1/ready-check").success
+    
+    scheduler = PhaseScheduler(client)
+    scheduler.on_phase("Matchmaking", tick=ready_check)
+    scheduler.on_phase("ReadyCheck", tick=ready_check)
+    scheduler.on_phase("ChampSelect", tick=lambda: client.lcu_get("/lol-champ-select/v1/session").success)
+    with contextlib.redirect_stdout(io.StringIO()):  # phase change log
+        while client.now < day:
+            client.now += scheduler.step(client.now)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=8)
+    parser.add_argument("--games", type=int, default=10)
+    args = parser.parse_args()
+    
+    timeline, day = build_timeline(args.hours, args.games)
+    results = []
+    for name, run in [("fixed 1 s loop", run_legacy), ("PhaseScheduler", run_scheduler)]:
+        client = ScriptedClient(timeline)
+        run(client, day)
+        results.append((name, client.requests))
+    
+    phases = ["None"] + [phase for phase, _ in GAME]
+    print(f"{args.hours:g} h with the client open, {args.games} games\n")
+    print(f"  {'phase':<16}" + "".join(f"{name:>18}" for name, _ in results))
+    for phase in phases:
+        print(f"  {phase:<16}" + "".join(f"{counts[phase]:>18,}" for _, counts in results))
+    totals = [sum(counts.values()) for _, counts in results]
+    print(f"  {'total':<16}" + "".join(f"{total:>18,}" for total in totals))
+    print(f"\n  {totals[0] / totals[1]:.1f}x fewer requests")
+
+
+if __name__ == "__main__":
+    main()
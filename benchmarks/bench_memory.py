@@ -0,0 +1,45 @@
+"""
+Memory benchmark: resident size of the skins catalogue.
+
+Compares keeping the parsed skins.json dict tree against the compact
+SkinRecord projection, measured with tracemalloc.
+
+Usage: python benchmarks/bench_memory.py
+"""
+
+import gc
+import json
+import tracemalloc
+
+from _standin import synthetic_catalogue
+
+from shared_data import _project_skins
+
+
+def retained_bytes(build) -> int:
+    """Bytes still allocated after build() returns and garbage is collected."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    raw = synthetic_catalogue()["skins.json"]
+    count = len(json.loads(raw))
+    
+    full = retained_bytes(lambda: json.loads(raw))
+    compact = retained_bytes(lambda: _project_skins(json.loads(raw)))
+    
+    print(f"skins: {count}")
+    print(f"raw dict tree:     {full / 1024 / 1024:8.2f} MiB")
+    print(f"SkinRecord table:  {compact / 1024 / 1024:8.2f} MiB")
+    print(f"reduction:         {full / compact:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
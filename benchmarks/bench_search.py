@@ -0,0 +1,77 @@
+"""
+Search latency benchmark: keystroke-to-results over the full catalogues.
+
+Types each query one character at a time and times SearchIndex.search for
+the first page after every keystroke, with the NumPy backend (when
+installed) and the pure-Python fallback, both as independent searches and
+through a SearchSession that narrows the previous keystroke's matches.
+
+Usage: python benchmarks/bench_search.py
+"""
+
+import statistics
+import time
+
+from _standin import synthetic_champions, synthetic_skins, synthetic_icons
+
+import search
+from search import SearchIndex, SearchSession
+from shared_data import _project_skins, _project_icons, _project_champions
+
+FRAME_MS = 1000 / 60
+
+QUERIES = ["star guardian", "pulsefire", "blood moon", "odysey", "59", "academy icon"]
+
+
+def keystrokes(query: str):
+    """Every prefix of query, as typed."""
+    return [query[:i] for i in range(1, len(query) + 1)]
+
+
+def measure(search) -> list:
+    timings = []
+    for query in QUERIES:
+        for typed in keystrokes(query):
+            start = time.perf_counter()
+            search(typed)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label: str, timings: list, build: str = ""):
+    timings = sorted(timings)
+    p50 = statistics.median(timings)
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    verdict = "ok" if p99 < FRAME_MS else "over budget"
+    print(f"  {label:<15} {build:<17} p50 {p50:6.2f} ms   p99 {p99:6.2f} ms   {verdict}")
+
+
+def main():
+    # Index the same projected records the application holds
+    champions = [c for c in synthetic_champions() if c["id"] != -1]
+    skins = list(_project_skins(synthetic_skins(champions)).values())
+    datasets = [
+        ("champions", _project_champions(champions), lambda c: c["name"], None),
+        ("skins", skins, lambda s: s.name, None),
+        ("icons", _project_icons(synthetic_icons()), lambda i: i["title"], lambda i: i["id"]),
+    ]
+    numpy = search.np
+    backends = [("numpy", numpy)] if numpy is not None else []
+    backends.append(("python", None))
+    
+    print(f"frame budget: {FRAME_MS:.1f} ms")
+    for name, records, text, ident in datasets:
+        print(f"\n{name}: {len(records)} records")
+        for backend, module in backends:
+            search.np = module
+            start = time.perf_counter()
+            index = SearchIndex(records, text, ident)
+            build = (time.perf_counter() - start) * 1000
+            report(backend, measure(index.search), f"build {build:6.1f} ms")
+            session = SearchSession(lambda: index)
+            report(f"{backend} session", measure(session.search))
+    search.np = numpy
+
+
+if __name__ == "__main__":
+    main()
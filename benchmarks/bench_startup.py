@@ -0,0 +1,98 @@
+"""
+Startup benchmark: time-to-ready of the Skins and Profile tabs.
+
+Serves a synthetic catalogue from a loopback stand-in with artificial
+latency and compares fetching datasets on first use (one at a time), the
+concurrent startup prefetch, and a warm start from the SQLite snapshot.
+
+Usage: python benchmarks/bench_startup.py [latency_seconds]
+"""
+
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from _standin import StandInServer, synthetic_catalogue
+
+import shared_data as shared_data_module
+import snapshot as snapshot_module
+from shared_data import shared_data
+
+# Datasets each tab needs before it can render
+TAB_DATASETS = {
+    "Skins": ["skins", "champions"],
+    "Profile": ["champions", "skins"],
+    "Icon Picker": ["icons"],
+}
+
+# Runs per mode; the median is reported
+ROUNDS = 5
+
+
+def reset():
+    """Drop all loaded datasets so each run starts cold."""
+    shared_data._init_state()
+
+
+def run_on_demand() -> dict:
+    """Old behaviour: each tab fetches what it needs when it is opened."""
+    reset()
+    start = time.perf_counter()
+    ready = {}
+    for tab, names in TAB_DATASETS.items():
+        for name in names:
+            shared_data._get_dataset(name)
+        ready[tab] = time.perf_counter() - start
+    return ready
+
+
+def run_prefetch() -> dict:
+    """Startup prefetch: all datasets are requested concurrently up front."""
+    reset()
+    start = time.perf_counter()
+    shared_data.prefetch()
+    ready = {}
+    for tab, names in TAB_DATASETS.items():
+        for name in names:
+            shared_data.wait_ready(name)
+        ready[tab] = time.perf_counter() - start
+    return ready
+
+
+def main():
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.15
+    files = synthetic_catalogue()
+    routes = {f"/{name}": body for name, body in files.items()}
+    routes["/content-metadata.json"] = json.dumps({"version": "bench"}).encode()
+    
+    with tempfile.TemporaryDirectory() as cache_dir, StandInServer(routes, latency) as server:
+        snapshot_module.CACHE_DIR = Path(cache_dir)
+        shared_data_module.CDN_BASE = server.base_url
+        shared_data_module.CDN_METADATA = f"{server.base_url}/content-metadata.json"
+        runs = {"on-demand": [], "prefetch": [], "snapshot": []}
+        for _ in range(ROUNDS):
+            # Cold runs start without the snapshot earlier runs wrote
+            for mode, run in (("on-demand", run_on_demand), ("prefetch", run_prefetch)):
+                for path in Path(cache_dir).iterdir():
+                    path.unlink()
+                runs[mode].append(run())
+            runs["snapshot"].append(run_prefetch())
+    
+    on_demand, prefetch, warm = (
+        {tab: statistics.median(run[tab] for run in runs[mode]) for tab in TAB_DATASETS}
+        for mode in ("on-demand", "prefetch", "snapshot")
+    )
+    print(f"latency per request: {latency * 1000:.0f} ms, median of {ROUNDS} runs")
+    print(f"{'tab':<14}{'on-demand':>12}{'prefetch':>12}{'snapshot':>12}")
+    for tab in TAB_DATASETS:
+        print(
+            f"{tab:<14}{on_demand[tab] * 1000:>10.1f}ms"
+            f"{prefetch[tab] * 1000:>10.1f}ms{warm[tab] * 1000:>10.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+DanZ Client Tool - Champion Select
+Turns consecutive champion select session snapshots into change events.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+
+@dataclass(frozen=True)
+class PhaseChanged:
+    """The session timer moved to another phase (PLANNING, BAN_PICK, FINALIZATION...)."""
+    phase: Optional[str]
+    previous: Optional[str]
+
+
+@dataclass(frozen=True)
+class ActionStarted:
+    """A pick or ban turn began."""
+    action_id: int
+    actor_cell_id: int
+    type: str
+    local: bool
+
+
+@dataclass(frozen=True)
+class ActionCompleted:
+    """A pick or ban was locked in."""
+    action_id: int
+    actor_cell_id: int
+    type: str
+    champion_id: int
+    local: bool
+
+
+@dataclass(frozen=True)
+class BanAdded:
+    """A champion was banned."""
+    champion_id: int
+
+
+@dataclass(frozen=True)
+class IntentChanged:
+    """A teammate hovered another champion (0 when cleared)."""
+    cell_id: int
+    champion_id: int
+
+
+@dataclass(frozen=True)
+class TradeRequested:
+    """Another player asked to trade champions with us."""
+    trade_id: int
+    cell_id: int
+
+
+SessionEvent = Union[PhaseChanged, ActionStarted, ActionCompleted, BanAdded, IntentChanged, TradeRequested]
+
+
+class SessionTracker:
+    """
+    Diffs each champion select session against the previous one.
+    
+    Actions are compared by id, so a snapshot where nothing happened costs
+    one dict lookup per action and yields no events. The champions no one
+    can pick any more (bans and other players' locked picks) are kept as a
+    set that only grows as events arrive.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Forget the session (on leaving champion select)."""
+        self.local_cell_id = -1
+        self.position = ""
+        self.phase: Optional[str] = None
+        # Action id -> (in progress, completed)
+        self._actions: Dict[int, Tuple[bool, bool]] = {}
+        # Our actions not yet completed: action id -> (type, in progress)
+        self.local_actions: Dict[int, Tuple[str, bool]] = {}
+        self.banned: Set[int] = set()
+        self.unavailable: Set[int] = set()
+        # Teammates' hovered champions by cell id
+        self.intents: Dict[int, int] = {}
+        self._trades: Dict[int, str] = {}
+    
+    def update(self, session: Dict) -> List[SessionEvent]:
+        """Record a new snapshot and return what changed since the last one."""
+        events: List[SessionEvent] = []
+        self.local_cell_id = session.get("localPlayerCellId", -1)
+        
+        phase = session.get("timer", {}).get("phase")
+        if phase != self.phase:
+            events.append(PhaseChanged(phase, self.phase))
+            self.phase = phase
+        
+        for action_group in session.get("actions", []):
+            for action in action_group:
+                self._update_action(action, events)
+        
+        bans = session.get("bans", {})
+        for ban in bans.get("myTeamBans", []) + bans.get("theirTeamBans", []):
+            self._add_ban(ban.get("championId", 0) if isinstance(ban, dict) else ban, events)
+        
+        for member in session.get("myTeam", []):
+            cell_id = member.get("cellId")
+            if cell_id == self.local_cell_id:
+                self.position = (member.get("assignedPosition") or "").lower()
+                continue
+            intent = member.get("championPickIntent") or 0
+            if self.intents.get(cell_id, 0) != intent:
+                self.intents[cell_id] = intent
+                events.append(IntentChanged(cell_id, intent))
+        
+        for trade in session.get("trades", []):
+            trade_id = trade.get("id")
+            state = trade.get("state", "")
+            if self._trades.get(trade_id) != state:
+                self._trades[trade_id] = state
+                if state == "RECEIVED":
+                    events.append(TradeRequested(trade_id, trade.get("cellId", -1)))
+        return events
+    
+    def _update_action(self, action: Dict, events: List[SessionEvent]):
+        action_id = action.get("id")
+        state = (bool(action.get("isInProgress")), bool(action.get("completed")))
+        previous = self._actions.get(action_id)
+        if state == previous:
+            return
+        self._actions[action_id] = state
+        was_in_progress, was_completed = previous or (False, False)
+        in_progress, completed = state
+        
+        actor_cell_id = action.get("actorCellId", -1)
+        action_type = action.get("type", "")
+        local = actor_cell_id == self.local_cell_id
+        if local:
+            if completed:
+                self.local_actions.pop(action_id, None)
+            else:
+                self.local_actions[action_id] = (action_type, in_progress)
+        
+        if in_progress and not was_in_progress and not completed:
+            events.append(ActionStarted(action_id, actor_cell_id, action_type, local))
+        if completed and not was_completed:
+            champion_id = action.get("championId", 0)
+            events.append(ActionCompleted(action_id, actor_cell_id, action_type, champion_id, local))
+            if action_type == "ban":
+                self._add_ban(champion_id, events)
+            elif action_type == "pick" and champion_id and not local:
+                self.unavailable.add(champion_id)
+    
+    def _add_ban(self, champion_id: int, events: List[SessionEvent]):
+        if champion_id and champion_id not in self.banned:
+            self.banned.add(champion_id)
+            self.unavailable.add(champion_id)
+            events.append(BanAdded(champion_id))
+    
+    def teammate_intents(self) -> Set[int]:
+        """Champions teammates are hovering."""
+        return {champion_id for champion_id in self.intents.values() if champion_id}
@@ -3,15 +3,21 @@ DanZ Client Tool - Champion Picker Dialog
 A grid-based champion picker for selecting champions.
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QScrollArea,
     QWidget, QGridLayout, QLabel, QPushButton, QFrame
 )
-from PySide6.QtCore import Qt, QSize, Signal, QUrl, QTimer
+from PySide6.QtCore import Qt, QSize, QRect, Signal, QTimer
 from PySide6.QtGui import QPixmap, QCursor
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 from shared_data import shared_data
+from image_loader import image_loader, ImageRequest, PRIORITY_VISIBLE, PRIORITY_NORMAL
+from image_cache import pixmap_cache
+
+# Size icons are displayed and cached at
+ICON_SIZE = 48
 
 
 class ChampionButton(QLabel):
@@ -36,6 +42,7 @@ class ChampionButton(QLabel):
             }
         """)
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.image_request: Optional[ImageRequest] = None
         self.setToolTip(name)
         self.setText("...")
         
@@ -45,8 +52,8 @@ class ChampionButton(QLabel):
         super().mousePressEvent(event)
     
     def set_pixmap(self, pixmap: QPixmap):
-        scaled = pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.setPixmap(scaled)
+        """Show an icon already decoded at ICON_SIZE."""
+        self.setPixmap(pixmap)
         self.setText("")
 
 
@@ -62,10 +69,10 @@ class ChampionPickerDialog(QDialog):
         self.resize(560, 500)
         self.setModal(True)
         
-        self.network_manager = QNetworkAccessManager(self)
-        self.icon_cache: dict[str, QPixmap] = {}
         self.champ_buttons: list[ChampionButton] = []
+        self.image_requests: list[ImageRequest] = []
         self.mastery_data = mastery_data or {}
+        self.search_session = shared_data.search_session("champions")
         
         # Debounce timer
         self.search_timer = QTimer()
@@ -115,6 +122,7 @@ class ChampionPickerDialog(QDialog):
         
         # Champion grid in scroll area
         scroll = QScrollArea()
+        self.scroll = scroll
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -133,6 +141,7 @@ class ChampionPickerDialog(QDialog):
         self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         
         scroll.setWidget(self.grid_container)
+        scroll.verticalScrollBar().valueChanged.connect(self._prioritize_visible)
         layout.addWidget(scroll, 1)
         
         # Selected preview and buttons
@@ -190,7 +199,9 @@ class ChampionPickerDialog(QDialog):
         
     def load_champions(self, query: str):
         """Load champions matching query into the grid."""
-        # Clear existing
+        # Clear existing, dropping downloads for icons that will never be shown
+        image_loader().cancel_all(self.image_requests)
+        self.image_requests.clear()
         for btn in self.champ_buttons:
             btn.deleteLater()
         self.champ_buttons.clear()
@@ -200,15 +211,11 @@ class ChampionPickerDialog(QDialog):
         if not champs:
             return
             
-        # Filter
-        query_lower = query.lower()
-        if query_lower:
-            filtered = [c for c in champs if query_lower in c.get('name', '').lower() and c['id'] != -1]
+        # Best matches first; everything by name when there is no query
+        if query.strip():
+            filtered = [c for c in self.search_session.search(query, page_size=None).items if c['id'] != -1]
         else:
-            filtered = [c for c in champs if c['id'] != -1]
-            
-        # Sort by name
-        filtered.sort(key=lambda x: x.get('name', ''))
+            filtered = sorted((c for c in champs if c['id'] != -1), key=lambda x: x.get('name', ''))
             
         self.result_label.setText(f"{len(filtered)} champions")
         
@@ -229,28 +236,27 @@ class ChampionPickerDialog(QDialog):
             
             # Load the champion icon
             self._load_icon(btn, champ_id)
+        
+        self._prioritize_visible()
             
     def _load_icon(self, btn: ChampionButton, champ_id: int):
         url = shared_data.get_champion_icon_url(champ_id)
+        btn.image_request = image_loader().load(url, ICON_SIZE, ICON_SIZE, lambda pixmap: self._on_icon_loaded(btn, pixmap))
+        self.image_requests.append(btn.image_request)
+        
+    def _prioritize_visible(self):
+        """Fetch icons in the scrolled-to part of the grid before the rest."""
+        self.grid_layout.activate()
+        viewport = self.scroll.viewport()
+        visible = QRect(0, self.scroll.verticalScrollBar().value(), viewport.width(), viewport.height())
+        for btn in self.champ_buttons:
+            if btn.image_request is not None:
+                on_screen = btn.geometry().intersects(visible)
+                btn.image_request.set_priority(PRIORITY_VISIBLE if on_screen else PRIORITY_NORMAL)
         
-        # Check cache
-        if url in self.icon_cache:
-            btn.set_pixmap(self.icon_cache[url])
-            return
-            
-        request = QNetworkRequest(QUrl(url))
-        reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self._on_icon_loaded(reply, btn, url))
-        
-    def _on_icon_loaded(self, reply: QNetworkReply, btn: ChampionButton, url: str):
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            data = reply.readAll()
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            if not pixmap.isNull():
-                self.icon_cache[url] = pixmap
-                btn.set_pixmap(pixmap)
-        reply.deleteLater()
+    def _on_icon_loaded(self, btn: ChampionButton, pixmap: Optional[QPixmap]):
+        if pixmap is not None:
+            btn.set_pixmap(pixmap)
         
     def on_champion_clicked(self, champ_id: int, name: str):
         self.selected_champ_id = champ_id
@@ -262,8 +268,9 @@ class ChampionPickerDialog(QDialog):
         
         # Set preview image
         url = shared_data.get_champion_icon_url(champ_id)
-        if url in self.icon_cache:
-            scaled = self.icon_cache[url].scaled(44, 44, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        cached = pixmap_cache.get(url, ICON_SIZE, ICON_SIZE)
+        if cached is not None:
+            scaled = cached.scaled(44, 44, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             self.preview_label.setPixmap(scaled)
         
         # Highlight selected
@@ -295,3 +302,8 @@ class ChampionPickerDialog(QDialog):
         if self.selected_champ_id is not None:
             self.champion_selected.emit(self.selected_champ_id, self.selected_champ_name)
             self.accept()
+            
+    def done(self, result: int):
+        image_loader().cancel_all(self.image_requests)
+        self.image_requests.clear()
+        super().done(result)
@@ -3,7 +3,7 @@ DanZ Client Tool - Champions Tab
 Champion collection viewer with detailed table.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 import threading
 
 from PySide6.QtWidgets import (
@@ -12,10 +12,10 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal, QObject
 from PySide6.QtGui import QColor, QFont
-from PySide6.QtNetwork import QNetworkAccessManager
 
 from lcu import lcu
 from shared_data import shared_data
+from search import SearchIndex, SearchSession
 from utils import format_number
 
 
@@ -32,8 +32,9 @@ class ChampsTab(QWidget):
         self.signals = DataSignals()
         self.champions: List[Dict] = []
         self.mastery_map: Dict[int, Dict] = {}
-        self.network_manager = QNetworkAccessManager()
         self.has_loaded = False
+        self.search_index: Optional[SearchIndex] = None
+        self.search_session = SearchSession(lambda: self.search_index)
         
         self.setup_ui()
         self.signals.data_loaded.connect(self.display_champions)
@@ -265,15 +266,19 @@ class ChampsTab(QWidget):
         # For true sorting we should subclass QTreeWidgetItem and override __lt__.
         # For now, default sort by Name (Ascending)
         self.tree.sortItems(0, Qt.SortOrder.AscendingOrder)
+        
+        # Search by name or id
+        self.search_index = SearchIndex(items, lambda item: item.text(0), lambda item: item.text(4))
+        self.filter_champions(self.search_input.text())
     
     def filter_champions(self, text: str):
         """Filter champions by search text."""
-        text_lower = text.lower()
+        if self.search_index is None:
+            return
+        matches = None
+        if text.strip():
+            matches = {id(item) for item in self.search_session.search(text, page_size=None, fuzzy=False).items}
         root = self.tree.invisibleRootItem()
         for i in range(root.childCount()):
             item = root.child(i)
-            match = (
-                text_lower in item.text(0).lower() or 
-                text_lower in item.text(4)
-            )
-            item.setHidden(not match)
+            item.setHidden(matches is not None and id(item) not in matches)
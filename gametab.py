@@ -5,18 +5,20 @@ Lobby control and champion select automation features.
 
 import threading
 import time
-import random
-from typing import Optional, List, Dict, Any
+from dataclasses import replace
+from typing import List, Dict, Any
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
     QLabel, QPushButton, QComboBox, QCheckBox, QSpinBox,
     QLineEdit, QScrollArea, QFrame, QSlider
 )
-from PySide6.QtCore import Qt, Signal, QObject
+from PySide6.QtCore import Qt, Signal, QObject, QFileSystemWatcher
 
 from lcu import lcu
 from shared_data import shared_data
+from automation import ANY_ROLE, PRESETS_FILE, AutomationConfig, AutomationEngine, load_presets, save_presets
+from toast import ToastManager
 from i18n import t
 
 
@@ -24,9 +26,20 @@ class WorkerSignals(QObject):
     """Signals for background worker thread."""
     update = Signal(str)
     side_detected = Signal(str)
+    ready_check_accepted = Signal(float)
     champs_loaded = Signal(list, list)
 
 
+# Pick priority roles: label -> assigned position in champion select
+PICK_ROLES = {
+    "ANY": ANY_ROLE,
+    "TOP": "top",
+    "JUNGLE": "jungle",
+    "MIDDLE": "middle",
+    "BOTTOM": "bottom",
+    "UTILITY": "utility",
+}
+
 # Queue IDs for different game modes
 QUEUE_IDS = {
     "Quickplay": 490,
@@ -46,7 +59,14 @@ class GameTab(QWidget):
         super().__init__()
         self.worker_signals = WorkerSignals()
         self.automation_running = False
-        self.automation_thread: Optional[threading.Thread] = None
+        
+        # The engine runs on its own threads and only sees AutomationConfig
+        # snapshots published from the controls
+        self.engine = AutomationEngine()
+        self.engine.on_side_detected = self.worker_signals.side_detected.emit
+        self.engine.on_ready_check_accepted = self.worker_signals.ready_check_accepted.emit
+        self.presets = load_presets()
+        self._applying_config = False
         
         # Champion data
         self.owned_champions: List[Dict] = []
@@ -54,6 +74,7 @@ class GameTab(QWidget):
         
         self.setup_ui()
         self.connect_signals()
+        self.apply_preset(self.queue_combo.currentText())
         self.load_champions()
     
     def showEvent(self, event):
@@ -123,6 +144,10 @@ class GameTab(QWidget):
         self.dodge_btn.clicked.connect(self.dodge_game)
         btn_layout.addWidget(self.dodge_btn)
         
+        self.save_preset_btn = QPushButton(t("save_preset"))
+        self.save_preset_btn.clicked.connect(self.save_preset)
+        btn_layout.addWidget(self.save_preset_btn)
+        
         btn_layout.addStretch()
         lobby_layout.addLayout(btn_layout, 1, 0, 1, 6)
         content_layout.addWidget(self.lobby_group)
@@ -188,6 +213,41 @@ class GameTab(QWidget):
         self.dodge_if_banned = QCheckBox(t("dodge_if_banned"))
         strategy_layout.addWidget(self.dodge_if_banned, 2, 2)
         
+        # Lock margin: latest lock time before the pick timer runs out
+        self.lock_margin_label = QLabel(t("lock_margin"))
+        strategy_layout.addWidget(self.lock_margin_label, 3, 0)
+        self.lock_margin = QSpinBox()
+        self.lock_margin.setRange(0, 10000)
+        self.lock_margin.setSingleStep(250)
+        self.lock_margin.setValue(1000)
+        self.lock_margin.setSuffix(" ms")
+        strategy_layout.addWidget(self.lock_margin, 3, 1)
+        
+        # Role picks: champions tried first, in order, for an assigned role
+        self.role_picks_label = QLabel(t("role_picks"))
+        strategy_layout.addWidget(self.role_picks_label, 4, 0)
+        
+        role_pick_layout = QHBoxLayout()
+        self.role_combo = QComboBox()
+        for label, role in PICK_ROLES.items():
+            self.role_combo.addItem(label, role)
+        role_pick_layout.addWidget(self.role_combo)
+        self.role_pick_combo = QComboBox()
+        self.role_pick_combo.addItem(t("select"), 0)
+        role_pick_layout.addWidget(self.role_pick_combo)
+        self.add_role_pick_btn = QPushButton(t("add_pick"))
+        self.add_role_pick_btn.clicked.connect(self.add_role_pick)
+        role_pick_layout.addWidget(self.add_role_pick_btn)
+        self.clear_role_picks_btn = QPushButton(t("clear_picks"))
+        self.clear_role_picks_btn.clicked.connect(self.clear_role_picks)
+        role_pick_layout.addWidget(self.clear_role_picks_btn)
+        strategy_layout.addLayout(role_pick_layout, 4, 1)
+        
+        self.role_picks_view = QLabel("")
+        self.role_picks_view.setWordWrap(True)
+        self.role_picks_view.setStyleSheet("color: #a1a1aa;")
+        strategy_layout.addWidget(self.role_picks_view, 4, 2)
+        
         content_layout.addWidget(self.strategy_group)
         
         # --- General Automation Group ---
@@ -261,6 +321,7 @@ class GameTab(QWidget):
         self.create_lobby_btn.setText(t("create_lobby"))
         self.start_queue_btn.setText(t("find_match"))
         self.dodge_btn.setText(t("dodge_queue"))
+        self.save_preset_btn.setText(t("save_preset"))
         
         self.strategy_group.setTitle(t("champion_select"))
         self.instalock_check.setText(t("instalock_champion"))
@@ -270,6 +331,11 @@ class GameTab(QWidget):
         self.delay_label_2.setText(t("delay"))
         self.backup_pick_label.setText(t("backup_pick"))
         self.dodge_if_banned.setText(t("dodge_if_banned"))
+        self.lock_margin_label.setText(t("lock_margin"))
+        self.role_picks_label.setText(t("role_picks"))
+        self.role_pick_combo.setItemText(0, t("select"))
+        self.add_role_pick_btn.setText(t("add_pick"))
+        self.clear_role_picks_btn.setText(t("clear_picks"))
         
         self.auto_group.setTitle(t("automation_tools"))
         self.auto_accept_check.setText(t("auto_accept"))
@@ -288,7 +354,158 @@ class GameTab(QWidget):
         """Connect worker signals to UI updates."""
         self.worker_signals.update.connect(self.update_automation_status)
         self.worker_signals.side_detected.connect(self.show_side)
+        self.worker_signals.ready_check_accepted.connect(self.show_accept_latency)
         self.worker_signals.champs_loaded.connect(self.populate_champion_combos)
+        
+        # Publish a new settings snapshot whenever a control changes
+        for check in (self.auto_accept_check, self.instalock_check, self.auto_ban_check,
+                      self.dodge_if_banned, self.instant_mute, self.side_notify, self.instant_msg_check):
+            check.toggled.connect(self.publish_config)
+        for combo in (self.instalock_combo, self.backup_combo, self.auto_ban_combo):
+            combo.currentIndexChanged.connect(self.publish_config)
+        for value in (self.instalock_delay, self.autoban_delay, self.lock_margin):
+            value.valueChanged.connect(self.publish_config)
+        self.instant_msg_input.textChanged.connect(self.publish_config)
+        self.queue_combo.currentTextChanged.connect(self.apply_preset)
+        self.role_combo.currentIndexChanged.connect(self.show_role_picks)
+        
+        # Presets edited outside the tool apply without a restart
+        self.presets_watcher = QFileSystemWatcher(self)
+        self.presets_watcher.addPath(str(PRESETS_FILE.parent))
+        if PRESETS_FILE.exists():
+            self.presets_watcher.addPath(str(PRESETS_FILE))
+        self.presets_watcher.fileChanged.connect(self.reload_presets)
+        self.presets_watcher.directoryChanged.connect(self.reload_presets)
+    
+    def read_config(self) -> AutomationConfig:
+        """Automation settings as currently shown in the controls."""
+        return self._config_from_controls(self.engine.config)
+    
+    def _config_from_controls(self, current: AutomationConfig) -> AutomationConfig:
+        # Settings without a control, and champions while their list is not
+        # loaded yet, come from current
+        return AutomationConfig(
+            auto_accept=self.auto_accept_check.isChecked(),
+            instalock=self.instalock_check.isChecked(),
+            instalock_champion=self._selected_champion(self.instalock_combo, current.instalock_champion),
+            backup_champion=self._selected_champion(self.backup_combo, current.backup_champion),
+            pick_priorities=current.pick_priorities,
+            pick_delay_ms=self.instalock_delay.value(),
+            lock_margin_ms=self.lock_margin.value(),
+            dodge_if_unavailable=self.dodge_if_banned.isChecked(),
+            auto_ban=self.auto_ban_check.isChecked(),
+            ban_champion=self._selected_champion(self.auto_ban_combo, current.ban_champion),
+            ban_delay_ms=self.autoban_delay.value(),
+            instant_mute=self.instant_mute.isChecked(),
+            reveal_side=self.side_notify.isChecked(),
+            instant_message=self.instant_msg_check.isChecked(),
+            message=self.instant_msg_input.text(),
+        )
+    
+    def publish_config(self, *_):
+        """Hand the engine a snapshot of the current settings."""
+        if not self._applying_config:
+            self.engine.config = self.read_config()
+    
+    def apply_config(self, config: AutomationConfig):
+        """Show settings in the controls and publish them."""
+        self._applying_config = True
+        try:
+            self.auto_accept_check.setChecked(config.auto_accept)
+            self.instalock_check.setChecked(config.instalock)
+            self._select_champion(self.instalock_combo, config.instalock_champion)
+            self._select_champion(self.backup_combo, config.backup_champion)
+            self.instalock_delay.setValue(config.pick_delay_ms)
+            self.lock_margin.setValue(config.lock_margin_ms)
+            self.dodge_if_banned.setChecked(config.dodge_if_unavailable)
+            self.auto_ban_check.setChecked(config.auto_ban)
+            self._select_champion(self.auto_ban_combo, config.ban_champion)
+            self.autoban_delay.setValue(config.ban_delay_ms)
+            self.instant_mute.setChecked(config.instant_mute)
+            self.side_notify.setChecked(config.reveal_side)
+            self.instant_msg_check.setChecked(config.instant_message)
+            self.instant_msg_input.setText(config.message)
+        finally:
+            self._applying_config = False
+        # Champions are kept as they are until the lists are loaded; after
+        # that the engine gets exactly what the controls show
+        self.engine.config = self._config_from_controls(config)
+        self.show_role_picks()
+    
+    @staticmethod
+    def _selected_champion(combo: QComboBox, current: int) -> int:
+        # Until champions are loaded the list only holds its placeholder
+        if combo.count() <= 1:
+            return current
+        return combo.currentData() or 0
+    
+    @staticmethod
+    def _select_champion(combo: QComboBox, champ_id: int):
+        index = combo.findData(champ_id)
+        combo.setCurrentIndex(max(index, 0))
+    
+    def apply_preset(self, queue_name: str):
+        """Load the saved automation preset for a queue.
+        
+        Queues without a preset keep what the controls show, but drop the
+        role pick lists, which have no control and belong to the queue they
+        were saved for.
+        """
+        preset = self.presets.get(queue_name)
+        if preset is None:
+            preset = replace(self.read_config(), pick_priorities=())
+        self.apply_config(preset)
+    
+    def reload_presets(self, *_):
+        """Re-read the presets file after it changed on disk."""
+        # Editors that replace the file drop it from the watch list
+        if PRESETS_FILE.exists() and str(PRESETS_FILE) not in self.presets_watcher.files():
+            self.presets_watcher.addPath(str(PRESETS_FILE))
+        presets = load_presets()
+        if presets == self.presets:
+            return
+        self.presets = presets
+        preset = presets.get(self.queue_combo.currentText())
+        if preset is not None:
+            self.apply_config(preset)
+    
+    def add_role_pick(self):
+        """Append the selected champion to the selected role's pick list."""
+        champ_id = self.role_pick_combo.currentData()
+        if not champ_id:
+            return
+        role = self.role_combo.currentData()
+        config = self.read_config()
+        priorities = dict(config.pick_priorities)
+        if champ_id not in priorities.get(role, ()):
+            priorities[role] = priorities.get(role, ()) + (champ_id,)
+            self.engine.config = replace(config, pick_priorities=priorities)
+        self.show_role_picks()
+    
+    def clear_role_picks(self):
+        """Empty the selected role's pick list."""
+        role = self.role_combo.currentData()
+        config = self.read_config()
+        priorities = {r: ids for r, ids in config.pick_priorities if r != role}
+        self.engine.config = replace(config, pick_priorities=priorities)
+        self.show_role_picks()
+    
+    def show_role_picks(self, *_):
+        """Show the selected role's pick list, best first."""
+        config = self.engine.config
+        names = {c.get("id"): c.get("name", "") for c in self.owned_champions}
+        picks = config.priorities_for(self.role_combo.currentData())
+        self.role_picks_view.setText(" > ".join(names.get(cid) or str(cid) for cid in picks))
+    
+    def save_preset(self):
+        """Save the current automation settings for the selected queue."""
+        queue_name = self.queue_combo.currentText()
+        self.presets[queue_name] = self.engine.config
+        try:
+            save_presets(self.presets)
+            ToastManager.success(f"Saved automation preset for {queue_name}")
+        except OSError as e:
+            ToastManager.error(f"Could not save preset: {e}")
     
     def load_champions(self):
         """Load champion data from LCU."""
@@ -343,6 +560,11 @@ class GameTab(QWidget):
     
     def populate_champion_combos(self, owned: List[Dict], all_champs: List[Dict]):
         """Populate champion combo boxes."""
+        self.engine.owned_champion_ids = frozenset(c.get("id") for c in owned if c.get("id"))
+        # Refilling the lists must not publish half-filled settings
+        config = self.engine.config
+        self._applying_config = True
+        
         # Instalock combo - owned champs + Random
         self.instalock_combo.clear()
         self.instalock_combo.addItem("Random", 0)
@@ -352,6 +574,15 @@ class GameTab(QWidget):
             if name and cid:
                 self.instalock_combo.addItem(name, cid)
         
+        # Role pick combo - owned champs
+        self.role_pick_combo.clear()
+        self.role_pick_combo.addItem(t("select"), 0)
+        for champ in owned:
+            name = champ.get("name", "")
+            cid = champ.get("id", 0)
+            if name and cid:
+                self.role_pick_combo.addItem(name, cid)
+        
         # Backup combo - owned champs + None
         self.backup_combo.clear()
         self.backup_combo.addItem("None", 0)
@@ -370,6 +601,9 @@ class GameTab(QWidget):
             if name and cid:
                 self.auto_ban_combo.addItem(name, cid)
         
+        self._applying_config = False
+        self.apply_config(config)
+        
         self.worker_signals.update.emit(f"Loaded {len(owned)} owned champions")
     
     def create_lobby(self):
@@ -424,7 +658,7 @@ class GameTab(QWidget):
         """Dodge the current champion select."""
         if not lcu.is_connected:
             return
-        lcu.lcds_invoke("teambuilder-draft", "quitV2", [])
+        self.engine.dodge()
     
     def toggle_automation(self):
         """Toggle the automation thread."""
@@ -434,7 +668,7 @@ class GameTab(QWidget):
             self.start_automation()
     
     def start_automation(self):
-        """Start the automation background thread."""
+        """Start the automation scheduler."""
         self.automation_running = True
         self.start_auto_btn.setText(t("stop_automation"))
         self.start_auto_btn.setProperty("primary", False)
@@ -447,12 +681,13 @@ class GameTab(QWidget):
         self.automation_status.setText(t("automation_running"))
         self.automation_status.setStyleSheet("color: #22c55e; font-weight: 600;")
         
-        self.automation_thread = threading.Thread(target=self.automation_loop, daemon=True)
-        self.automation_thread.start()
+        self.publish_config()
+        self.engine.start()
     
     def stop_automation(self):
-        """Stop the automation thread."""
+        """Stop the automation scheduler."""
         self.automation_running = False
+        self.engine.stop()
         self.start_auto_btn.setText(t("start_automation"))
         self.start_auto_btn.setProperty("danger", False)
         self.start_auto_btn.setProperty("primary", True)
@@ -464,175 +699,21 @@ class GameTab(QWidget):
         self.automation_status.setText(t("automation_stopped"))
         self.automation_status.setStyleSheet("color: #71717a; font-weight: 600;")
     
-    def automation_loop(self):
-        """Background automation loop."""
-        in_champ_select = False
-        
-        while self.automation_running:
-            if not lcu.is_connected:
-                time.sleep(1)
-                continue
-            
-            try:
-                # Check matchmaking state for auto-accept
-                if self.auto_accept_check.isChecked():
-                    mm_state = lcu.lcu_get("/lol-lobby/v2/lobby/matchmaking/search-state")
-                    if mm_state.success and mm_state.data:
-                        search_state = mm_state.data.get("searchState", "")
-                        if search_state == "Found":
-                            lcu.lcu_post("/lol-matchmaking/v1/ready-check/accept")
-                
-                # Check champion select
-                cs_response = lcu.lcu_get("/lol-champ-select/v1/session")
-                
-                if cs_response.success and cs_response.data:
-                    session = cs_response.data
-                    
-                    # First time entering champ select
-                    if not in_champ_select:
-                        in_champ_select = True
-                        self.on_enter_champ_select(session)
-                    
-                    # Process actions
-                    self.process_champ_select(session)
-                else:
-                    in_champ_select = False
-                
-            except Exception as e:
-                pass
-            
-            time.sleep(1)
-    
-    def on_enter_champ_select(self, session: Dict):
-        """Called when first entering champion select."""
-        # Side notification
-        if self.side_notify.isChecked():
-            my_team = session.get("myTeam", [])
-            if my_team:
-                team = my_team[0].get("team", 1)
-                side = "Blue Side" if team == 1 else "Red Side"
-                self.worker_signals.side_detected.emit(side)
-        
-        # Instant mute
-        if self.instant_mute.isChecked():
-            local_cell = session.get("localPlayerCellId")
-            my_team = session.get("myTeam", [])
-            for member in my_team:
-                if member.get("cellId") != local_cell:
-                    body = {"puuid": member.get("puuid", "")}
-                    lcu.lcu_post("/lol-champ-select/v1/toggle-player-muted", body)
-        
-        # Instant message
-        if self.instant_msg_check.isChecked():
-            msg = self.instant_msg_input.text()
-            if msg:
-                time.sleep(1)  # Small delay for chat to load
-                convos = lcu.lcu_get("/lol-chat/v1/conversations")
-                if convos.success and convos.data:
-                    for convo in convos.data:
-                        if convo.get("type") == "championSelect":
-                            convo_id = convo.get("id")
-                            lcu.lcu_post(f"/lol-chat/v1/conversations/{convo_id}/messages", {"body": msg})
-                            break
-    
-    def process_champ_select(self, session: Dict):
-        """Process champion select actions."""
-        local_cell_id = session.get("localPlayerCellId", -1)
-        actions = session.get("actions", [])
-        
-        # Get banned champion IDs
-        bans = session.get("bans", {})
-        banned_ids = set()
-        for ban in bans.get("myTeamBans", []) + bans.get("theirTeamBans", []):
-            if isinstance(ban, dict):
-                banned_ids.add(ban.get("championId"))
-            elif isinstance(ban, int):
-                banned_ids.add(ban)
-        
-        for action_group in actions:
-            for action in action_group:
-                if action.get("actorCellId") != local_cell_id:
-                    continue
-                if action.get("completed", False):
-                    continue
-                if not action.get("isInProgress", False):
-                    continue
-                
-                action_id = action.get("id")
-                action_type = action.get("type", "")
-                
-                if action_type == "pick" and self.instalock_check.isChecked():
-                    self.handle_pick_action(action_id, session, banned_ids)
-                
-                elif action_type == "ban" and self.auto_ban_check.isChecked():
-                    self.handle_ban_action(action_id)
-    
-    def handle_pick_action(self, action_id: int, session: Dict, banned_ids: set):
-        """Handle pick action."""
-        champ_id = self.instalock_combo.currentData()
-        
-        if champ_id == 0: # Random
-            champ_id = self.get_random_champion(session, banned_ids)
-        
-        if champ_id and champ_id in banned_ids:
-            if self.dodge_if_banned.isChecked():
-                self.dodge_game()
-                return
-            
-            # Try backup
-            backup_id = self.backup_combo.currentData()
-            if backup_id and backup_id != 0:
-                champ_id = backup_id
-        
-        if champ_id:
-            # Apply delay
-            delay_ms = self.instalock_delay.value()
-            if delay_ms > 0:
-                time.sleep(delay_ms / 1000)
-            
-            body = {"championId": champ_id, "completed": True}
-            lcu.lcu_patch(f"/lol-champ-select/v1/session/actions/{action_id}", body)
-    
-    def handle_ban_action(self, action_id: int):
-        """Handle ban action."""
-        champ_id = self.auto_ban_combo.currentData()
-        if not champ_id:
-            return
-        
-        if champ_id:
-            # Apply delay
-            delay_ms = self.autoban_delay.value()
-            if delay_ms > 0:
-                time.sleep(delay_ms / 1000)
-            
-            body = {"championId": champ_id, "completed": True}
-            lcu.lcu_patch(f"/lol-champ-select/v1/session/actions/{action_id}", body)
-    
-    def get_random_champion(self, session: Dict, banned_ids: set) -> Optional[int]:
-        """Get a random available champion."""
-        # Get already picked champions
-        picked_ids = set()
-        for player in session.get("myTeam", []) + session.get("theirTeam", []):
-            champ_id = player.get("championId", 0)
-            if champ_id:
-                picked_ids.add(champ_id)
-        
-        # Filter available champions
-        available = [
-            c for c in self.owned_champions
-            if c.get("id") not in banned_ids and c.get("id") not in picked_ids
-        ]
-        
-        if available:
-            chosen = random.choice(available)
-            return chosen.get("id")
-        return None
-    
     def update_automation_status(self, message: str):
         """Update automation status from worker thread."""
         # self.automation_status.setText(message)
         pass # We use specific status rendering now
     
+    def show_accept_latency(self, latency: float):
+        """Show how fast ready checks are being accepted."""
+        percentiles = self.engine.accept_latency_percentiles((50, 90))
+        self.auto_accept_check.setToolTip(t("accept_latency").format(
+            last=round(latency * 1000),
+            p50=round(percentiles[50] * 1000),
+            p90=round(percentiles[90] * 1000),
+            count=len(self.engine.accept_latencies),
+        ))
+    
     def show_side(self, side: str):
         """Show the detected side."""
         color = "#22d3ee" if "Blue" in side else "#ef4444"
@@ -66,6 +66,12 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "auto_ban_champion": "Auto Ban Champion",
         "backup_pick": "Backup Pick",
         "dodge_if_banned": "Auto-dodge if instalock pick is banned or taken",
+        "lock_margin": "Lock margin:",
+        "save_preset": "Save Preset",
+        "role_picks": "Role picks:",
+        "add_pick": "Add",
+        "clear_picks": "Clear",
+        "accept_latency": "Accepted in {last} ms (median {p50} ms, p90 {p90} ms over {count} matches)",
         "automation_tools": "AUTOMATION TOOLS",
         "auto_accept": "Auto Accept Queue",
         "instant_mute": "Instant Mute All",
@@ -212,6 +218,12 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "auto_ban_champion": "Auto Banir Campeão",
         "backup_pick": "Pick Reserva",
         "dodge_if_banned": "Auto-quit se banido/roubado",
+        "lock_margin": "Margem de lock:",
+        "save_preset": "Salvar Preset",
+        "role_picks": "Picks por rota:",
+        "add_pick": "Adicionar",
+        "clear_picks": "Limpar",
+        "accept_latency": "Aceito em {last} ms (mediana {p50} ms, p90 {p90} ms em {count} partidas)",
         "automation_tools": "FERRAMENTAS DE AUTOM.",
         "auto_accept": "Aceitar Fila Automaticamente",
         "instant_mute": "Mute All Instantâneo",
@@ -358,6 +370,12 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "auto_ban_champion": "Otomatik Yasaklama",
         "backup_pick": "Yedek Seçim",
         "dodge_if_banned": "Yasaklanırsa/Alınırsa Çık",
+        "lock_margin": "Kilit payı:",
+        "save_preset": "Ön Ayarı Kaydet",
+        "role_picks": "Rol seçimleri:",
+        "add_pick": "Ekle",
+        "clear_picks": "Temizle",
+        "accept_latency": "{last} ms içinde kabul edildi ({count} maçta medyan {p50} ms, p90 {p90} ms)",
         "automation_tools": "OTOMASYON ARAÇLARI",
         "auto_accept": "Otomatik Kabul Et",
         "instant_mute": "Anında Herkesi Sustur",
@@ -504,6 +522,12 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "auto_ban_champion": "自动禁用",
         "backup_pick": "备选英雄",
         "dodge_if_banned": "被禁/被抢自动秒退",
+        "lock_margin": "锁定余量:",
+        "save_preset": "保存预设",
+        "role_picks": "分路优先英雄:",
+        "add_pick": "添加",
+        "clear_picks": "清空",
+        "accept_latency": "{last} 毫秒内接受（{count} 场对局中位数 {p50} 毫秒，p90 {p90} 毫秒）",
         "automation_tools": "自动化工具",
         "auto_accept": "自动接受对局",
         "instant_mute": "瞬间全员静音",
@@ -692,6 +716,12 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "auto_ban_champion": "Auto-Ban Champion",
         "backup_pick": "Ersatzwahl",
         "dodge_if_banned": "Auto-Dodge wenn Instalock gebannt/genommen",
+        "lock_margin": "Lock-Puffer:",
+        "save_preset": "Preset speichern",
+        "role_picks": "Rollen-Picks:",
+        "add_pick": "Hinzufügen",
+        "clear_picks": "Leeren",
+        "accept_latency": "In {last} ms angenommen (Median {p50} ms, p90 {p90} ms über {count} Spiele)",
         "automation_tools": "AUTOMATISIERUNGSTOOLS",
         "auto_accept": "Warteschlange auto-akzeptieren",
         "instant_mute": "Sofort alle stummschalten",
@@ -799,6 +829,12 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "auto_ban_champion": "Auto Ban Bohatera",
         "backup_pick": "Zapasowy Wybór",
         "dodge_if_banned": "Auto-unik jeśli zbanowany/zajęty",
+        "lock_margin": "Margines blokady:",
+        "save_preset": "Zapisz Preset",
+        "role_picks": "Wybory na rolę:",
+        "add_pick": "Dodaj",
+        "clear_picks": "Wyczyść",
+        "accept_latency": "Zaakceptowano w {last} ms (mediana {p50} ms, p90 {p90} ms z {count} meczów)",
         "automation_tools": "NARZĘDZIA AUTOMATYZACJI",
         "auto_accept": "Auto Akceptacja",
         "instant_mute": "Natychmiastowe Wyciszenie",
@@ -1,55 +1,131 @@
 """
 DanZ Client Tool - Icon Picker Dialog
-A grid-based icon picker for selecting profile icons.
+A virtualized grid for browsing and selecting profile icons.
 """
 
+from typing import Dict, List, Optional
+
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QScrollArea,
-    QWidget, QGridLayout, QLabel, QPushButton, QFrame
+    QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QListView, QLabel,
+    QPushButton, QFrame, QStyledItemDelegate, QStyleOptionViewItem, QStyle,
+    QAbstractItemView, QToolTip
+)
+from PySide6.QtCore import (
+    Qt, QSize, QRectF, QEvent, Signal, QTimer, QStringListModel, QModelIndex
 )
-from PySide6.QtCore import Qt, QSize, Signal, QUrl, QTimer
-from PySide6.QtGui import QPixmap, QIcon, QCursor
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PySide6.QtGui import QPixmap, QPainter, QColor, QPen, QHelpEvent
 
 from shared_data import shared_data
+from image_loader import image_loader, ImageRequest, PRIORITY_VISIBLE
+from image_cache import pixmap_cache
+
+# Size icons are displayed and cached at
+ICON_SIZE = 52
+# Size of one grid cell (icon plus padding and border)
+CELL_SIZE = 60
+# Spacing between cells
+CELL_SPACING = 8
 
 
-class IconButton(QLabel):
-    """Clickable icon label."""
-    clicked = Signal(int)  # Emits icon_id
+class IconListModel(QStringListModel):
+    """Icon titles for the view, with the records and image loading kept alongside.
     
-    def __init__(self, icon_id: int, title: str, parent=None):
+    Images are only requested for cells the delegate actually paints.
+    """
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.icon_id = icon_id
-        self.title = title
-        self.setFixedSize(60, 60)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet("""
-            QLabel {
-                background-color: #27272a;
-                border: 2px solid transparent;
-                border-radius: 8px;
-            }
-            QLabel:hover {
-                border-color: #06b6d4;
-                background-color: #3f3f46;
-            }
-        """)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.setToolTip(f"{title} (ID: {icon_id})")
+        self.icons: List[Dict] = []
+        self.requests: Dict[int, ImageRequest] = {}  # row -> pending load
+        self.failed: set = set()  # icon ids whose image could not be loaded
         
-        # Placeholder text until image loads
-        self.setText("...")
+    def set_icons(self, icons: List[Dict]):
+        self.cancel_all()
+        self.icons = icons
+        self.setStringList([icon.get('title', f"Icon {icon.get('id')}") for icon in icons])
         
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.icon_id)
-        super().mousePressEvent(event)
+    def icon_id(self, row: int) -> int:
+        return self.icons[row].get('id')
+    
+    def tooltip(self, row: int) -> str:
+        return f"{self.data(self.index(row))} (ID: {self.icon_id(row)})"
+    
+    def pixmap(self, row: int) -> Optional[QPixmap]:
+        """Cached image for a row, starting its download if needed."""
+        icon_id = self.icon_id(row)
+        url = shared_data.get_profile_icon_url(icon_id)
+        cached = pixmap_cache.get(url, ICON_SIZE, ICON_SIZE)
+        if cached is not None or row in self.requests or icon_id in self.failed:
+            return cached
+        request = image_loader().load(
+            url, ICON_SIZE, ICON_SIZE,
+            lambda pixmap, row=row, icon_id=icon_id: self._on_icon_loaded(row, icon_id, pixmap),
+            PRIORITY_VISIBLE
+        )
+        if not request.done:
+            self.requests[row] = request
+        return None
+    
+    def _on_icon_loaded(self, row: int, icon_id: int, pixmap: Optional[QPixmap]):
+        self.requests.pop(row, None)
+        if pixmap is None:
+            self.failed.add(icon_id)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+    
+    def pending_rows(self) -> List[int]:
+        return list(self.requests)
     
-    def set_pixmap(self, pixmap: QPixmap):
-        scaled = pixmap.scaled(52, 52, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        self.setPixmap(scaled)
-        self.setText("")
+    def cancel(self, row: int):
+        request = self.requests.pop(row, None)
+        if request is not None:
+            request.cancel()
+    
+    def cancel_all(self):
+        image_loader().cancel_all(list(self.requests.values()))
+        self.requests.clear()
+
+
+class IconDelegate(QStyledItemDelegate):
+    """Paints an icon cell: rounded tile, centred icon, hover and selection states."""
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(CELL_SIZE, CELL_SIZE)
+    
+    def helpEvent(self, event: QHelpEvent, view: QAbstractItemView, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() == QEvent.Type.ToolTip and index.isValid():
+            QToolTip.showText(event.globalPos(), index.model().tooltip(index.row()), view)
+            return True
+        return super().helpEvent(event, view, option, index)
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        rect = QRectF(option.rect).adjusted(1, 1, -1, -1)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        if selected:
+            background, border = QColor("#06b6d4"), QColor("#06b6d4")
+        elif hovered:
+            background, border = QColor("#3f3f46"), QColor("#06b6d4")
+        else:
+            background, border = QColor("#27272a"), Qt.GlobalColor.transparent
+        painter.setPen(QPen(border, 2))
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, 8, 8)
+        
+        pixmap = index.model().pixmap(index.row())
+        if pixmap is not None:
+            x = option.rect.x() + (option.rect.width() - pixmap.width()) // 2
+            y = option.rect.y() + (option.rect.height() - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            # Placeholder until the image loads
+            painter.setPen(QColor("#a1a1aa"))
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, "...")
+        
+        painter.restore()
 
 
 class IconPickerDialog(QDialog):
@@ -64,10 +140,8 @@ class IconPickerDialog(QDialog):
         self.resize(550, 500)
         self.setModal(True)
         
-        self.network_manager = QNetworkAccessManager(self)
-        self.icon_cache: dict[str, QPixmap] = {}
-        self.icon_buttons: list[IconButton] = []
-        self.pending_requests = 0
+        self.model = IconListModel(self)
+        self.search_session = shared_data.search_session("icons")
         
         # Debounce timer
         self.search_timer = QTimer()
@@ -77,6 +151,7 @@ class IconPickerDialog(QDialog):
         
         self.current_query = ""
         self.selected_icon_id = None
+        self.selected_title = ""
         
         self.setup_ui()
         
@@ -114,27 +189,34 @@ class IconPickerDialog(QDialog):
         
         layout.addLayout(search_layout)
         
-        # Icon grid in scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("""
-            QScrollArea {
+        # Icon grid: only cells in view are painted, and only painted cells load
+        self.icon_view = QListView()
+        self.icon_view.setViewMode(QListView.ViewMode.IconMode)
+        self.icon_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.icon_view.setMovement(QListView.Movement.Static)
+        # Cells show icons, not editable titles
+        self.icon_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.icon_view.setUniformItemSizes(True)
+        self.icon_view.setGridSize(QSize(CELL_SIZE + CELL_SPACING, CELL_SIZE + CELL_SPACING))
+        self.icon_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.icon_view.verticalScrollBar().setSingleStep(CELL_SIZE // 2)
+        self.icon_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.icon_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.icon_view.setMouseTracking(True)
+        self.icon_view.setStyleSheet("""
+            QListView {
                 background-color: #09090b;
                 border: 1px solid #27272a;
                 border-radius: 8px;
+                padding: 8px;
             }
         """)
-        
-        self.grid_container = QWidget()
-        self.grid_layout = QGridLayout(self.grid_container)
-        self.grid_layout.setSpacing(8)
-        self.grid_layout.setContentsMargins(12, 12, 12, 12)
-        self.grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-        
-        scroll.setWidget(self.grid_container)
-        layout.addWidget(scroll, 1)
+        self.icon_view.setModel(self.model)
+        self.icon_view.setItemDelegate(IconDelegate(self.icon_view))
+        self.icon_view.selectionModel().currentChanged.connect(self.on_icon_clicked)
+        self.icon_view.doubleClicked.connect(self.confirm_selection)
+        self.icon_view.verticalScrollBar().valueChanged.connect(self._release_hidden)
+        layout.addWidget(self.icon_view, 1)
         
         # Selected preview and buttons
         bottom_layout = QHBoxLayout()
@@ -190,103 +272,50 @@ class IconPickerDialog(QDialog):
         self.load_icons(self.current_query)
         
     def load_icons(self, query: str):
-        """Load icons matching query into the grid."""
-        # Clear existing
-        for btn in self.icon_buttons:
-            btn.deleteLater()
-        self.icon_buttons.clear()
-        
-        # Get results
+        """Show every icon matching query."""
         if len(query) < 1:
-            results = shared_data.get_icons_data()[:120]  # Show first 120 by default
+            results = shared_data.get_icons_data()
         else:
-            results = shared_data.search_icons(query)[:120]  # Cap at 120
+            results = self.search_session.search(query, page_size=None).items
             
         self.result_label.setText(f"{len(results)} icons")
+        self.selected_icon_id = None
+        self.select_btn.setEnabled(False)
+        self.model.set_icons(results)
+        self.icon_view.scrollToTop()
         
-        # Calculate columns (aim for ~7 per row)
-        cols = 7
+    def _release_hidden(self):
+        """Cancel loads for cells that were scrolled past before their image arrived."""
+        viewport = self.icon_view.viewport().rect()
+        for row in self.model.pending_rows():
+            if not self.icon_view.visualRect(self.model.index(row)).intersects(viewport):
+                self.model.cancel(row)
         
-        for i, icon_data in enumerate(results):
-            icon_id = icon_data.get('id')
-            title = icon_data.get('title', f'Icon {icon_id}')
-            
-            btn = IconButton(icon_id, title)
-            btn.clicked.connect(self.on_icon_clicked)
-            
-            row = i // cols
-            col = i % cols
-            self.grid_layout.addWidget(btn, row, col)
-            self.icon_buttons.append(btn)
-            
-            # Load the icon image
-            self._load_icon(btn, icon_id)
-            
-    def _load_icon(self, btn: IconButton, icon_id: int):
-        url = shared_data.get_profile_icon_url(icon_id)
-        
-        # Check cache
-        if url in self.icon_cache:
-            btn.set_pixmap(self.icon_cache[url])
+    def on_icon_clicked(self, index: QModelIndex):
+        if not index.isValid():
             return
-            
-        request = QNetworkRequest(QUrl(url))
-        reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self._on_icon_loaded(reply, btn, url))
-        
-    def _on_icon_loaded(self, reply: QNetworkReply, btn: IconButton, url: str):
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            data = reply.readAll()
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            if not pixmap.isNull():
-                self.icon_cache[url] = pixmap
-                btn.set_pixmap(pixmap)
-        reply.deleteLater()
-        
-    def on_icon_clicked(self, icon_id: int):
+        icon_id = self.model.icon_id(index.row())
         self.selected_icon_id = icon_id
+        self.selected_title = index.data()
+        self.selected_name.setText(f"{self.selected_title} (ID: {icon_id})")
+        self.selected_name.setStyleSheet("color: #f4f4f5;")
         
-        # Find the button and get info
-        for btn in self.icon_buttons:
-            if btn.icon_id == icon_id:
-                self.selected_name.setText(f"{btn.title} (ID: {icon_id})")
-                self.selected_name.setStyleSheet("color: #f4f4f5;")
-                
-                # Set preview
-                url = shared_data.get_profile_icon_url(icon_id)
-                if url in self.icon_cache:
-                    scaled = self.icon_cache[url].scaled(44, 44, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    self.preview_label.setPixmap(scaled)
-                    
-                # Highlight selected
-                btn.setStyleSheet("""
-                    QLabel {
-                        background-color: #06b6d4;
-                        border: 2px solid #06b6d4;
-                        border-radius: 8px;
-                    }
-                """)
-            else:
-                # Reset others
-                btn.setStyleSheet("""
-                    QLabel {
-                        background-color: #27272a;
-                        border: 2px solid transparent;
-                        border-radius: 8px;
-                    }
-                    QLabel:hover {
-                        border-color: #06b6d4;
-                        background-color: #3f3f46;
-                    }
-                """)
-                
+        # Set preview
+        url = shared_data.get_profile_icon_url(icon_id)
+        cached = pixmap_cache.get(url, ICON_SIZE, ICON_SIZE)
+        if cached is not None:
+            scaled = cached.scaled(44, 44, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            self.preview_label.setPixmap(scaled)
+        else:
+            self.preview_label.clear()
+            
         self.select_btn.setEnabled(True)
         
     def confirm_selection(self):
         if self.selected_icon_id is not None:
-            for btn in self.icon_buttons:
-                if btn.icon_id == self.selected_icon_id:
-                    self.icon_selected.emit(self.selected_icon_id, btn.title)
-                    break
+            self.icon_selected.emit(self.selected_icon_id, self.selected_title)
             self.accept()
+            
+    def done(self, result: int):
+        self.model.cancel_all()
+        super().done(result)
@@ -0,0 +1,114 @@
+"""
+DanZ Client Tool - Image Cache
+Process-wide LRU cache of decoded pixmaps with a memory budget.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from PySide6.QtGui import QPixmap
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+CacheKey = Tuple[str, int, int]
+
+
+@dataclass
+class CacheStats:
+    """Counters for PixmapCache, for diagnostics."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes_used: int = 0
+    budget: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def pixmap_cost(pixmap: QPixmap) -> int:
+    """Approximate memory held by a pixmap, in bytes."""
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class PixmapCache:
+    """LRU cache of pixmaps keyed by source URL and target size.
+    
+    Entries are stored at the size they are displayed at, so a 52px icon
+    costs 52x52 pixels no matter how large the source image was. When the
+    total cost exceeds the budget the least recently used entries are
+    evicted. GUI thread only, like QPixmap itself.
+    """
+    
+    def __init__(self, budget: int = DEFAULT_BUDGET_BYTES):
+        self._entries: "OrderedDict[CacheKey, QPixmap]" = OrderedDict()
+        self._bytes = 0
+        self._budget = budget
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    @staticmethod
+    def key(url: str, width: int = 0, height: int = 0) -> CacheKey:
+        """Cache key for an image at a target size (0 = unconstrained)."""
+        return (url, width, height)
+    
+    def get(self, url: str, width: int = 0, height: int = 0) -> Optional[QPixmap]:
+        """Look up a pixmap, marking it as recently used."""
+        key = self.key(url, width, height)
+        pixmap = self._entries.get(key)
+        if pixmap is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return pixmap
+    
+    def put(self, url: str, pixmap: QPixmap, width: int = 0, height: int = 0):
+        """Store a pixmap and evict old entries to stay within budget."""
+        if pixmap.isNull():
+            return
+        key = self.key(url, width, height)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= pixmap_cost(old)
+        
+        self._entries[key] = pixmap
+        self._bytes += pixmap_cost(pixmap)
+        
+        while self._bytes > self._budget and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= pixmap_cost(evicted)
+            self._evictions += 1
+    
+    def set_budget(self, budget: int):
+        """Change the byte budget, evicting immediately if needed."""
+        self._budget = budget
+        while self._bytes > self._budget and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= pixmap_cost(evicted)
+            self._evictions += 1
+    
+    def clear(self):
+        """Drop every cached pixmap."""
+        self._entries.clear()
+        self._bytes = 0
+    
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            bytes_used=self._bytes,
+            budget=self._budget
+        )
+
+
+# Global instance
+pixmap_cache = PixmapCache()
@@ -0,0 +1,269 @@
+"""
+DanZ Client Tool - Image Loader
+Fetches images from the asset pack or the shared network service and
+decodes them off the GUI thread, straight to the size they are displayed at.
+"""
+
+import heapq
+import itertools
+from typing import Callable, Dict, List, Optional
+
+from PySide6.QtCore import (
+    QObject, QCoreApplication, QRunnable, QThreadPool, QBuffer, QByteArray,
+    QIODevice, QSize, Qt, QTimer, Signal, Slot
+)
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+from PySide6.QtNetwork import QNetworkReply
+
+from network import network_service
+from asset_pack import asset_packs
+from image_cache import pixmap_cache, CacheKey
+
+ImageCallback = Callable[[Optional[QPixmap]], None]
+
+# Request priorities: lower values are downloaded and decoded first
+PRIORITY_VISIBLE = 0
+PRIORITY_NORMAL = 1
+PRIORITY_PREFETCH = 2
+
+# Downloads in flight at once; the rest wait in the priority queue
+MAX_DOWNLOADS = 6
+
+
+def target_size(source: QSize, width: int, height: int) -> QSize:
+    """Size to decode at: fit inside width x height keeping aspect ratio.
+    
+    A zero height means "scale to width"; zero for both keeps the source size.
+    """
+    if not source.isValid() or (width <= 0 and height <= 0):
+        return source
+    if width > 0 and height > 0:
+        return source.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio)
+    if width > 0:
+        return QSize(width, max(1, round(source.height() * width / source.width())))
+    return QSize(max(1, round(source.width() * height / source.height())), height)
+
+
+class DecodeSignals(QObject):
+    """Signals emitted by decode tasks (delivered on the GUI thread)."""
+    decoded = Signal(str, int, int, QImage)
+
+
+class DecodeTask(QRunnable):
+    """Decode encoded image bytes at a scaled size on a worker thread."""
+    
+    def __init__(self, url: str, data: bytes, width: int, height: int, signals: DecodeSignals):
+        super().__init__()
+        self.url = url
+        self.data = data
+        self.width = width
+        self.height = height
+        self.signals = signals
+    
+    def run(self):
+        buffer = QBuffer()
+        buffer.setData(QByteArray(self.data))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        
+        reader = QImageReader(buffer)
+        size = target_size(reader.size(), self.width, self.height)
+        if size.isValid():
+            # JPEG decodes directly at the reduced size; other formats are
+            # scaled by the reader on this thread
+            reader.setScaledSize(size)
+        reader.setQuality(100)
+        image = reader.read()
+        self.signals.decoded.emit(self.url, self.width, self.height, image)
+
+
+class ImageRequest:
+    """Handle for a pending image load; cancel it when the target goes away."""
+    
+    __slots__ = ("loader", "key", "callback", "priority", "done")
+    
+    def __init__(self, loader: Optional["ImageLoader"], key: CacheKey,
+                 callback: Optional[ImageCallback], priority: int):
+        self.loader = loader
+        self.key = key
+        self.callback = callback
+        self.priority = priority
+        self.done = loader is None
+    
+    def cancel(self):
+        """Drop the callback; the download is aborted if nobody else wants it."""
+        if not self.done:
+            self.done = True
+            self.loader._cancel(self)
+    
+    def set_priority(self, priority: int):
+        """Move a still-queued request up or down the queue."""
+        if not self.done and priority != self.priority:
+            self.priority = priority
+            self.loader._reprioritize(self.key)
+
+
+class _Job:
+    """One download + decode shared by every request for the same key."""
+    
+    __slots__ = ("requests", "priority", "reply", "decoding")
+    
+    def __init__(self, priority: int):
+        self.requests: List[ImageRequest] = []
+        self.priority = priority
+        self.reply: Optional[QNetworkReply] = None
+        self.decoding = False
+
+
+class ImageLoader(QObject):
+    """Loads images into the shared pixmap cache, decoding on a thread pool.
+    
+    Images in the asset pack are decoded straight from it. Everything else
+    waits in a priority queue and at most MAX_DOWNLOADS run at once.
+    Concurrent requests for the same URL and size share one download and
+    one decode. Callbacks run on the GUI thread with the ready-to-paint
+    pixmap, or None if the image could not be loaded; cancelled requests
+    never see their callback run.
+    """
+    
+    def __init__(self, parent: Optional[QObject] = None, max_downloads: int = MAX_DOWNLOADS):
+        super().__init__(parent)
+        self.max_downloads = max_downloads
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(2, QThreadPool.globalInstance().maxThreadCount() - 1))
+        self.signals = DecodeSignals(self)
+        self.signals.decoded.connect(self._on_decoded)
+        self._jobs: Dict[CacheKey, _Job] = {}
+        self._queue: List[tuple] = []  # (priority, seq, key), lazily pruned
+        self._seq = itertools.count()
+        self._downloads = 0
+        self._pump_scheduled = False
+    
+    def load(self, url: str, width: int, height: int, callback: ImageCallback,
+             priority: int = PRIORITY_NORMAL) -> ImageRequest:
+        """Load an image at a target size and pass the pixmap to callback.
+        
+        Cache hits call back immediately. Returns a handle that can cancel
+        or re-prioritize the request while it is pending.
+        """
+        cached = pixmap_cache.get(url, width, height)
+        if cached is not None:
+            callback(cached)
+            return ImageRequest(None, pixmap_cache.key(url, width, height), None, priority)
+        
+        key = pixmap_cache.key(url, width, height)
+        request = ImageRequest(self, key, callback, priority)
+        job = self._jobs.get(key)
+        if job is None:
+            job = self._jobs[key] = _Job(priority)
+            packed = asset_packs.lookup(url)
+            if packed is not None:
+                # Straight to decode, no download slot needed
+                self._decode(key, job, packed)
+            else:
+                self._push(key, job)
+        job.requests.append(request)
+        if priority < job.priority:
+            self._reprioritize(key)
+        self._schedule_pump()
+        return request
+    
+    def cancel_all(self, requests: List[ImageRequest]):
+        """Cancel a batch of requests (e.g. every cell of a grid being rebuilt)."""
+        for request in requests:
+            request.cancel()
+    
+    def _push(self, key: CacheKey, job: _Job):
+        heapq.heappush(self._queue, (job.priority, next(self._seq), key))
+    
+    def _reprioritize(self, key: CacheKey):
+        job = self._jobs.get(key)
+        if job is None or not job.requests:
+            return
+        priority = min(r.priority for r in job.requests)
+        if priority == job.priority:
+            return
+        job.priority = priority
+        if job.reply is None and not job.decoding:
+            # The old heap entry becomes stale and is skipped when popped
+            self._push(key, job)
+    
+    def _schedule_pump(self):
+        # Deferred to the event loop so a whole batch of requests (and any
+        # cancellations or priority changes made with it) is queued first
+        if not self._pump_scheduled:
+            self._pump_scheduled = True
+            QTimer.singleShot(0, self._pump)
+    
+    def _pump(self):
+        """Start queued downloads, most urgent first, up to the cap."""
+        self._pump_scheduled = False
+        while self._downloads < self.max_downloads and self._queue:
+            priority, _, key = heapq.heappop(self._queue)
+            job = self._jobs.get(key)
+            if job is None or job.reply is not None or job.decoding or job.priority != priority:
+                continue
+            url = key[0]
+            reply = network_service().get_image(url)
+            job.reply = reply
+            self._downloads += 1
+            reply.finished.connect(lambda reply=reply, key=key: self._on_reply(reply, key))
+    
+    def _cancel(self, request: ImageRequest):
+        job = self._jobs.get(request.key)
+        if job is None or request not in job.requests:
+            return
+        job.requests.remove(request)
+        if job.requests:
+            self._reprioritize(request.key)
+            return
+        del self._jobs[request.key]
+        if job.reply is not None and job.reply.isRunning():
+            job.reply.abort()
+    
+    def _on_reply(self, reply: QNetworkReply, key: CacheKey):
+        self._downloads -= 1
+        job = self._jobs.get(key)
+        if job is not None and job.reply is reply:
+            if reply.error() == QNetworkReply.NetworkError.NoError:
+                self._decode(key, job, bytes(reply.readAll().data()))
+            else:
+                self._finish(key, None)
+        reply.deleteLater()
+        self._schedule_pump()
+    
+    def _decode(self, key: CacheKey, job: _Job, data: bytes):
+        url, width, height = key
+        job.decoding = True
+        # QThreadPool runs higher numbers first
+        self.pool.start(DecodeTask(url, data, width, height, self.signals), -job.priority)
+    
+    @Slot(str, int, int, QImage)
+    def _on_decoded(self, url: str, width: int, height: int, image: QImage):
+        pixmap = None
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            pixmap_cache.put(url, pixmap, width, height)
+        self._finish(pixmap_cache.key(url, width, height), pixmap)
+    
+    def _finish(self, key: CacheKey, pixmap: Optional[QPixmap]):
+        job = self._jobs.pop(key, None)
+        if job is None:
+            return
+        for request in job.requests:
+            request.done = True
+            try:
+                request.callback(pixmap)
+            except RuntimeError:
+                # The widget behind the callback has been deleted
+                pass
+
+
+_loader: Optional[ImageLoader] = None
+
+
+def image_loader() -> ImageLoader:
+    """Application-wide image loader (created on first use, after QApplication)."""
+    global _loader
+    if _loader is None:
+        _loader = ImageLoader(QCoreApplication.instance())
+    return _loader
@@ -51,6 +51,7 @@ class LCUConnection:
         self._puuid: Optional[str] = None
         self._region: Optional[str] = None
         self._display_name: Optional[str] = None
+        self._game_version: Optional[str] = None
     
     def connect(self) -> bool:
         """Attempt to connect to the League Client."""
@@ -80,6 +81,11 @@ class LCUConnection:
             region_response = self.lcu_get("/riotclient/region-locale")
             if region_response.success and region_response.data:
                 self._region = region_response.data.get("region")
+            
+            # Get client build version (e.g. "14.23.632.4412")
+            version_response = self.lcu_get("/lol-patch/v1/game-version")
+            if version_response.success and isinstance(version_response.data, str):
+                self._game_version = version_response.data
             return True
         else:
             self.status = ConnectionStatus.ERROR
@@ -104,6 +110,7 @@ class LCUConnection:
         self._puuid = None
         self._region = None
         self._display_name = None
+        self._game_version = None
         self.status = ConnectionStatus.DISCONNECTED
     
     @property
@@ -126,6 +133,10 @@ class LCUConnection:
     def display_name(self) -> Optional[str]:
         return self._display_name
     
+    @property
+    def game_version(self) -> Optional[str]:
+        return self._game_version
+    
     def _make_request(
         self,
         method: str,
@@ -11,6 +11,9 @@ from PySide6.QtCore import Qt, QPoint, QTimer, Signal, QSize
 from PySide6.QtGui import QIcon, QFont, QColor, QCursor
 
 from lcu import lcu
+from shared_data import shared_data, CDN_BASE
+from asset_pack import asset_packs, icon_pack_paths
+from network import network_service
 from styles import STYLESHEET, COLORS
 
 # Import Tabs
@@ -265,6 +268,8 @@ class Sidebar(QFrame):
 class MainWindow(QMainWindow):
     """Main Application Window."""
     
+    dataset_ready = Signal(str)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("DanZ Client Tool")
@@ -336,6 +341,32 @@ class MainWindow(QMainWindow):
         
         # Initial check
         QTimer.singleShot(500, self.auto_connect)
+        
+        # Game data readiness (listeners fire on prefetch threads)
+        self.dataset_ready.connect(self.on_dataset_ready)
+        shared_data.add_ready_listener(self.dataset_ready.emit)
+        network_service().patch_changed.connect(lambda patch: self.ensure_asset_pack())
+
+    def showEvent(self, event):
+        """Start the game data prefetch once the window is on screen."""
+        super().showEvent(event)
+        QTimer.singleShot(0, shared_data.prefetch)
+
+    def on_dataset_ready(self, name: str):
+        """Handle a game data dataset finishing its background load."""
+        print(f"[MainWindow] Game data ready: {name}")
+        if name in ("champions", "icons"):
+            self.ensure_asset_pack()
+
+    def ensure_asset_pack(self):
+        """Open or build the picker icon pack once its game data is loaded."""
+        patch = shared_data.patch
+        if patch is None or not (shared_data.is_ready("champions") and shared_data.is_ready("icons")):
+            return
+        asset_packs.ensure(patch, CDN_BASE, lambda: icon_pack_paths(
+            [champ['id'] for champ in shared_data.get_champion_summary()],
+            [icon['id'] for icon in shared_data.get_icons_data()]
+        ))
 
     def on_language_changed(self, lang_code):
         """Handle language change event."""
@@ -366,6 +397,9 @@ class MainWindow(QMainWindow):
             if lcu.connect():
                 # Just connected
                 # self.title_bar.update_status() # Updated every loop below
+                shared_data.on_client_connected()
+                # Retry a pack build that failed on an earlier connection
+                self.ensure_asset_pack()
                 self.game_tab.load_champions()
                 self.champs_tab.refresh_data()
                 # skins refreshed on show
@@ -13,7 +13,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from lcu import lcu
-from utils import fuzzy_search
+from shared_data import shared_data
 from i18n import t
 
 
@@ -398,22 +398,19 @@ class MiscTab(QWidget):
         if not name:
             return
         
-        response = lcu.lcu_get("/lol-game-data/assets/v1/champion-summary.json")
-        if not response.success or not response.data:
+        champions = shared_data.get_champion_summary()
+        if not champions:
             self.champ_result.setText("Failed to get champion data.")
             return
         
-        # Search for champion
-        name_lower = name.lower()
-        matches = []
-        
-        for champ in response.data:
-            champ_name = champ.get("name", "")
-            if name_lower in champ_name.lower():
-                matches.append(f"{champ_name}: {champ.get('id')}")
+        # Search for champion (best matches first, tolerating typos)
+        matches = [
+            f"{champ.get('name', '')}: {champ.get('id')}"
+            for champ in shared_data.search("champions", name, page_size=5).items
+        ]
         
         if matches:
-            self.champ_result.setText(", ".join(matches[:5]))
+            self.champ_result.setText(", ".join(matches))
         else:
             self.champ_result.setText("No champions found.")
     
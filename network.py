@@ -0,0 +1,85 @@
+"""
+DanZ Client Tool - Network Module
+Application-wide network access manager with a persistent image cache.
+"""
+
+from typing import Optional
+
+from PySide6.QtCore import QObject, QCoreApplication, QDateTime, QUrl, Signal, Slot
+from PySide6.QtNetwork import (
+    QNetworkAccessManager, QNetworkDiskCache, QNetworkRequest, QNetworkReply,
+    QNetworkCacheMetaData
+)
+
+from shared_data import shared_data
+from image_cache import pixmap_cache
+from snapshot import CACHE_DIR
+
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+HTTP_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Game art only changes with a patch, and patch changes clear the cache,
+# so cached responses are kept regardless of the CDN's own headers.
+HTTP_CACHE_LIFETIME_DAYS = 365
+
+
+class ImageDiskCache(QNetworkDiskCache):
+    """Disk cache that keeps every successful response until it is cleared."""
+    
+    def prepare(self, meta_data: QNetworkCacheMetaData):
+        meta_data.setSaveToDisk(True)
+        meta_data.setExpirationDate(QDateTime.currentDateTimeUtc().addDays(HTTP_CACHE_LIFETIME_DAYS))
+        return super().prepare(meta_data)
+
+
+class NetworkService(QObject):
+    """Owns the shared QNetworkAccessManager and its disk cache."""
+    
+    patch_changed = Signal(str)
+    
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.manager = QNetworkAccessManager(self)
+        
+        self.cache = ImageDiskCache(self)
+        self.cache.setCacheDirectory(str(HTTP_CACHE_DIR))
+        self.cache.setMaximumCacheSize(HTTP_CACHE_MAX_BYTES)
+        self.manager.setCache(self.cache)
+        
+        # Patch listeners fire on background threads; hop to the GUI thread
+        self.patch_changed.connect(self.on_patch_changed)
+        shared_data.add_patch_listener(self.patch_changed.emit)
+    
+    @staticmethod
+    def image_request(url: str) -> QNetworkRequest:
+        """Build a request that is served from the disk cache when possible."""
+        request = QNetworkRequest(QUrl(url))
+        request.setAttribute(
+            QNetworkRequest.Attribute.CacheLoadControlAttribute,
+            QNetworkRequest.CacheLoadControl.PreferCache
+        )
+        request.setAttribute(QNetworkRequest.Attribute.CacheSaveControlAttribute, True)
+        request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        return request
+    
+    def get_image(self, url: str) -> QNetworkReply:
+        """Start a cached GET for an image URL."""
+        return self.manager.get(self.image_request(url))
+    
+    @Slot(str)
+    def on_patch_changed(self, patch: str):
+        """Drop cached images from the previous patch."""
+        print(f"[Network] Clearing image cache for patch {patch}")
+        self.cache.clear()
+        pixmap_cache.clear()
+
+
+_service: Optional[NetworkService] = None
+
+
+def network_service() -> NetworkService:
+    """Application-wide network service (created on first use, after QApplication)."""
+    global _service
+    if _service is None:
+        _service = NetworkService(QCoreApplication.instance())
+    return _service
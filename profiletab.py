@@ -11,12 +11,12 @@ from PySide6.QtWidgets import (
     QLabel, QPushButton, QComboBox, QCheckBox, QSpinBox, 
     QLineEdit, QScrollArea, QFrame, QSizePolicy
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QUrl, QSize
+from PySide6.QtCore import Qt, QTimer, Signal, QSize
 from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 from lcu import lcu
 from shared_data import shared_data
+from image_loader import image_loader
 from icon_picker import IconPickerDialog
 from champion_picker import ChampionPickerDialog
 from toast import ToastManager
@@ -29,6 +29,9 @@ DIVISIONS = ["I", "II", "III", "IV"]
 AVAILABILITY_OPTIONS = ["Online", "Mobile", "Away", "Offline"]
 CHALLENGE_RANKS = ["IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM", "DIAMOND", "MASTER", "GRANDMASTER", "CHALLENGER"]
 
+# Size of the selected icon/champion previews
+PREVIEW_SIZE = 36
+
 
 class ProfileTab(QWidget):
     """Profile customization tab."""
@@ -39,7 +42,6 @@ class ProfileTab(QWidget):
         super().__init__()
         self.champions_map = {}
         self.mastery_map = {}
-        self.network_manager = QNetworkAccessManager()
         
         # Selected items
         self.selected_icon_id = None
@@ -380,20 +382,14 @@ class ProfileTab(QWidget):
         self.icon_name_label.setStyleSheet("color: #f4f4f5;")
         
         # Load preview
-        url = shared_data.get_profile_icon_url(icon_id)
-        request = QNetworkRequest(QUrl(url))
-        reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self._on_preview_loaded(reply, self.icon_preview))
-        
-    def _on_preview_loaded(self, reply: QNetworkReply, label: QLabel):
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            data = reply.readAll()
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(36, 36, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                label.setPixmap(scaled)
-        reply.deleteLater()
+        self._load_preview(shared_data.get_profile_icon_url(icon_id), self.icon_preview)
+        
+    def _load_preview(self, url: str, label: QLabel):
+        image_loader().load(url, PREVIEW_SIZE, PREVIEW_SIZE, lambda pixmap: self._on_preview_loaded(label, pixmap))
+        
+    def _on_preview_loaded(self, label: QLabel, pixmap: Optional[QPixmap]):
+        if pixmap is not None:
+            label.setPixmap(pixmap)
         
     # --- CHAMPION PICKER ---
     
@@ -408,31 +404,15 @@ class ProfileTab(QWidget):
         self.pick_champ_btn.setText(name)
         
         # Load champ preview
-        url = shared_data.get_champion_icon_url(champ_id)
-        request = QNetworkRequest(QUrl(url))
-        reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self._on_preview_loaded(reply, self.champ_preview))
+        self._load_preview(shared_data.get_champion_icon_url(champ_id), self.champ_preview)
         
         # Populate skin combo
         self.update_skin_combo(champ_id)
         
     def update_skin_combo(self, champ_id: int):
         self.bg_skin_combo.clear()
-        all_skins = shared_data.get_skins_data()
-        champ_skins = []
-        
-        for flow_id, skin_data in all_skins.items():
-            try:
-                sid = int(flow_id)
-                if (sid // 1000 == champ_id) or (sid == champ_id * 1000): 
-                    champ_skins.append((sid, skin_data.get('name', 'Unknown')))
-            except:
-                pass
-        
-        champ_skins.sort(key=lambda x: x[0])
-        
-        for sid, name in champ_skins:
-            self.bg_skin_combo.addItem(name, sid)
+        for skin in shared_data.get_champion_skins(champ_id):
+            self.bg_skin_combo.addItem(skin.name, skin.id)
             
     # --- ACTION METHODS ---
     
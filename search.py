@@ -0,0 +1,371 @@
+"""
+DanZ Client Tool - Search
+Ranked, paged name search over the game data catalogues.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+
+try:
+    # Optional: scores every record in a handful of vectorized passes
+    import numpy as np
+except ImportError:
+    np = None
+
+T = TypeVar("T")
+
+# Match kinds, best first; the score of a record is its best match kind.
+# Whole-query (phrase) matches outrank records that only contain every
+# query word somewhere, which outrank trigram near misses.
+SCORE_EXACT = 4.0
+SCORE_PREFIX = 3.0
+SCORE_WORD_PREFIX = 2.0
+SCORE_SUBSTRING = 1.0
+# All words present: base score plus a bonus scaled by the share of words
+# that start a word in the name
+SCORE_ALL_WORDS = 0.5
+ALL_WORDS_BONUS = 0.4
+# Records that only share trigrams with the query score their overlap
+# fraction scaled into (0, TRIGRAM_WEIGHT]
+TRIGRAM_WEIGHT = 0.45
+# Minimum fraction of the query's trigrams a fuzzy match must share
+MIN_TRIGRAM_OVERLAP = 0.6
+
+DEFAULT_PAGE_SIZE = 50
+
+# Earlier queries a SearchSession remembers for narrowing and backspace
+SESSION_HISTORY = 64
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace."""
+    return " ".join(text.lower().split())
+
+
+def trigrams(text: str) -> Set[str]:
+    """Word trigrams of normalized text, padded so word starts and ends count."""
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+@dataclass
+class SearchPage(Generic[T]):
+    """One page of ranked results."""
+    items: List[T]
+    total: int
+    page: int
+    page_size: Optional[int]
+    
+    @property
+    def has_more(self) -> bool:
+        return self.page_size is not None and (self.page + 1) * self.page_size < self.total
+
+
+def inner_trigrams(word: str) -> Set[str]:
+    """Unpadded trigrams of a word: every name containing word contains all of them."""
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+class SearchIndex(Generic[T]):
+    """
+    Ranked full-text search over one catalogue.
+    
+    Built once per dataset: names are normalized and every word trigram is
+    mapped to the rows containing it (an inverted index). A query is split
+    into words; rows are narrowed to those holding every trigram of every
+    word, then checked for each word as a substring (AND). Matches are
+    ranked by how well the whole query fits (exact, prefix, word-prefix,
+    substring, then all words present), rows sharing most trigrams with the
+    query are added below as near misses, and ties go to the shorter name,
+    then catalogue order. With NumPy available, posting lists are arrays and
+    candidates are scored in vectorized passes.
+    """
+    
+    def __init__(self, records: Sequence[T], name: Callable[[T], str],
+                 ident: Optional[Callable[[T], int]] = None):
+        self.records = records
+        self.names = [normalize(name(record)) for record in records]
+        # Numeric words also match record ids (e.g. icon ids)
+        self.idents = [str(ident(record)) for record in records] if ident else None
+        self._lengths = [len(text) for text in self.names]
+        postings: Dict[str, List[int]] = {}
+        for row, text in enumerate(self.names):
+            for gram in trigrams(text):
+                postings.setdefault(gram, []).append(row)
+        self._postings = postings
+        if np is not None:
+            self._build_arrays()
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def _build_arrays(self):
+        self._np_names = np.array(self.names, dtype=str) if self.names else np.array([], dtype="U1")
+        self._np_spaced = np.char.add(" ", self._np_names)
+        self._np_lengths = np.array(self._lengths, dtype=np.int32)
+        self._np_idents = np.array(self.idents, dtype=str) if self.idents else None
+        self._postings = {gram: np.array(rows, dtype=np.int32) for gram, rows in self._postings.items()}
+    
+    def _word_candidates(self, word: str):
+        """Rows that can contain word, or None if word is too short to narrow by."""
+        if self.idents is not None and word.isdigit():
+            return None  # may match the id rather than the name
+        grams = inner_trigrams(word)
+        if not grams:
+            return None
+        lists = [self._postings.get(gram) for gram in grams]
+        if any(rows is None for rows in lists):
+            return []
+        # Intersect smallest first
+        lists.sort(key=len)
+        if np is not None:
+            rows = lists[0]
+            for other in lists[1:]:
+                rows = np.intersect1d(rows, other, assume_unique=True)
+            return rows
+        rows = set(lists[0])
+        for other in lists[1:]:
+            rows.intersection_update(other)
+        return sorted(rows)
+    
+    def _candidates(self, words: List[str]):
+        """Rows that can contain every word (None means every row)."""
+        result = None
+        for word in words:
+            rows = self._word_candidates(word)
+            if rows is None:
+                continue
+            if result is None:
+                result = rows
+            elif np is not None:
+                result = np.intersect1d(result, rows, assume_unique=True)
+            else:
+                result = sorted(set(result).intersection(rows))
+        return result
+    
+    def _narrowest(self, words: List[str], within: Optional[Sequence[int]]):
+        """The smaller of within and the trigram candidates (both hold every match)."""
+        candidates = self._candidates(words)
+        if within is not None and (candidates is None or len(within) < len(candidates)):
+            return within
+        return candidates
+    
+    def _fuzzy_overlap(self, query: str) -> Dict[int, float]:
+        """Share of the query's trigrams each row contains, via the postings."""
+        grams = trigrams(query)
+        counts: Dict[int, int] = {}
+        for gram in grams:
+            for row in self._postings.get(gram, ()):
+                counts[row] = counts.get(row, 0) + 1
+        return {row: count / len(grams) for row, count in counts.items()}
+    
+    def ranked_rows(self, query: str, fuzzy: bool = True) -> Sequence[int]:
+        """Rows of every matching record, best first (all rows for an empty query).
+        
+        With fuzzy off, only records containing every query word are returned
+        (for filters). A NumPy array when NumPy is available, so callers can
+        slice out a page before converting anything to Python objects.
+        """
+        query = normalize(query)
+        if not query:
+            return range(len(self.records))
+        return self.ranked(query, fuzzy)[0]
+    
+    def ranked(self, query: str, fuzzy: bool = True,
+               within: Optional[Sequence[int]] = None) -> Tuple[Sequence[int], Sequence[float]]:
+        """Matching rows best first and their scores, for a normalized, non-empty query.
+        
+        within optionally limits the word matches to rows already known to
+        include them (see SearchSession); near misses are still drawn from
+        the whole index. Rows scoring SCORE_ALL_WORDS or more contain every
+        query word.
+        """
+        if np is not None:
+            return self._ranked_numpy(query, fuzzy, within)
+        scores = self._scores_python(query, fuzzy, within)
+        return [row for row, _ in scores], [score for _, score in scores]
+    
+    def _scores_python(self, query: str, fuzzy: bool = True,
+                       within: Optional[Sequence[int]] = None) -> List[Tuple[int, float]]:
+        words = query.split()
+        spaced_query = " " + query
+        candidates = self._narrowest(words, within)
+        rows = range(len(self.names)) if candidates is None else candidates
+        numeric = self.idents is not None
+        
+        scores: Dict[int, float] = {}
+        for row in rows:
+            text = self.names[row]
+            ident = self.idents[row] if numeric else ""
+            if text == query or (numeric and ident == query):
+                score = SCORE_EXACT
+            elif text.startswith(query):
+                score = SCORE_PREFIX
+            elif spaced_query in " " + text:
+                score = SCORE_WORD_PREFIX
+            elif query in text or (numeric and query.isdigit() and query in ident):
+                score = SCORE_SUBSTRING
+            elif all(word in text or (numeric and word.isdigit() and word in ident) for word in words):
+                spaced = " " + text
+                starts = sum(1 for word in words if " " + word in spaced)
+                score = SCORE_ALL_WORDS + ALL_WORDS_BONUS * starts / len(words)
+            else:
+                continue
+            scores[row] = score
+        
+        if fuzzy:
+            for row, overlap in self._fuzzy_overlap(query).items():
+                if overlap >= MIN_TRIGRAM_OVERLAP and row not in scores:
+                    scores[row] = overlap * TRIGRAM_WEIGHT
+        
+        lengths = self._lengths
+        return sorted(scores.items(), key=lambda match: (-match[1], lengths[match[0]], match[0]))
+    
+    def _ranked_numpy(self, query: str, fuzzy: bool = True,
+                      within: Optional[Sequence[int]] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        words = query.split()
+        candidates = self._narrowest(words, within)
+        rows = np.arange(len(self.names), dtype=np.int32) if candidates is None else np.asarray(candidates, dtype=np.int32)
+        names = self._np_names[rows]
+        spaced = self._np_spaced[rows]
+        idents = self._np_idents[rows] if self._np_idents is not None else None
+        
+        def contains(word):
+            found = np.char.find(names, word) >= 0
+            if idents is not None and word.isdigit():
+                found |= np.char.find(idents, word) >= 0
+            return found
+        
+        all_words = np.ones(len(rows), dtype=bool)
+        starts = np.zeros(len(rows), dtype=np.float64)
+        for word in words:
+            all_words &= contains(word)
+            starts += np.char.find(spaced, " " + word) >= 0
+        
+        found = np.char.find(names, query)
+        score = np.zeros(len(rows), dtype=np.float64)
+        score[all_words] = SCORE_ALL_WORDS + ALL_WORDS_BONUS * starts[all_words] / len(words)
+        score[contains(query)] = SCORE_SUBSTRING
+        score[np.char.find(spaced, " " + query) >= 0] = SCORE_WORD_PREFIX
+        score[found == 0] = SCORE_PREFIX
+        exact = names == query
+        if idents is not None:
+            exact |= idents == query
+        score[exact] = SCORE_EXACT
+        
+        if not fuzzy:
+            hits = score > 0
+            matched, score = rows[hits], score[hits]
+            order = np.lexsort((matched, self._np_lengths[matched], -score))
+            return matched[order], score[order]
+        
+        full = np.zeros(len(self.names), dtype=np.float64)
+        full[rows] = score
+        grams = trigrams(query)
+        hit_lists = [self._postings[gram] for gram in grams if gram in self._postings]
+        if hit_lists:
+            overlap = np.bincount(np.concatenate(hit_lists), minlength=len(self.names)) / len(grams)
+            near = (full == 0) & (overlap >= MIN_TRIGRAM_OVERLAP)
+            full[near] = overlap[near] * TRIGRAM_WEIGHT
+        
+        matched = np.flatnonzero(full > 0)
+        # lexsort sorts by the last key first
+        order = np.lexsort((matched, self._np_lengths[matched], -full[matched]))
+        matched = matched[order]
+        return matched, full[matched]
+    
+    def search(self, query: str, page: int = 0,
+               page_size: Optional[int] = DEFAULT_PAGE_SIZE, fuzzy: bool = True) -> SearchPage[T]:
+        """Ranked records matching query; page_size None returns every match."""
+        return self.page(self.ranked_rows(query, fuzzy), page, page_size)
+    
+    def page(self, rows: Sequence[int], page: int = 0,
+             page_size: Optional[int] = DEFAULT_PAGE_SIZE) -> SearchPage[T]:
+        """Records for one page of ranked rows."""
+        total = len(rows)
+        if page_size is not None:
+            rows = rows[page * page_size:(page + 1) * page_size]
+        if np is not None and isinstance(rows, np.ndarray):
+            rows = rows.tolist()
+        return SearchPage([self.records[row] for row in rows], total, page, page_size)
+
+
+def _narrows(previous: List[str], words: List[str]) -> bool:
+    """True if every record containing all of words contains all of previous.
+    
+    Holds when each earlier word is part of some new word, which covers
+    typing more characters and adding words.
+    """
+    return all(any(old in new for new in words) for old in previous)
+
+
+class SearchSession(Generic[T]):
+    """
+    Search-as-you-type over one index.
+    
+    Remembers the records containing every word of each earlier query.
+    When the query is extended, only the records that matched before are
+    checked again; on backspace the remembered result for the shorter
+    query is reused, and only a query unrelated to the earlier ones goes
+    back to the whole index. Results are the same as SearchIndex.search.
+    
+    index is called on every search, so a session can follow an index that
+    is rebuilt when its dataset reloads; history is dropped when it changes.
+    """
+    
+    def __init__(self, index: Callable[[], Optional[SearchIndex[T]]]):
+        self._index = index
+        self._current: Optional[SearchIndex[T]] = None
+        # (query words, rows containing all of them), oldest first; each
+        # entry's rows are a subset of the entry below it
+        self._history: List[Tuple[List[str], Sequence[int]]] = []
+    
+    def reset(self):
+        """Forget earlier queries."""
+        self._history.clear()
+    
+    def search(self, query: str, page: int = 0,
+               page_size: Optional[int] = DEFAULT_PAGE_SIZE, fuzzy: bool = True) -> SearchPage[T]:
+        """Ranked records matching query; page_size None returns every match."""
+        index = self._refresh()
+        if index is None:
+            return SearchPage([], 0, page, page_size)
+        return index.page(self.ranked_rows(query, fuzzy), page, page_size)
+    
+    def _refresh(self) -> Optional[SearchIndex[T]]:
+        index = self._index()
+        if index is not self._current:
+            self._current = index
+            self.reset()
+        return index
+    
+    def ranked_rows(self, query: str, fuzzy: bool = True) -> Sequence[int]:
+        """Rows of every matching record, best first (see SearchIndex.ranked_rows)."""
+        index = self._refresh()
+        if index is None:
+            return []
+        query = normalize(query)
+        if not query:
+            self.reset()
+            return range(len(index))
+        words = query.split()
+        
+        # Drop remembered queries this one does not extend (backspace)
+        while self._history and not _narrows(self._history[-1][0], words):
+            self._history.pop()
+        within = self._history[-1][1] if self._history else None
+        
+        rows, scores = index.ranked(query, fuzzy, within)
+        if np is not None:
+            matched = rows[scores >= SCORE_ALL_WORDS]
+            matched.sort()
+        else:
+            matched = sorted(row for row, score in zip(rows, scores) if score >= SCORE_ALL_WORDS)
+        if not self._history or self._history[-1][0] != words:
+            self._history.append((words, matched))
+            del self._history[:-SESSION_HISTORY]
+        return rows
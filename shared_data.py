@@ -1,30 +1,176 @@
 """
 DanZ Client Tool - Shared Data Module
-Fetches and caches game data from Community Dragon CDN.
+Fetches and caches game data from the local client or Community Dragon CDN.
 """
 
+import sys
+import threading
 import requests
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from functools import lru_cache
 
+from lcu import lcu
+from snapshot import GameDataSnapshot
+from search import SearchIndex, SearchPage, SearchSession, DEFAULT_PAGE_SIZE
+
 # Community Dragon CDN base URLs
 CDN_BASE = "https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1"
 CDN_ASSETS = "https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/assets"
+CDN_METADATA = "https://raw.communitydragon.org/latest/content-metadata.json"
+
+# The same game data files, served by the running client over loopback
+LCU_GAME_DATA = "/lol-game-data/assets/v1"
+
+# Where a loaded dataset came from
+SOURCE_SNAPSHOT = "snapshot"
+SOURCE_LCU = "lcu"
+SOURCE_CDN = "cdn"
+
+def patch_of(version: str) -> str:
+    """Reduce a client or CDN build version to its patch, e.g. "14.23.632.4412" -> "14.23"."""
+    parts = version.split("+")[0].split(".")
+    return ".".join(parts[:2]) if len(parts) >= 2 else version
+
+
+# Skin rarities as stored in skins.json; SkinRecord.rarity is an index into these
+RARITIES = ("kNoRarity", "kEpic", "kLegendary", "kMythic", "kUltimate", "kTranscendent", "kExalted")
+RARITY_NAMES = ("Standard", "Epic", "Legendary", "Mythic", "Ultimate", "Transcendent", "Exalted")
+_RARITY_CODES = {name: code for code, name in enumerate(RARITIES)}
+
+
+class SkinRecord:
+    """Compact view of one skins.json entry, holding only the fields the UI uses."""
+    
+    __slots__ = ("id", "champion_id", "name", "rarity", "is_legacy")
+    
+    def __init__(self, skin_id: int, name: str, rarity: int = 0, is_legacy: bool = False):
+        self.id = skin_id
+        self.champion_id = skin_id // 1000
+        self.name = sys.intern(name)
+        self.rarity = rarity
+        self.is_legacy = is_legacy
+    
+    @classmethod
+    def from_json(cls, entry: Dict) -> "SkinRecord":
+        """Project a raw skins.json entry."""
+        return cls(
+            int(entry["id"]),
+            entry.get("name", ""),
+            _RARITY_CODES.get(entry.get("rarity", "kNoRarity"), 0),
+            bool(entry.get("isLegacy", False))
+        )
+    
+    @property
+    def rarity_name(self) -> str:
+        return RARITY_NAMES[self.rarity]
+    
+    def __repr__(self) -> str:
+        return f"SkinRecord({self.id}, {self.name!r})"
+
+
+def _project_skins(raw: Dict) -> Dict[int, SkinRecord]:
+    """Build the compact skin table from the raw skins.json dict."""
+    skins = {}
+    for entry in raw.values():
+        try:
+            record = SkinRecord.from_json(entry)
+        except (KeyError, TypeError, ValueError):
+            continue
+        skins[record.id] = record
+    return skins
+
+
+def _project_icons(raw: List) -> List[Dict]:
+    """Keep only the id and title of each summoner-icons.json entry."""
+    return [
+        {"id": int(icon["id"]), "title": icon.get("title", "")}
+        for icon in raw if "id" in icon
+    ]
+
+
+def _project_champions(raw: List) -> List[Dict]:
+    """Keep only the id, name and alias of each champion-summary.json entry."""
+    return [
+        {"id": int(champ["id"]), "name": sys.intern(champ.get("name", "")), "alias": champ.get("alias", "")}
+        for champ in raw if "id" in champ
+    ]
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """How a dataset is fetched, projected and stored in the snapshot."""
+    filename: str
+    empty: Callable[[], Any]
+    project: Callable[[Any], Any]
+    to_rows: Callable[[Any], List[Tuple]]
+    from_rows: Callable[[List[Tuple]], Any]
+    # Text a record is searched by, and optionally its numeric id
+    search_name: Callable[[Any], str]
+    search_id: Optional[Callable[[Any], int]] = None
+
+
+# Datasets managed by SharedData
+DATASETS: Dict[str, DatasetSpec] = {
+    "skins": DatasetSpec(
+        "skins.json", dict, _project_skins,
+        lambda skins: [(s.id, s.name, s.rarity, int(s.is_legacy)) for s in skins.values()],
+        lambda rows: {r[0]: SkinRecord(r[0], r[1], r[2], bool(r[3])) for r in rows},
+        search_name=lambda skin: skin.name
+    ),
+    "icons": DatasetSpec(
+        "summoner-icons.json", list, _project_icons,
+        lambda icons: [(i["id"], i["title"]) for i in icons],
+        lambda rows: [{"id": r[0], "title": r[1]} for r in rows],
+        search_name=lambda icon: icon.get("title", ""), search_id=lambda icon: icon.get("id")
+    ),
+    "champions": DatasetSpec(
+        "champion-summary.json", list, _project_champions,
+        lambda champs: [(c["id"], c["name"], c["alias"]) for c in champs],
+        lambda rows: [{"id": r[0], "name": sys.intern(r[1]), "alias": r[2]} for r in rows],
+        search_name=lambda champ: champ.get("name", "")
+    ),
+}
+
+# Prefetch order. The Profile and Skins tabs need champions and skins, so
+# those load together first; icons (only used by the icon picker) start
+# once they are done rather than competing with them for the GIL while
+# the JSON is parsed.
+PREFETCH_STAGES: List[List[str]] = [["champions", "skins"], ["icons"]]
 
 
 class SharedData:
     """Singleton class for managing shared game data."""
     
     _instance = None
-    _skins_data: Optional[Dict] = None
-    _icons_data: Optional[List] = None
-    _champions_data: Optional[Dict] = None
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._init_state()
         return cls._instance
     
+    def _init_state(self):
+        """Set up per-dataset storage, locks and readiness events."""
+        self._data: Dict[str, Any] = {}
+        self._sources: Dict[str, str] = {}
+        self._locks = {name: threading.Lock() for name in DATASETS}
+        self._ready = {name: threading.Event() for name in DATASETS}
+        self._ready_listeners: List[Callable[[str], None]] = []
+        self._patch_listeners: List[Callable[[str], None]] = []
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._snapshot: Optional[GameDataSnapshot] = None
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_resolved = False
+        self._search_indexes: Dict[str, Tuple[Any, SearchIndex]] = {}
+        self._search_lock = threading.Lock()
+    
+    @property
+    def patch(self) -> Optional[str]:
+        """Patch the cached game data belongs to, once known."""
+        return self._snapshot.version if self._snapshot else None
+    
     @staticmethod
     def _fetch_json(url: str) -> Optional[Any]:
         """Fetch JSON data from a URL."""
@@ -38,34 +184,242 @@ class SharedData:
             print(f"[SharedData] Error fetching {url}: {e}")
             return None
     
-    def get_skins_data(self) -> Dict:
-        """Get all skins metadata from CDN."""
-        if self._skins_data is None:
-            url = f"{CDN_BASE}/skins.json"
-            self._skins_data = self._fetch_json(url) or {}
-            print(f"[SharedData] Cached {len(self._skins_data)} skins.")
-        return self._skins_data
+    def _get_snapshot(self) -> Optional[GameDataSnapshot]:
+        """Resolve the snapshot for the current patch (once per session).
+        
+        Uses the connected client's build version when available. Before the
+        client is up, the newest snapshot on disk is trusted as-is (it is
+        checked again in on_client_connected), and the CDN version is only
+        asked for on a cold start.
+        """
+        with self._snapshot_lock:
+            if not self._snapshot_resolved:
+                if lcu.is_connected and lcu.game_version:
+                    self._snapshot = GameDataSnapshot(patch_of(lcu.game_version))
+                else:
+                    self._snapshot = GameDataSnapshot.latest()
+                    if self._snapshot is None:
+                        meta = self._fetch_json(CDN_METADATA)
+                        version = meta.get("version") if isinstance(meta, dict) else None
+                        if version:
+                            self._snapshot = GameDataSnapshot(patch_of(str(version)))
+                self._snapshot_resolved = True
+        return self._snapshot
+    
+    @staticmethod
+    def _fetch_from_client(filename: str) -> Optional[Any]:
+        """Fetch a game data file from the connected client's game-data plugin."""
+        if not lcu.is_connected:
+            return None
+        response = lcu.lcu_get(f"{LCU_GAME_DATA}/{filename}")
+        if response.success and response.data:
+            print(f"[SharedData] Loaded {filename} from client")
+            return response.data
+        print(f"[SharedData] Client game data unavailable for {filename}: {response.error}")
+        return None
+    
+    def _load_dataset(self, name: str) -> Tuple[Any, str]:
+        """Load a dataset through the source chain: snapshot, client, CDN.
+        
+        Returns the data and the source it came from. Snapshot tables that
+        were filled from the CDN are skipped while the client is connected,
+        so the client's own (patch-matched) data wins whenever it is available.
+        """
+        spec = DATASETS[name]
+        snapshot = self._get_snapshot()
+        
+        stored_source = snapshot.source(name) if snapshot else None
+        if stored_source and not (stored_source == SOURCE_CDN and lcu.is_connected):
+            rows = snapshot.load(name)
+            if rows is not None:
+                print(f"[SharedData] Loaded {name} from snapshot {snapshot.version}")
+                return spec.from_rows(rows), SOURCE_SNAPSHOT
+        
+        source = SOURCE_LCU
+        raw = self._fetch_from_client(spec.filename)
+        if not raw:
+            source = SOURCE_CDN
+            raw = self._fetch_json(f"{CDN_BASE}/{spec.filename}")
+        if not raw:
+            return spec.empty(), SOURCE_CDN
+        
+        data = spec.project(raw)
+        if snapshot:
+            snapshot.store(name, spec.to_rows(data), source)
+        return data, source
+    
+    def _get_dataset(self, name: str) -> Any:
+        """Return a dataset, loading it on first use.
+        
+        Concurrent callers (e.g. a tab and the prefetch stage) wait on the
+        same per-dataset lock so each file is only loaded once.
+        """
+        data = self._data.get(name)
+        if data is not None:
+            return data
+        
+        with self._locks[name]:
+            data = self._data.get(name)
+            if data is None:
+                data, self._sources[name] = self._load_dataset(name)
+                self._data[name] = data
+                print(f"[SharedData] Cached {len(data)} {name}.")
+                self._mark_ready(name)
+        return data
+    
+    def _reload_dataset(self, name: str):
+        """Reload a dataset in place, replacing the in-memory copy when done."""
+        with self._locks[name]:
+            data, source = self._load_dataset(name)
+            if data:
+                self._data[name] = data
+                self._sources[name] = source
+                print(f"[SharedData] Reloaded {len(data)} {name} from {source}.")
+    
+    def on_client_connected(self):
+        """Bring cached game data in line with the connected client.
+        
+        If the client runs a different patch than the cached data, every
+        loaded dataset is reloaded, older snapshots are deleted and patch
+        listeners are told to drop their caches. Otherwise only datasets that
+        came from the CDN are swapped for the client's own copies. Runs in the
+        background; datasets stay readable during the reload.
+        """
+        self._ensure_pool().submit(self._sync_with_client)
+    
+    def _sync_with_client(self):
+        # Wait for the snapshot in use to be resolved (a cold start may still
+        # be asking the CDN for its version) before comparing patches
+        cached = self._get_snapshot()
+        client_patch = patch_of(lcu.game_version) if lcu.game_version else None
+        stale = [name for name, source in self._sources.items() if source == SOURCE_CDN]
+        
+        if client_patch and cached is None:
+            # Nothing was cached for any patch yet: just start using the client's
+            with self._snapshot_lock:
+                self._snapshot = GameDataSnapshot(client_patch)
+        elif client_patch and client_patch != cached.version:
+            print(f"[SharedData] Client patch {client_patch} differs from cached {cached.version}")
+            with self._snapshot_lock:
+                self._snapshot = GameDataSnapshot(client_patch)
+            self._snapshot.purge_others()
+            stale = list(self._data)
+            for listener in list(self._patch_listeners):
+                try:
+                    listener(client_patch)
+                except Exception as e:
+                    print(f"[SharedData] Patch listener failed: {e}")
+        
+        pool = self._ensure_pool()
+        for name in stale:
+            pool.submit(self._reload_dataset, name)
+    
+    def add_patch_listener(self, callback: Callable[[str], None]):
+        """Register a callback invoked with the new patch when cached data is invalidated.
+        
+        Callbacks may run on a background thread.
+        """
+        self._patch_listeners.append(callback)
+    
+    def _mark_ready(self, name: str):
+        """Set the readiness event for a dataset and notify listeners."""
+        self._ready[name].set()
+        for listener in list(self._ready_listeners):
+            try:
+                listener(name)
+            except Exception as e:
+                print(f"[SharedData] Ready listener failed for {name}: {e}")
+    
+    # --- PREFETCH ---
+    
+    def prefetch(self, names: Optional[List[str]] = None):
+        """Fetch and parse datasets in the background.
+        
+        names are loaded concurrently; without names every dataset is loaded,
+        stage by stage in PREFETCH_STAGES order. Returns immediately; use
+        is_ready()/wait_ready() or a ready listener to find out when each
+        dataset becomes available. A tab that needs a dataset before its
+        turn loads it inline through _get_dataset.
+        """
+        self._prefetch_stages([names] if names else PREFETCH_STAGES)
+    
+    def _prefetch_stages(self, stages: List[List[str]]):
+        """Submit the first stage with work left, then the rest once it is done."""
+        for index, stage in enumerate(stages):
+            pending = [name for name in stage if not self._ready[name].is_set()]
+            if pending:
+                break
+        else:
+            return
+        
+        rest = stages[index + 1:]
+        remaining = [len(pending)]
+        lock = threading.Lock()
+        
+        def stage_done(_future):
+            with lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
+                self._prefetch_stages(rest)
+        
+        pool = self._ensure_pool()
+        for name in pending:
+            pool.submit(self._get_dataset, name).add_done_callback(stage_done)
+    
+    def _ensure_pool(self) -> ThreadPoolExecutor:
+        """Background pool shared by prefetch and reloads."""
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                max_workers=len(DATASETS),
+                thread_name_prefix="SharedDataPrefetch"
+            )
+        return self._prefetch_pool
+    
+    def is_ready(self, name: str) -> bool:
+        """Check whether a dataset has been loaded."""
+        return self._ready[name].is_set()
+    
+    def wait_ready(self, name: str, timeout: Optional[float] = None) -> bool:
+        """Block until a dataset is loaded. Returns False on timeout."""
+        return self._ready[name].wait(timeout)
+    
+    def add_ready_listener(self, callback: Callable[[str], None]):
+        """Register a callback invoked with the dataset name once it is loaded.
+        
+        Callbacks run on the loading thread; Qt widgets should forward them
+        through a signal. Datasets that are already loaded are reported
+        immediately.
+        """
+        self._ready_listeners.append(callback)
+        for name in DATASETS:
+            if self._ready[name].is_set():
+                callback(name)
+    
+    # --- DATASETS ---
+    
+    def get_skins_data(self) -> Dict[int, SkinRecord]:
+        """Get all skins metadata from CDN, keyed by skin ID."""
+        return self._get_dataset("skins")
 
     def get_champion_summary(self) -> List[Dict]:
         """Get champion summary data."""
-        if self._champions_data is None:
-            url = f"{CDN_BASE}/champion-summary.json"
-            self._champions_data = self._fetch_json(url) or []
-            print(f"[SharedData] Cached {len(self._champions_data)} champions.")
-        return self._champions_data
+        return self._get_dataset("champions")
     
     def get_icons_data(self) -> List:
         """Get all profile icons from CDN."""
-        if self._icons_data is None:
-            url = f"{CDN_BASE}/summoner-icons.json"
-            self._icons_data = self._fetch_json(url) or []
-            print(f"[SharedData] Cached {len(self._icons_data)} icons.")
-        return self._icons_data
+        return self._get_dataset("icons")
     
-    def get_skin_by_id(self, skin_id: int) -> Optional[Dict]:
+    def get_skin_by_id(self, skin_id: int) -> Optional[SkinRecord]:
         """Get skin metadata by ID."""
         skins = self.get_skins_data()
-        return skins.get(str(skin_id))
+        return skins.get(skin_id)
+    
+    def get_champion_skins(self, champ_id: int) -> List[SkinRecord]:
+        """Get all skins of a champion, ordered by skin ID."""
+        skins = [s for s in self.get_skins_data().values() if s.champion_id == champ_id]
+        skins.sort(key=lambda s: s.id)
+        return skins
     
     def get_icon_by_id(self, icon_id: int) -> Optional[Dict]:
         """Get icon metadata by ID."""
@@ -85,47 +439,57 @@ class SharedData:
         """Get the square icon URL for a champion."""
         return f"{CDN_BASE}/champion-icons/{champion_id}.png"
     
+    @staticmethod
+    def get_champion_splash_url(champion_id: int, skin_id: int) -> str:
+        """Get the centered splash art URL for a skin."""
+        return f"{CDN_BASE}/champion-splashes/{champion_id}/{skin_id}.jpg"
+    
     @staticmethod
     def get_skin_tile_url(champion_key: str, skin_num: int) -> str:
         """Get the tile image URL for a skin."""
         champion_key_lower = champion_key.lower()
         return f"{CDN_ASSETS}/characters/{champion_key_lower}/skins/skin{skin_num:02d}/images/{champion_key_lower}_splash_tile_{skin_num}.jpg"
     
-    def search_icons(self, query: str) -> List[Dict]:
-        """Search icons by name or ID."""
-        icons = self.get_icons_data()
-        query_lower = query.lower()
-        results = []
-        
-        for icon in icons:
-            icon_id = str(icon.get("id", ""))
-            icon_title = icon.get("title", "").lower()
-            
-            if query_lower in icon_id or query_lower in icon_title:
-                results.append(icon)
-        
-        return results[:50]  # Limit results
+    # --- SEARCH ---
     
-    def search_skins(self, query: str) -> List[Dict]:
-        """Search skins by name."""
-        skins = self.get_skins_data()
-        query_lower = query.lower()
-        results = []
-        
-        for skin_id, skin_data in skins.items():
-            skin_name = skin_data.get("name", "").lower()
-            if query_lower in skin_name:
-                results.append({"id": skin_id, **skin_data})
+    def _search_index(self, name: str) -> SearchIndex:
+        """Search index for a dataset, rebuilt when the dataset is reloaded."""
+        data = self._get_dataset(name)
+        with self._search_lock:
+            cached = self._search_indexes.get(name)
+            if cached is not None and cached[0] is data:
+                return cached[1]
+            spec = DATASETS[name]
+            records = list(data.values()) if isinstance(data, dict) else data
+            index = SearchIndex(records, spec.search_name, spec.search_id)
+            self._search_indexes[name] = (data, index)
+            return index
+    
+    def search(self, name: str, query: str, page: int = 0,
+               page_size: Optional[int] = DEFAULT_PAGE_SIZE, fuzzy: bool = True) -> SearchPage:
+        """Ranked, paged search of a dataset ("skins", "icons" or "champions").
         
-        return results[:50]  # Limit results
+        Multi-word queries match records containing every word; with fuzzy
+        on, near misses (typos) are ranked after them.
+        """
+        return self._search_index(name).search(query, page, page_size, fuzzy)
+    
+    def search_session(self, name: str) -> SearchSession:
+        """Search-as-you-type session over a dataset, for search boxes."""
+        return SearchSession(lambda: self._search_index(name))
+    
+    def search_icons(self, query: str, limit: Optional[int] = 50) -> List[Dict]:
+        """Search icons by name or ID, best matches first (all matches if limit is None)."""
+        return self.search("icons", query, 0, limit).items
+    
+    def search_skins(self, query: str, limit: Optional[int] = 50) -> List[SkinRecord]:
+        """Search skins by name, best matches first (all matches if limit is None)."""
+        return self.search("skins", query, 0, limit).items
 
 
     def get_champion_name(self, champ_id: int) -> str:
         """Get champion name by ID."""
-        if self._champions_data is None:
-            self.get_champion_summary()
-            
-        for champ in self._champions_data or []:
+        for champ in self.get_champion_summary():
             if champ.get("id") == champ_id:
                 return champ.get("name", "Unknown")
         return "Unknown"
@@ -3,7 +3,7 @@ DanZ Client Tool - Skins Tab
 Skin collection viewer with splash art preview.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 import threading
 
 from PySide6.QtWidgets import (
@@ -11,12 +11,16 @@ from PySide6.QtWidgets import (
     QLineEdit, QScrollArea, QFrame, QHeaderView, QTreeWidget, 
     QTreeWidgetItem, QSplitter, QComboBox
 )
-from PySide6.QtCore import Qt, Signal, QObject, QUrl, QSize
+from PySide6.QtCore import Qt, Signal, QObject, QSize
 from PySide6.QtGui import QColor, QFont, QPixmap
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 from lcu import lcu
-from shared_data import shared_data
+from shared_data import shared_data, SkinRecord
+from search import SearchIndex, SearchSession
+from image_loader import image_loader, ImageRequest, PRIORITY_PREFETCH
+
+# Rows above and below the selection whose splash art is fetched ahead
+SPLASH_PREFETCH_ROWS = 3
 
 
 class DataSignals(QObject):
@@ -31,9 +35,12 @@ class SkinsTab(QWidget):
         super().__init__()
         self.signals = DataSignals()
         self.skins: List[Dict] = []
-        self.skins_meta: Dict = {}
-        self.network_manager = QNetworkAccessManager()
-        self.splash_cache: Dict[str, QPixmap] = {}
+        self.skins_meta: Dict[int, SkinRecord] = {}
+        self.current_splash_url = ""
+        self.splash_request: Optional[ImageRequest] = None
+        self.prefetch_requests: Dict[str, ImageRequest] = {}
+        self.search_index: Optional[SearchIndex] = None
+        self.search_session = SearchSession(lambda: self.search_index)
         self.has_loaded = False
         
         self.setup_ui()
@@ -304,15 +311,15 @@ class SkinsTab(QWidget):
         
         for skin in skins:
             skin_id = skin.get("itemId", 0)
-            meta = self.skins_meta.get(str(skin_id), {})
+            meta = self.skins_meta.get(skin_id)
             
-            name = meta.get("name", f"Skin {skin_id}")
+            name = meta.name if meta else f"Skin {skin_id}"
             
             champ_id = shared_data.get_champion_id_from_skin_id(skin_id)
             champ_name = shared_data.get_champion_name(champ_id)
             
-            rarity = meta.get("rarity", "kNoRarity").replace("k", "").replace("Rarity", "")
-            if rarity == "No": rarity = "Standard"
+            rarity = meta.rarity_name if meta else "Standard"
+            is_legacy = meta.is_legacy if meta else False
             
             purchase_date = skin.get("purchaseDate", "")
             date_str = "-"
@@ -334,14 +341,13 @@ class SkinsTab(QWidget):
                 "champion": champ_name,
                 "champ_id": champ_id,
                 "rarity": rarity,
-                "is_legacy": meta.get("isLegacy", False),
-                "splash_path": meta.get("splashPath", "")
+                "is_legacy": is_legacy
             })
             
             if rarity in rarity_colors:
                 item.setForeground(2, rarity_colors[rarity])
             
-            if meta.get("isLegacy", False):
+            if is_legacy:
                 item.setText(2, f"{rarity} (Legacy)")
                 item.setForeground(2, QColor("#a1a1aa"))
             
@@ -349,22 +355,29 @@ class SkinsTab(QWidget):
             
         self.tree.addTopLevelItems(items)
         self.tree.sortItems(0, Qt.SortOrder.AscendingOrder)
+        
+        # Search by skin and champion name, or by id
+        self.search_index = SearchIndex(
+            items, lambda item: f"{item.text(0)} {item.text(1)}", lambda item: item.text(4)
+        )
+        self.apply_filters()
 
     def apply_filters(self):
         """Apply search and rarity filters."""
-        text_lower = self.search_input.text().lower()
+        query = self.search_input.text()
         rarity_filter = self.filter_combo.currentText()
         
+        # Items containing every word of the query
+        matches = None
+        if query.strip() and self.search_index is not None:
+            matches = {id(item) for item in self.search_session.search(query, page_size=None, fuzzy=False).items}
+        
         root = self.tree.invisibleRootItem()
         for i in range(root.childCount()):
             item = root.child(i)
             
             # Text match
-            text_match = (
-                text_lower in item.text(0).lower() or 
-                text_lower in item.text(1).lower() or 
-                text_lower in item.text(4)
-            )
+            text_match = matches is None or id(item) in matches
             
             # Rarity match
             item_rarity = item.text(2).split(" ")[0]  # Handle "Epic (Legacy)"
@@ -407,44 +420,59 @@ class SkinsTab(QWidget):
         
         self.preview_id.setText(f"ID: {data.get('skin_id', 0)}")
         
-        # Load splash image
+        # Load splash image, then the neighbours it is likely to move to
+        previous = self.splash_request
         self._load_splash(data.get("skin_id"), data.get("champ_id"))
-        
+        self._prefetch_neighbours(item)
+        # Dropped last, so a download still wanted as a neighbour carries on
+        if previous is not None:
+            previous.cancel()
+        
+    def _splash_width(self) -> int:
+        """Width splash art is displayed at."""
+        return self.splash_label.width() - 2
+    
     def _load_splash(self, skin_id: int, champ_id: int):
         """Load splash art for the skin."""
-        # Build splash URL - CommunityDragon format
-        # Splash path from meta looks like: /lol-game-data/assets/v1/champion-splashes/266/266000.jpg
-        # We need: https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/champion-splashes/champ_id/skin_id.jpg
-        
-        url = f"https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/champion-splashes/{champ_id}/{skin_id}.jpg"
-        
-        if url in self.splash_cache:
-            self._set_splash(self.splash_cache[url])
-            return
+        url = shared_data.get_champion_splash_url(champ_id, skin_id)
+        self.current_splash_url = url
         
         self.splash_label.setText("Loading...")
-        
-        request = QNetworkRequest(QUrl(url))
-        reply = self.network_manager.get(request)
-        reply.finished.connect(lambda: self._on_splash_loaded(reply, url))
-        
-    def _on_splash_loaded(self, reply: QNetworkReply, url: str):
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            data = reply.readAll()
-            pixmap = QPixmap()
-            pixmap.loadFromData(data)
-            if not pixmap.isNull():
-                self.splash_cache[url] = pixmap
-                self._set_splash(pixmap)
+        self.splash_request = image_loader().load(url, self._splash_width(), 0, lambda pixmap: self._on_splash_loaded(url, pixmap))
+        
+    def _prefetch_neighbours(self, item: QTreeWidgetItem):
+        """Warm the image cache with splashes of the rows around the selection.
+        
+        Requests for rows that are no longer neighbours are cancelled, so at
+        most 2 * SPLASH_PREFETCH_ROWS prefetches are ever outstanding.
+        """
+        urls = []
+        below = above = item
+        for _ in range(SPLASH_PREFETCH_ROWS):
+            # itemBelow/itemAbove skip rows hidden by the filters
+            below = self.tree.itemBelow(below) if below else None
+            above = self.tree.itemAbove(above) if above else None
+            for neighbour in (below, above):
+                data = neighbour.data(0, Qt.ItemDataRole.UserRole) if neighbour else None
+                if data:
+                    urls.append(shared_data.get_champion_splash_url(data.get("champ_id"), data.get("skin_id")))
+        
+        width = self._splash_width()
+        wanted: Dict[str, ImageRequest] = {}
+        for url in urls:
+            request = self.prefetch_requests.pop(url, None)
+            if request is None:
+                request = image_loader().load(url, width, 0, lambda pixmap: None, PRIORITY_PREFETCH)
+            wanted[url] = request
+        for request in self.prefetch_requests.values():
+            request.cancel()
+        self.prefetch_requests = wanted
+        
+    def _on_splash_loaded(self, url: str, pixmap: Optional[QPixmap]):
+        # Ignore images for a skin that is no longer selected
+        if url != self.current_splash_url:
+            return
+        if pixmap is not None:
+            self.splash_label.setPixmap(pixmap)
         else:
             self.splash_label.setText("Preview unavailable")
-        reply.deleteLater()
-        
-    def _set_splash(self, pixmap: QPixmap):
-        """Scale and set splash image."""
-        # Scale to fit the label width while maintaining aspect ratio
-        scaled = pixmap.scaledToWidth(
-            self.splash_label.width() - 2, 
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.splash_label.setPixmap(scaled)
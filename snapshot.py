@@ -0,0 +1,124 @@
+"""
+DanZ Client Tool - Game Data Snapshot
+Per-version SQLite snapshot of the projected game data indexes.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CACHE_DIR = Path(__file__).parent / "cache"
+
+# Table schemas: dataset name -> column definitions
+TABLES: Dict[str, str] = {
+    "skins": "id INTEGER PRIMARY KEY, name TEXT NOT NULL, rarity INTEGER NOT NULL, is_legacy INTEGER NOT NULL",
+    "icons": "id INTEGER PRIMARY KEY, title TEXT NOT NULL",
+    "champions": "id INTEGER PRIMARY KEY, name TEXT NOT NULL, alias TEXT NOT NULL",
+}
+
+SNAPSHOT_PREFIX = "gamedata-"
+SNAPSHOT_SUFFIX = ".sqlite"
+
+
+def _safe_version(version: str) -> str:
+    """Make a version string usable in a file name."""
+    return "".join(c if c.isalnum() or c in ".-_" else "_" for c in version)
+
+
+class GameDataSnapshot:
+    """SQLite file holding one patch's dataset tables.
+    
+    Each dataset is written in a single transaction once it has been fetched
+    and projected. Readers open the file on demand, so nothing is touched
+    until a dataset is actually needed.
+    """
+    
+    def __init__(self, version: str, directory: Optional[Path] = None):
+        directory = directory or CACHE_DIR
+        self.version = version
+        self.path = directory / f"{SNAPSHOT_PREFIX}{_safe_version(version)}{SNAPSHOT_SUFFIX}"
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def latest(cls, directory: Optional[Path] = None) -> Optional["GameDataSnapshot"]:
+        """Most recently written snapshot on disk, used when offline."""
+        directory = directory or CACHE_DIR
+        files = sorted(
+            directory.glob(f"{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}"),
+            key=lambda p: p.stat().st_mtime
+        ) if directory.exists() else []
+        if not files:
+            return None
+        version = files[-1].name[len(SNAPSHOT_PREFIX):-len(SNAPSHOT_SUFFIX)]
+        return cls(version, directory)
+    
+    def purge_others(self):
+        """Delete snapshots of every other version from the cache directory."""
+        for path in self.path.parent.glob(f"{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}"):
+            if path != self.path:
+                try:
+                    path.unlink()
+                    print(f"[Snapshot] Removed stale {path.name}")
+                except OSError as e:
+                    print(f"[Snapshot] Could not remove {path.name}: {e}")
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+    
+    def source(self, name: str) -> Optional[str]:
+        """Where a stored dataset came from ("lcu" or "cdn"), or None if not stored."""
+        if not self.path.exists():
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT source FROM datasets WHERE name = ?", (name,)
+                ).fetchone()
+                return row[0] if row else None
+        except sqlite3.Error:
+            return None
+    
+    def has(self, name: str) -> bool:
+        """Check whether a dataset table has been stored."""
+        return self.source(name) is not None
+    
+    def load(self, name: str) -> Optional[List[Tuple]]:
+        """Read all rows of a dataset, or None if it is not stored (or empty)."""
+        if not self.has(name):
+            return None
+        try:
+            with self._connect() as conn:
+                return conn.execute(f"SELECT * FROM {name} ORDER BY id").fetchall() or None
+        except sqlite3.Error as e:
+            print(f"[Snapshot] Failed to read {name}: {e}")
+            return None
+    
+    def store(self, name: str, rows: Sequence[Tuple], source: str):
+        """Replace a dataset table with the given rows."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        placeholders = ", ".join("?" * len(TABLES[name].split(",")))
+        with self._lock:
+            conn = None
+            try:
+                # Autocommit mode, so the DDL below stays inside our own
+                # transaction instead of committing on its own
+                conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute("CREATE TABLE IF NOT EXISTS datasets (name TEXT PRIMARY KEY, source TEXT NOT NULL)")
+                    conn.execute("DELETE FROM datasets WHERE name = ?", (name,))
+                    conn.execute(f"DROP TABLE IF EXISTS {name}")
+                    conn.execute(f"CREATE TABLE {name} ({TABLES[name]})")
+                    conn.executemany(f"INSERT OR REPLACE INTO {name} VALUES ({placeholders})", rows)
+                    conn.execute("INSERT INTO datasets (name, source) VALUES (?, ?)", (name, source))
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                print(f"[Snapshot] Stored {len(rows)} {name} from {source} for {self.version}")
+            except sqlite3.Error as e:
+                print(f"[Snapshot] Failed to store {name}: {e}")
+            finally:
+                if conn is not None:
+                    conn.close()
@@ -7,36 +7,152 @@ import webbrowser
 from typing import Optional, List, Dict, Any
 
 
-def levenshtein_distance(s1: str, s2: str) -> int:
+try:
+    # Optional compiled backend (pip install rapidfuzz)
+    from rapidfuzz.distance import Levenshtein as _rapid_levenshtein
+except ImportError:
+    _rapid_levenshtein = None
+
+
+def _levenshtein_python(s1: str, s2: str, max_distance: Optional[int]) -> int:
+    """Row-by-row Levenshtein, restricted to the diagonal band when bounded."""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    len1, len2 = len(s1), len(s2)
+    
+    if max_distance is None:
+        band = len1
+    else:
+        # The distance is at least the length difference
+        if len1 - len2 > max_distance:
+            return max_distance + 1
+        band = max_distance
+    
+    if len2 == 0:
+        return len1
+    
+    over = len1 + 1  # stands in for "outside the band"
+    previous_row = list(range(len2 + 1))
+    for i in range(1, len1 + 1):
+        c1 = s1[i - 1]
+        lo = max(1, i - band)
+        hi = min(len2, i + band)
+        current_row = [over] * (len2 + 1)
+        current_row[0] = i if lo == 1 else over
+        row_min = current_row[0]
+        for j in range(lo, hi + 1):
+            cost = previous_row[j - 1] + (c1 != s2[j - 1])
+            insertion = current_row[j - 1] + 1
+            deletion = previous_row[j] + 1
+            if insertion < cost:
+                cost = insertion
+            if deletion < cost:
+                cost = deletion
+            current_row[j] = cost
+            if cost < row_min:
+                row_min = cost
+        # Every later row is at least this row's minimum
+        if max_distance is not None and row_min > max_distance:
+            return max_distance + 1
+        previous_row = current_row
+    
+    distance = previous_row[len2]
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+def levenshtein_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
     """
     Calculate the Levenshtein distance between two strings.
     Used for fuzzy matching of champion/skin names.
+    
+    With max_distance set, only the band of the table that can stay within
+    it is computed and the calculation stops as soon as it is exceeded; any
+    distance above the bound is reported as max_distance + 1.
     """
-    if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+    if _rapid_levenshtein is not None:
+        return _rapid_levenshtein.distance(s1, s2, score_cutoff=max_distance)
+    return _levenshtein_python(s1, s2, max_distance)
+
+
+def _query_pieces(query: str, threshold: int) -> List[str]:
+    """
+    Split query into threshold + 1 contiguous pieces.
     
-    if len(s2) == 0:
-        return len(s1)
+    Each edit touches at most one piece, so any string within threshold
+    edits of query contains at least one piece unchanged. Returns an empty
+    list when some piece would be empty (the filter cannot rule anything out).
+    """
+    count = threshold + 1
+    if len(query) < count:
+        return []
+    size, extra = divmod(len(query), count)
+    pieces, start = [], 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        pieces.append(query[start:end])
+        start = end
+    return pieces
+
+
+def _within(query: str, value: str, threshold: int, pieces: List[str]) -> int:
+    """Distance if value is within threshold of query, else threshold + 1."""
+    if abs(len(value) - len(query)) > threshold:
+        return threshold + 1
+    if pieces and not any(piece in value for piece in pieces):
+        return threshold + 1
+    return levenshtein_distance(query, value, threshold)
+
+
+class FuzzyIndex:
+    """
+    Reusable fuzzy_search over a fixed list of items.
     
-    previous_row = range(len(s2) + 1)
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+    Lowercased keys are computed once and the distinct keys bucketed by
+    length, so a query only measures distance against keys of a compatible
+    length that pass the piece filter, instead of against every item.
+    """
+    
+    def __init__(self, items: List[Dict[str, Any]], key: str = "name"):
+        self.items = items
+        self._values = [str(item.get(key, "")).lower() for item in items]
+        self._by_value: Dict[str, List[int]] = {}
+        for position, value in enumerate(self._values):
+            self._by_value.setdefault(value, []).append(position)
+        self._by_length: Dict[int, List[str]] = {}
+        for value in self._by_value:
+            self._by_length.setdefault(len(value), []).append(value)
     
-    return previous_row[-1]
+    def search(self, query: str, threshold: int = 3) -> List[Dict[str, Any]]:
+        """Same matches and order as fuzzy_search(query, items, key, threshold)."""
+        query_lower = query.lower()
+        distances: Dict[int, int] = {}
+        for position, value in enumerate(self._values):
+            if query_lower in value:
+                distances[position] = 0
+        
+        pieces = _query_pieces(query_lower, threshold)
+        length = len(query_lower)
+        for candidate_length in range(max(0, length - threshold), length + threshold + 1):
+            for value in self._by_length.get(candidate_length, ()):
+                distance = _within(query_lower, value, threshold, pieces)
+                if distance <= threshold:
+                    for position in self._by_value[value]:
+                        distances.setdefault(position, distance)
+        
+        ranked = sorted(distances, key=lambda position: (distances[position], position))
+        return [self.items[position] for position in ranked]
 
 
 def fuzzy_search(query: str, items: List[Dict[str, Any]], key: str = "name", threshold: int = 3) -> List[Dict[str, Any]]:
     """
     Perform fuzzy search on a list of dictionaries.
     Returns items where the specified key matches the query within the threshold.
+    For repeated searches over the same items, use FuzzyIndex.
     """
     query_lower = query.lower()
+    pieces = _query_pieces(query_lower, threshold)
     results = []
     
     for item in items:
@@ -45,8 +161,9 @@ def fuzzy_search(query: str, items: List[Dict[str, Any]], key: str = "name", thr
         if query_lower in item_value:
             results.append((0, item))
         else:
-            # Levenshtein distance
-            distance = levenshtein_distance(query_lower, item_value)
+            # Length and piece filters first, then a bounded Levenshtein
+            # distance that gives up once past the threshold
+            distance = _within(query_lower, item_value, threshold, pieces)
             if distance <= threshold:
                 results.append((distance, item))
     